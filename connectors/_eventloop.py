@@ -0,0 +1,37 @@
+# OmniFlow/connectors/_eventloop.py
+"""
+OmniFlow — event loop helpers shared by the async connectors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+__all__ = ["use_uvloop"]
+
+_uvloop_installed = False
+
+
+def use_uvloop() -> bool:
+    """
+    Install uvloop's event loop policy once per process if uvloop is
+    available; returns whether it is in effect. Only loops created
+    afterwards (e.g. by `asyncio.run`) use it, so this is a no-op when
+    called from inside a running loop.
+    """
+    global _uvloop_installed
+    if _uvloop_installed:
+        return True
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        return False
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _uvloop_installed = True
+    return True
@@ -4,10 +4,10 @@ OmniFlow — HTTP connector
 ==========================
 
 Production-ready, dependency-light HTTP connector used throughout OmniFlow for
-talking to REST/JSON services. Provides both synchronous (requests) and
-asynchronous (aiohttp) clients with sensible defaults: timeouts, retries with
-exponential backoff + jitter, optional auth header helpers, streaming helpers,
-file upload/download, and simple pagination helpers.
+talking to REST/JSON services. Provides both synchronous (requests, or httpx
+for HTTP/2) and asynchronous (aiohttp) clients with sensible defaults:
+timeouts, retries with exponential backoff + jitter, optional auth header
+helpers, streaming helpers, file upload/download, and simple pagination helpers.
 
 Design goals
 - Small surface area and clear exceptions for callers
@@ -19,13 +19,16 @@ Design goals
 Notes
 - This module intentionally avoids hard-coding vendor-specific auth schemes.
   Pass `auth_token` and `auth_header` or custom headers as needed.
-- `requests` and `aiohttp` are optional. If missing, the corresponding client
+- `requests`, `httpx` and `aiohttp` are optional. If missing, the corresponding client
   will raise an informative error at runtime.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import itertools
 import json
 import logging
 import math
@@ -56,6 +59,32 @@ except Exception:  # pragma: no cover - optional import
     RequestsSession = None
     RequestException = Exception  # fallback type
 
+try:
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover - optional import
+    httpx = None
+
+try:
+    import h2  # type: ignore  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover - optional import
+    _HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # type: ignore  # noqa: F401 - lets the transports decode `br`
+    _BROTLI_AVAILABLE = True
+except Exception:  # pragma: no cover - optional import
+    try:
+        import brotlicffi  # type: ignore  # noqa: F401
+        _BROTLI_AVAILABLE = True
+    except Exception:
+        _BROTLI_AVAILABLE = False
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder  # type: ignore
+except Exception:  # pragma: no cover - optional import
+    MultipartEncoder = None
+
 try:
     import aiohttp  # type: ignore
 except Exception:  # pragma: no cover - optional import
@@ -64,6 +93,15 @@ except Exception:  # pragma: no cover - optional import
 logger = logging.getLogger("omniflow.connectors.http")
 logger.addHandler(logging.NullHandler())
 
+# Monotonic integer clock for latency: immune to wall-clock adjustments.
+_monotonic_ns = time.monotonic_ns
+
+# Transport-level failures that warrant a retry, whichever sync transport is active.
+_TRANSPORT_ERRORS: Tuple[type, ...] = (RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# Ask servers for compressed bodies; only advertise brotli when it can be decoded.
+_ACCEPT_ENCODING = "br, gzip, deflate" if _BROTLI_AVAILABLE else "gzip, deflate"
+
 __all__ = [
     "HttpError",
     "HttpRequestError",
@@ -95,7 +133,7 @@ class HttpRateLimitError(HttpError):
 
 
 # ---- Config dataclass ----
-@dataclass
+@dataclass(slots=True)
 class HttpConnectorConfig:
     """
     HTTP connector configuration.
@@ -111,6 +149,9 @@ class HttpConnectorConfig:
     - verify_ssl: whether to verify TLS certs (default: True).
     - proxies: optional dict of proxies to pass to requests; aiohttp will use env by default.
     - metrics_hook: optional callable(event: str, payload: dict) for telemetry.
+    - transport: sync client backend, "requests" (default) or "httpx". httpx
+      multiplexes requests over HTTP/2 when the `h2` package is installed.
+    - pool_size: max pooled connections for the httpx transport.
     """
 
     base_url: Optional[str] = None
@@ -124,6 +165,8 @@ class HttpConnectorConfig:
     verify_ssl: bool = True
     proxies: Optional[Dict[str, str]] = None
     metrics_hook: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    transport: str = "requests"
+    pool_size: int = 10
 
     @staticmethod
     def from_env(prefix: str = "HTTP") -> "HttpConnectorConfig":
@@ -143,6 +186,8 @@ class HttpConnectorConfig:
                 proxies = json.loads(proxies_raw)
             except Exception:
                 proxies = None
+        transport = (os.getenv(f"{prefix}_TRANSPORT") or os.getenv("HTTP_TRANSPORT") or "requests").lower()
+        pool_size = int(os.getenv(f"{prefix}_POOL_SIZE", os.getenv("HTTP_POOL_SIZE", "10")))
         headers_raw = os.getenv(f"{prefix}_HEADERS")
         headers = None
         if headers_raw:
@@ -161,17 +206,32 @@ class HttpConnectorConfig:
             auth_header=auth_header,
             verify_ssl=verify_ssl,
             proxies=proxies,
+            transport=transport,
+            pool_size=pool_size,
         )
 
 
 # ---- Utilities ----
+# Backoff jitter only needs to spread retries apart, not be unpredictable, so a
+# ring of precomputed values in [-1, 1) replaces a random.random() call per retry.
+# itertools.count() is atomic under the GIL, so the index is safe across threads.
+_JITTER_RING_SIZE = 4096
+_JITTER_RING: Tuple[float, ...] = tuple(random.random() * 2 - 1 for _ in range(_JITTER_RING_SIZE))
+_JITTER_IDX = itertools.count()
+
+# Powers of two for the exponential term; attempts past the table are clamped
+# and the result is capped at _MAX_BACKOFF so pathological configs can't overflow.
+_POW2_FLOAT: Tuple[float, ...] = tuple(float(1 << i) for i in range(32))
+_MAX_BACKOFF = 300.0
+
+
 def _compute_backoff(attempt: int, factor: float = 0.6, jitter: float = 0.2) -> float:
     """
     Exponential backoff with jitter.
     attempt is 0-based attempt index.
     """
-    base = factor * (2 ** attempt)
-    jitter_amt = base * jitter * (random.random() * 2 - 1)
+    base = min(factor * _POW2_FLOAT[min(attempt, 31)], _MAX_BACKOFF)
+    jitter_amt = base * jitter * _JITTER_RING[next(_JITTER_IDX) & (_JITTER_RING_SIZE - 1)]
     return max(0.0, base + jitter_amt)
 
 
@@ -187,10 +247,31 @@ def _join_url(base: Optional[str], path: str) -> str:
     return base.rstrip("/") + "/" + path.lstrip("/")
 
 
+def _base_prefix(base: Optional[str]) -> Optional[str]:
+    """Normalize base_url once so per-request joins are a single concat."""
+    return base.rstrip("/") + "/" if base else None
+
+
+def _join_url_fast(prefix: Optional[str], path: str) -> str:
+    if not prefix or path.startswith(("http://", "https://")):
+        return path
+    return prefix + path.lstrip("/")
+
+
+def _make_url_joiner(base: Optional[str]) -> Callable[[str], str]:
+    """
+    Per-client cached join. base_url is fixed for a client's lifetime, so the
+    cache only needs to be keyed on path and never has to be invalidated.
+    """
+    prefix = _base_prefix(base)
+    return functools.lru_cache(maxsize=512)(functools.partial(_join_url_fast, prefix))
+
+
 # ---- Sync HTTP client (requests) ----
 class HttpClient:
     """
-    Synchronous HTTP client using `requests` Session.
+    Synchronous HTTP client using a `requests` Session, or an `httpx.Client`
+    when `config.transport == "httpx"`.
 
     Example:
         cfg = HttpConnectorConfig.from_env()
@@ -199,22 +280,59 @@ class HttpClient:
         print(resp.status_code, resp.json())
     """
 
+    __slots__ = ("cfg", "metrics", "_emit_metrics", "_verify", "_httpx", "session", "_join")
+
     def __init__(self, config: HttpConnectorConfig):
         self.cfg = config
         self.metrics = config.metrics_hook or _default_metrics_hook
-        if RequestsSession is None:
-            raise RuntimeError("`requests` package is required for HttpClient but not installed.")
-        self.session: RequestsSession = requests.Session()
-        # Apply default headers
+        # Skip building payloads when nobody consumes them: no hook set and the
+        # default hook's debug log is disabled (checked once, at construction).
+        self._emit_metrics = config.metrics_hook is not None or logger.isEnabledFor(logging.DEBUG)
+        # Allow SSL verification toggle
+        self._verify = bool(config.verify_ssl)
+        self._httpx = config.transport == "httpx"
+        if self._httpx:
+            self.session: Any = self._build_httpx_client(config)
+        else:
+            if RequestsSession is None:
+                raise RuntimeError("`requests` package is required for HttpClient but not installed.")
+            self.session = requests.Session()
+            # Respect proxies if provided; else rely on requests env vars
+            if config.proxies:
+                self.session.proxies.update(config.proxies)
+        # Apply default headers; explicit config headers win over the compression default
+        self.session.headers["Accept-Encoding"] = _ACCEPT_ENCODING
         if config.headers:
             self.session.headers.update(config.headers)
         if config.auth_token:
             self.session.headers.setdefault(config.auth_header, f"Bearer {config.auth_token}")
-        # Respect proxies if provided; else rely on requests env vars
+        self._join = _make_url_joiner(config.base_url)
+
+    def _build_httpx_client(self, config: HttpConnectorConfig) -> Any:
+        if httpx is None:
+            raise RuntimeError("`httpx` package is required for transport='httpx' but not installed.")
+        mounts = None
         if config.proxies:
-            self.session.proxies.update(config.proxies)
-        # Allow SSL verification toggle
-        self._verify = bool(config.verify_ssl)
+            # requests-style {"https": url} -> httpx mount patterns {"https://": transport}
+            mounts = {
+                f"{scheme.rstrip(':/')}://": httpx.HTTPTransport(proxy=url, http2=_HTTP2_AVAILABLE, verify=self._verify)
+                for scheme, url in config.proxies.items()
+            }
+        return httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=config.pool_size, max_keepalive_connections=config.pool_size),
+            timeout=config.timeout,
+            verify=self._verify,
+            mounts=mounts,
+        )
+
+    def _send(self, method: str, url: str, *, stream: bool = False, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Dispatch one request on the configured transport."""
+        timeout = timeout or self.cfg.timeout
+        if self._httpx:
+            req = self.session.build_request(method, url, timeout=timeout, **kwargs)
+            return self.session.send(req, stream=stream)
+        return self.session.request(method, url, timeout=timeout, stream=stream, verify=self._verify, **kwargs)
 
     def _request(
         self,
@@ -227,7 +345,7 @@ class HttpClient:
         stream: bool = False,
         timeout: Optional[float] = None,
     ) -> requests.Response:
-        url = _join_url(self.cfg.base_url, path)
+        url = self._join(path)
         hdrs = {}
         if headers:
             hdrs.update(headers)
@@ -236,37 +354,39 @@ class HttpClient:
 
         while attempt <= self.cfg.max_retries:
             attempt += 1
-            start = time.time()
+            start = _monotonic_ns()
             try:
-                resp = self.session.request(
+                resp = self._send(
                     method,
                     url,
                     params=params,
                     json=json_body,
                     data=data,
                     headers=hdrs or None,
-                    timeout=timeout or self.cfg.timeout,
+                    timeout=timeout,
                     stream=stream,
-                    verify=self._verify,
                 )
-            except RequestException as exc:
+            except _TRANSPORT_ERRORS as exc:
                 last_exc = exc
                 wait = _compute_backoff(attempt - 1, self.cfg.backoff_factor, self.cfg.jitter)
                 logger.warning("HttpClient request exception (attempt %d/%d): %s — retrying after %.2fs", attempt, self.cfg.max_retries + 1, exc, wait)
-                self.metrics("request_exception", {"attempt": attempt, "error": str(exc)})
+                if self._emit_metrics:
+                    self.metrics("request_exception", {"attempt": attempt, "error": str(exc)})
                 if attempt > self.cfg.max_retries:
                     break
                 time.sleep(wait)
                 continue
 
-            latency = time.time() - start
-            self.metrics("request_completed", {"method": method, "path": path, "status": resp.status_code, "latency": latency})
+            latency = (_monotonic_ns() - start) / 1e9
+            if self._emit_metrics:
+                self.metrics("request_completed", {"method": method, "path": path, "status": resp.status_code, "latency": latency})
             # Rate limit handling
             if resp.status_code in (401, 403):
                 raise HttpAuthError(f"authentication failed: {resp.status_code}")
             if resp.status_code == 429:
                 retry_after = resp.headers.get("Retry-After")
-                self.metrics("rate_limited", {"status": 429, "attempt": attempt})
+                if self._emit_metrics:
+                    self.metrics("rate_limited", {"status": 429, "attempt": attempt})
                 if retry_after:
                     try:
                         wait = float(retry_after)
@@ -322,28 +442,34 @@ class HttpClient:
         """
         resp = self._request("GET", path, stream=True)
         tmp = dest_path + ".tmp"
-        with open(tmp, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
+        chunks = resp.iter_bytes(chunk_size) if self._httpx else resp.iter_content(chunk_size=chunk_size)
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in chunks:
+                    if chunk:
+                        f.write(chunk)
+        finally:
+            resp.close()
         os.replace(tmp, dest_path)
 
     def upload_file(self, path: str, file_field: str, file_path: str, extra_fields: Optional[Dict[str, Any]] = None) -> Any:
         """
         Upload a file using multipart/form-data. Returns parsed JSON or raw text.
         """
-        if requests is None:
+        if requests is None and not self._httpx:
             raise RuntimeError("requests required for upload_file")
-        url = _join_url(self.cfg.base_url, path)
-        files = {file_field: open(file_path, "rb")}
+        url = self._join(path)
         data = extra_fields or {}
         attempt = 0
         last_exc = None
         while attempt <= self.cfg.max_retries:
             attempt += 1
             try:
-                resp = self.session.post(url, files=files, data=data, timeout=self.cfg.timeout, verify=self._verify)
-            except RequestException as exc:
+                # Re-open on every attempt so retries send the full body rather
+                # than an exhausted handle, and the fd is released on failure.
+                with open(file_path, "rb") as fh:
+                    resp = self._post_file(url, file_field, file_path, fh, data)
+            except _TRANSPORT_ERRORS as exc:
                 last_exc = exc
                 wait = _compute_backoff(attempt - 1, self.cfg.backoff_factor, self.cfg.jitter)
                 if attempt > self.cfg.max_retries:
@@ -370,24 +496,50 @@ class HttpClient:
             raise HttpRequestError(f"upload failed: {resp.status_code} {resp.text}")
         raise HttpRequestError(f"upload failed after retries: {last_exc!s}")
 
-    def paginate(self, path: str, params: Optional[Dict[str, Any]] = None, page_key: str = "page", per_page_key: str = "per_page", per_page: int = 100) -> Generator[Any, None, None]:
+    def _post_file(self, url: str, file_field: str, file_path: str, fh: Any, data: Mapping[str, Any]) -> requests.Response:
+        """
+        POST a single file as multipart/form-data. Streams the body with
+        requests-toolbelt's MultipartEncoder when installed so large uploads
+        are not buffered in memory; otherwise falls back to `files=` (which
+        httpx already streams).
+        """
+        if MultipartEncoder is not None and not self._httpx:
+            fields: Dict[str, Any] = {k: str(v) for k, v in data.items()}
+            fields[file_field] = (os.path.basename(file_path), fh)
+            encoder = MultipartEncoder(fields=fields)
+            return self._send("POST", url, data=encoder, headers={"Content-Type": encoder.content_type})
+        return self._send("POST", url, files={file_field: fh}, data=data)
+
+    def paginate_pages(self, path: str, params: Optional[Dict[str, Any]] = None, page_key: str = "page", per_page_key: str = "per_page", per_page: int = 100) -> Generator[List[Any], None, None]:
         """
         Simple pager for APIs using numeric page/per_page params and returning JSON arrays.
-        Yields items one by one.
+        Yields each page as a list so callers can batch-process items (e.g. build one
+        DataFrame per page) instead of handling them one by one.
         """
+        # Build the query once; only the page number changes between requests
+        # and the transports copy params when encoding, so mutating is safe.
+        p = dict(params or {})
+        p[per_page_key] = per_page
         page = 1
         while True:
-            p = dict(params or {})
             p[page_key] = page
-            p[per_page_key] = per_page
             resp = self.json("GET", path, params=p)
             items = resp if isinstance(resp, list) else resp.get("items") if isinstance(resp, dict) else []
             if not items:
                 break
-            for it in items:
-                yield it
+            yield items
             page += 1
 
+    def paginate(self, path: str, params: Optional[Dict[str, Any]] = None, page_key: str = "page", per_page_key: str = "per_page", per_page: int = 100) -> Generator[Any, None, None]:
+        """
+        Item-level wrapper around `paginate_pages`. Yields items one by one.
+        """
+        for items in self.paginate_pages(path, params=params, page_key=page_key, per_page_key=per_page_key, per_page=per_page):
+            yield from items
+
+    def close(self) -> None:
+        self.session.close()
+
 
 # ---- Async HTTP client (aiohttp) ----
 class AsyncHttpClient:
@@ -400,17 +552,23 @@ class AsyncHttpClient:
         resp = await client.json("GET", "/health")
     """
 
+    __slots__ = ("cfg", "metrics", "_emit_metrics", "_session", "_join")
+
     def __init__(self, config: HttpConnectorConfig):
         self.cfg = config
         self.metrics = config.metrics_hook or _default_metrics_hook
+        # Same gating as HttpClient: skip payload construction when unused.
+        self._emit_metrics = config.metrics_hook is not None or logger.isEnabledFor(logging.DEBUG)
         if aiohttp is None:
             raise RuntimeError("`aiohttp` package is required for AsyncHttpClient but not installed.")
         # aiohttp session: use default connector that honors env proxies by default
         trace_configs = []  # placeholder for tracing if desired
-        headers = config.headers or {}
+        headers = {"Accept-Encoding": _ACCEPT_ENCODING}
+        headers.update(config.headers or {})
         if config.auth_token:
             headers.setdefault(config.auth_header, f"Bearer {config.auth_token}")
         self._session = aiohttp.ClientSession(headers=headers)
+        self._join = _make_url_joiner(config.base_url)
 
     async def _request(
         self,
@@ -421,55 +579,66 @@ class AsyncHttpClient:
         data: Optional[Any] = None,
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[float] = None,
+        data_factory: Optional[Callable[[contextlib.ExitStack], Any]] = None,
     ) -> Tuple[int, Mapping[str, str], Any]:
-        url = _join_url(self.cfg.base_url, path)
+        """
+        ``data_factory``, when given, builds the request body afresh for each
+        attempt; files it opens should be registered on the ExitStack it is
+        passed, which closes them when that attempt ends.
+        """
+        url = self._join(path)
         attempt = 0
         last_exc: Optional[Exception] = None
         timeout_val = aiohttp.ClientTimeout(total=(timeout or self.cfg.timeout))
 
         while attempt <= self.cfg.max_retries:
             attempt += 1
-            start = time.time()
-            try:
-                async with self._session.request(method, url, params=params, json=json_body, data=data, headers=headers, timeout=timeout_val, ssl=self.cfg.verify_ssl) as resp:
-                    status = resp.status
-                    text = await resp.text()
-                    latency = time.time() - start
-                    self.metrics("request_completed", {"method": method, "path": path, "status": status, "latency": latency})
-                    if status in (401, 403):
-                        raise HttpAuthError(f"authentication failed: {status}")
-                    if status == 429:
-                        retry_after = resp.headers.get("Retry-After")
-                        self.metrics("rate_limited", {"status": 429, "attempt": attempt})
-                        if retry_after:
-                            try:
-                                await asyncio.sleep(float(retry_after))
-                            except Exception:
-                                pass
-                        if attempt > self.cfg.max_retries:
-                            raise HttpRateLimitError("rate limited")
-                        await asyncio.sleep(_compute_backoff(attempt - 1, self.cfg.backoff_factor, self.cfg.jitter))
-                        continue
-                    if 500 <= status < 600:
-                        if attempt > self.cfg.max_retries:
-                            raise HttpRequestError(f"server error: {status}")
-                        await asyncio.sleep(_compute_backoff(attempt - 1, self.cfg.backoff_factor, self.cfg.jitter))
-                        continue
-                    # Try to parse JSON, fallback to text
-                    try:
-                        body = json.loads(text) if text else None
-                    except Exception:
-                        body = text
-                    return status, dict(resp.headers), body
-            except Exception as exc:
-                last_exc = exc
-                wait = _compute_backoff(attempt - 1, self.cfg.backoff_factor, self.cfg.jitter)
-                self.metrics("request_exception", {"attempt": attempt, "error": str(exc)})
-                logger.warning("AsyncHttpClient request exception (attempt %d/%d): %s — retrying after %.2fs", attempt, self.cfg.max_retries + 1, exc, wait)
-                if attempt > self.cfg.max_retries:
-                    break
-                await asyncio.sleep(wait)
-                continue
+            start = _monotonic_ns()
+            with contextlib.ExitStack() as files:
+                body_data = data if data_factory is None else data_factory(files)
+                try:
+                    async with self._session.request(method, url, params=params, json=json_body, data=body_data, headers=headers, timeout=timeout_val, ssl=self.cfg.verify_ssl) as resp:
+                        status = resp.status
+                        text = await resp.text()
+                        latency = (_monotonic_ns() - start) / 1e9
+                        if self._emit_metrics:
+                            self.metrics("request_completed", {"method": method, "path": path, "status": status, "latency": latency})
+                        if status in (401, 403):
+                            raise HttpAuthError(f"authentication failed: {status}")
+                        if status == 429:
+                            retry_after = resp.headers.get("Retry-After")
+                            if self._emit_metrics:
+                                self.metrics("rate_limited", {"status": 429, "attempt": attempt})
+                            if retry_after:
+                                try:
+                                    await asyncio.sleep(float(retry_after))
+                                except Exception:
+                                    pass
+                            if attempt > self.cfg.max_retries:
+                                raise HttpRateLimitError("rate limited")
+                            await asyncio.sleep(_compute_backoff(attempt - 1, self.cfg.backoff_factor, self.cfg.jitter))
+                            continue
+                        if 500 <= status < 600:
+                            if attempt > self.cfg.max_retries:
+                                raise HttpRequestError(f"server error: {status}")
+                            await asyncio.sleep(_compute_backoff(attempt - 1, self.cfg.backoff_factor, self.cfg.jitter))
+                            continue
+                        # Try to parse JSON, fallback to text
+                        try:
+                            body = json.loads(text) if text else None
+                        except Exception:
+                            body = text
+                        return status, dict(resp.headers), body
+                except Exception as exc:
+                    last_exc = exc
+                    wait = _compute_backoff(attempt - 1, self.cfg.backoff_factor, self.cfg.jitter)
+                    if self._emit_metrics:
+                        self.metrics("request_exception", {"attempt": attempt, "error": str(exc)})
+                    logger.warning("AsyncHttpClient request exception (attempt %d/%d): %s — retrying after %.2fs", attempt, self.cfg.max_retries + 1, exc, wait)
+                    if attempt > self.cfg.max_retries:
+                        break
+                    await asyncio.sleep(wait)
+                    continue
 
         raise HttpRequestError(f"async request failed after {self.cfg.max_retries} retries: {last_exc!s}")
 
@@ -494,7 +663,7 @@ class AsyncHttpClient:
         """
         Stream download into file asynchronously. Writes to a temp file and atomically replaces.
         """
-        url = _join_url(self.cfg.base_url, path)
+        url = self._join(path)
         tmp = dest_path + ".tmp"
         timeout = aiohttp.ClientTimeout(total=self.cfg.timeout)
         async with aiohttp.ClientSession(headers=self.cfg.headers) as session:
@@ -511,30 +680,78 @@ class AsyncHttpClient:
         """
         Upload file via multipart/form-data asynchronously.
         """
-        url = _join_url(self.cfg.base_url, path)
-        data = aiohttp.FormData()
-        for k, v in (extra_fields or {}).items():
-            data.add_field(k, str(v))
-        data.add_field(file_field, open(file_path, "rb"))
-        status, headers, body = await self._request("POST", path, data=data)
+        fields = [(k, str(v)) for k, v in (extra_fields or {}).items()]
+
+        def form(files: contextlib.ExitStack) -> Any:
+            # A FormData can only be sent once and the handle ends at EOF, so
+            # each attempt gets a fresh form over a freshly opened file.
+            data = aiohttp.FormData()
+            for k, v in fields:
+                data.add_field(k, v)
+            data.add_field(file_field, files.enter_context(open(file_path, "rb")))
+            return data
+
+        status, headers, body = await self._request("POST", path, data_factory=form)
         return body
 
-    async def paginate(self, path: str, params: Optional[Dict[str, Any]] = None, page_key: str = "page", per_page_key: str = "per_page", per_page: int = 100) -> AsyncIterator[Any]:
+    async def paginate_pages(self, path: str, params: Optional[Dict[str, Any]] = None, page_key: str = "page", per_page_key: str = "per_page", per_page: int = 100, prefetch: bool = False) -> AsyncIterator[List[Any]]:
         """
-        Async pager for page/per_page style APIs. Yields items.
+        Async pager for page/per_page style APIs. Yields each page as a list, so
+        consumers pay one await per page and can loop over items synchronously:
+
+            async for page in client.paginate_pages("/items"):
+                for it in page:
+                    process(it)
+
+        With prefetch=True the next page is requested while the caller is still
+        processing the current one; this costs one extra request past the last page.
         """
+        base = dict(params or {})
+        base[per_page_key] = per_page
+
+        async def fetch(page: int) -> List[Any]:
+            # Sequential fetches reuse one params dict; overlapping (prefetched)
+            # requests each need their own copy.
+            if prefetch:
+                q = {**base, page_key: page}
+            else:
+                base[page_key] = page
+                q = base
+            _, _, body = await self._request("GET", path, params=q)
+            return body if isinstance(body, list) else (body.get("items") if isinstance(body, dict) else []) or []
+
+        if not prefetch:
+            page = 1
+            while True:
+                items = await fetch(page)
+                if not items:
+                    break
+                yield items
+                page += 1
+            return
+
         page = 1
-        while True:
-            p = dict(params or {})
-            p[page_key] = page
-            p[per_page_key] = per_page
-            _, _, body = await self._request("GET", path, params=p)
-            items = body if isinstance(body, list) else (body.get("items") if isinstance(body, dict) else [])
-            if not items:
-                break
+        pending = asyncio.ensure_future(fetch(page))
+        try:
+            while True:
+                items = await pending
+                if not items:
+                    break
+                page += 1
+                pending = asyncio.ensure_future(fetch(page))
+                yield items
+        finally:
+            if not pending.done():
+                pending.cancel()
+
+    async def paginate(self, path: str, params: Optional[Dict[str, Any]] = None, page_key: str = "page", per_page_key: str = "per_page", per_page: int = 100) -> AsyncIterator[Any]:
+        """
+        Item-level wrapper around `paginate_pages`. Yields items one at a time;
+        prefer `paginate_pages` for large result sets.
+        """
+        async for items in self.paginate_pages(path, params=params, page_key=page_key, per_page_key=per_page_key, per_page=per_page):
             for it in items:
                 yield it
-            page += 1
 
     async def close(self) -> None:
         await self._session.close()
@@ -12,7 +12,7 @@ Features
 - Asynchronous Producer/Consumer using `aiokafka` when available.
 - Environment-driven configuration and sensible defaults.
 - Safe defaults: timeouts, retries with exponential backoff, idempotent producer support (where available).
-- Simple message serialization helpers (JSON) and optional key/value codecs hook.
+- Simple message serialization helpers (JSON, via `orjson` when installed) and optional key/value codecs hook.
 - Graceful shutdown helpers and context managers for resource safety.
 - Structured logging and optional metrics hook.
 - Clear exceptions hierarchy for caller logic.
@@ -24,19 +24,27 @@ Notes
   the corresponding optional dependency installed.
 - For high-throughput production deployments prefer `confluent_kafka` for sync usage
   and `aiokafka` for asyncio usage.
+- The per-message paths (serialization, header preparation, produce/send, delivery
+  callbacks, backoff) are fully annotated and avoid dynamic constructs, so the
+  module can be compiled ahead of time with `mypyc connectors/kafka_connector.py`
+  to cut interpreter overhead; the pure-Python module is the fallback.
 """
 
 from __future__ import annotations
 
 import asyncio
+import collections
+import functools
 import json
 import logging
 import math
 import os
 import random
+import threading
 import time
+import zlib
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 # Optional imports for sync and async Kafka clients
 try:
@@ -44,7 +52,7 @@ try:
     from confluent_kafka import Producer as ConfluentProducer  # type: ignore
     from confluent_kafka import Consumer as ConfluentConsumer  # type: ignore
     from confluent_kafka import KafkaException as ConfluentKafkaException  # type: ignore
-except Exception:
+except ImportError:
     confluent_kafka = None
     ConfluentProducer = None  # type: ignore
     ConfluentConsumer = None  # type: ignore
@@ -54,23 +62,46 @@ try:
     import aiokafka  # type: ignore
     from aiokafka import AIOKafkaProducer, AIOKafkaConsumer  # type: ignore
     from aiokafka.errors import KafkaError as AiokafkaError  # type: ignore
-except Exception:
+except ImportError:
     aiokafka = None
     AIOKafkaProducer = None  # type: ignore
     AIOKafkaConsumer = None  # type: ignore
     AiokafkaError = Exception  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional import
+    orjson = None  # type: ignore
+
+try:
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover - optional import
+    msgspec = None  # type: ignore
+
+# Capability flags, resolved once at import. Only ImportError means "not
+# installed"; any other import failure (a broken install) propagates.
+_HAVE_CONFLUENT = confluent_kafka is not None
+_HAVE_AIOKAFKA = aiokafka is not None
+
+try:
+    from connectors._eventloop import use_uvloop  # type: ignore
+except ImportError:  # pragma: no cover - loaded as a top-level module
+    from _eventloop import use_uvloop  # type: ignore
+
 logger = logging.getLogger("omniflow.connectors.kafka")
 logger.addHandler(logging.NullHandler())
 
 __all__ = [
     "KafkaError",
     "KafkaConfig",
+    "Record",
     "default_kafka_config_from_env",
+    "prepare_headers",
     "SyncKafkaProducer",
     "SyncKafkaConsumer",
     "AsyncKafkaProducer",
     "AsyncKafkaConsumer",
+    "use_uvloop",
 ]
 
 
@@ -79,6 +110,19 @@ class KafkaError(Exception):
     """Base class for Kafka connector errors."""
 
 
+# ---- Consumed message ----
+class Record(NamedTuple):
+    """A consumed, deserialized message. `raw` is the client library's message object."""
+
+    key: Any
+    value: Any
+    topic: str
+    partition: int
+    offset: int
+    timestamp: Any
+    raw: Any
+
+
 # ---- Config dataclass ----
 @dataclass
 class KafkaConfig:
@@ -86,15 +130,21 @@ class KafkaConfig:
     Kafka connector configuration.
 
     Fields:
-      - bootstrap_servers: comma-separated "host:port" list or list[str]
+      - bootstrap_servers: comma-separated "host:port" list or list[str] (normalized to the string form)
       - security_protocol: protocol (PLAINTEXT, SSL, SASL_PLAINTEXT, SASL_SSL)
       - sasl_mechanism, sasl_plain_username, sasl_plain_password: for SASL auth when used
       - client_id: optional client identifier
       - acks: producer acks (all, 1, 0)
       - retries: number of attempts for transient send errors
       - retry_backoff: base backoff seconds between retries
+      - retry_backoff_max: upper bound in seconds for a single retry backoff
       - request_timeout: request timeout in seconds
       - max_request_size: optional max request size in bytes (client-level)
+      - linger_ms: how long producers wait to fill a batch before sending
+      - batch_size: max size in bytes of a single async producer batch
+      - batch_num_messages: max messages per librdkafka batch (sync producer)
+      - queue_buffering_max_kbytes: librdkafka local queue size in KiB (sync producer)
+      - compression_type: producer compression codec (none, gzip, snappy, lz4, zstd)
       - metrics_hook: optional callable(event: str, payload: dict) for telemetry
     """
 
@@ -107,15 +157,58 @@ class KafkaConfig:
     acks: Union[str, int] = "all"
     retries: int = 3
     retry_backoff: float = 0.5
+    retry_backoff_max: float = 30.0
     request_timeout: float = 30.0
     max_request_size: Optional[int] = None
+    linger_ms: int = 20
+    batch_size: int = 65536
+    batch_num_messages: int = 10000
+    queue_buffering_max_kbytes: int = 1048576
+    compression_type: Optional[str] = "lz4"
     metrics_hook: Optional[Callable[[str, Dict[str, Any]], None]] = None
     # Additional config passthrough for confluent_kafka/aiokafka clients
     extra: Dict[str, Any] = field(default_factory=dict)
+    # librdkafka settings shared by every sync client built from this config, and
+    # the full sync producer config; derived once in __post_init__ (treat the
+    # config as immutable afterwards).
+    _librdkafka_common: Dict[str, Any] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _producer_base_conf: Dict[str, Any] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.bootstrap_servers, str):
+            self.bootstrap_servers = ",".join(self.bootstrap_servers)
+        common: Dict[str, Any] = {"bootstrap.servers": self.bootstrap_servers}
+        if self.security_protocol:
+            common["security.protocol"] = self.security_protocol
+        if self.sasl_mechanism:
+            common["sasl.mechanisms"] = self.sasl_mechanism
+        if self.sasl_plain_username:
+            common["sasl.username"] = self.sasl_plain_username
+        if self.sasl_plain_password:
+            common["sasl.password"] = self.sasl_plain_password
+        self._librdkafka_common = common
+        producer_conf = {
+            **common,
+            "client.id": self.client_id or "omniflow-sync-producer",
+            "enable.idempotence": True,  # safer delivery semantics if broker supports it
+            "acks": str(self.acks),
+            "message.send.max.retries": self.retries,
+            "retry.backoff.ms": int(self.retry_backoff * 1000),
+            "request.timeout.ms": int(self.request_timeout * 1000),
+            # Throughput tuning: let librdkafka accumulate and compress batches
+            "linger.ms": self.linger_ms,
+            "batch.num.messages": self.batch_num_messages,
+            "queue.buffering.max.kbytes": self.queue_buffering_max_kbytes,
+            "compression.type": self.compression_type or "none",
+        }
+        if self.max_request_size:
+            producer_conf["message.max.bytes"] = self.max_request_size
+        producer_conf.update(self.extra or {})
+        self._producer_base_conf = producer_conf
 
     @staticmethod
     def from_env(prefix: str = "KAFKA") -> "KafkaConfig":
-        bs = os.getenv(f"{prefix}_BOOTSTRAP_SERVERS") or os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
+        bs: str = os.getenv(f"{prefix}_BOOTSTRAP_SERVERS") or os.getenv("KAFKA_BOOTSTRAP_SERVERS") or "localhost:9092"
         # Accept JSON array or comma-separated
         if bs.startswith("[") or bs.startswith('"'):
             try:
@@ -136,29 +229,178 @@ class KafkaConfig:
             acks=os.getenv(f"{prefix}_ACKS", os.getenv("KAFKA_ACKS", "all")),
             retries=int(os.getenv(f"{prefix}_RETRIES", os.getenv("KAFKA_RETRIES", "3"))),
             retry_backoff=float(os.getenv(f"{prefix}_RETRY_BACKOFF", os.getenv("KAFKA_RETRY_BACKOFF", "0.5"))),
+            retry_backoff_max=float(os.getenv(f"{prefix}_RETRY_BACKOFF_MAX", os.getenv("KAFKA_RETRY_BACKOFF_MAX", "30.0"))),
             request_timeout=float(os.getenv(f"{prefix}_REQUEST_TIMEOUT", os.getenv("KAFKA_REQUEST_TIMEOUT", "30.0"))),
             max_request_size=int(os.getenv(f"{prefix}_MAX_REQUEST_SIZE", os.getenv("KAFKA_MAX_REQUEST_SIZE", "0"))) or None,
+            linger_ms=int(os.getenv(f"{prefix}_LINGER_MS", os.getenv("KAFKA_LINGER_MS", "20"))),
+            batch_size=int(os.getenv(f"{prefix}_BATCH_SIZE", os.getenv("KAFKA_BATCH_SIZE", "65536"))),
+            batch_num_messages=int(os.getenv(f"{prefix}_BATCH_NUM_MESSAGES", os.getenv("KAFKA_BATCH_NUM_MESSAGES", "10000"))),
+            queue_buffering_max_kbytes=int(os.getenv(f"{prefix}_QUEUE_BUFFERING_MAX_KBYTES", os.getenv("KAFKA_QUEUE_BUFFERING_MAX_KBYTES", "1048576"))),
+            compression_type=(os.getenv(f"{prefix}_COMPRESSION_TYPE") or os.getenv("KAFKA_COMPRESSION_TYPE", "lz4") or "").lower() or None,
             metrics_hook=None,
         )
         return cfg
 
 
+@functools.lru_cache(maxsize=8)
 def default_kafka_config_from_env(prefix: str = "KAFKA") -> KafkaConfig:
+    """
+    Memoized `KafkaConfig.from_env`: the environment is parsed once per prefix
+    per process. The returned config is shared, so derive variants with
+    `dataclasses.replace` instead of mutating it; call
+    `default_kafka_config_from_env.cache_clear()` to pick up env changes.
+    """
     return KafkaConfig.from_env(prefix=prefix)
 
 
 # ---- Utility helpers ----
-def _compute_backoff(attempt: int, base: float = 0.5, jitter: float = 0.2) -> float:
+def _compute_backoff(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Exponential backoff with full jitter: a uniform draw in [0, min(cap, base * 2**attempt)].
+    Spreading over the whole window keeps many clients that failed together
+    from retrying on the same tick. attempt is 0-based.
     """
-    Exponential backoff with jitter. attempt is 0-based.
+    return random.uniform(0.0, min(cap, base * (1 << attempt)))
+
+
+def _aiokafka_compression(codec: Optional[str]) -> Optional[str]:
     """
-    base_wait = base * (2 ** attempt)
-    jitter_amt = base_wait * jitter * (random.random() * 2 - 1)
-    return max(0.0, base_wait + jitter_amt)
+    Return `codec` if aiokafka can use it in this environment, else None.
+    Unlike librdkafka, aiokafka needs the codec's Python package installed
+    (e.g. `lz4`), so fall back to no compression instead of failing at init.
+    """
+    if not codec or codec == "none":
+        return None
+    try:
+        from aiokafka import codec as _codec  # type: ignore
+        available = getattr(_codec, f"has_{codec}", None)
+        if available is None or available():
+            return codec
+    except Exception:
+        return codec
+    logger.warning("compression_type=%s unavailable for aiokafka (codec package missing); sending uncompressed", codec)
+    return None
+
+
+# Bound once so each message skips json.dumps' per-call encoder construction.
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# Per-thread msgspec encoder, built once per thread. Encoder.encode writes
+# straight into the bytes object it returns, so there is no scratch buffer
+# to keep (encode_into would shrink one to each message's length anyway).
+_encode_local = threading.local()
+
+
+def _msgspec_json_bytes(obj: Any) -> bytes:
+    encode = getattr(_encode_local, "encode", None)
+    if encode is None:
+        encode = _encode_local.encode = msgspec.json.Encoder().encode
+    return encode(obj)
+
+
+if orjson is not None:
+    # orjson emits UTF-8 bytes directly and parses bytes without a decode step;
+    # OPT_NON_STR_KEYS keeps json.dumps' acceptance of int/float dict keys.
+    def _orjson_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _to_json_bytes: Callable[[Any], bytes] = _orjson_bytes
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+elif msgspec is not None:
+    _to_json_bytes = _msgspec_json_bytes
+    _json_loads = msgspec.json.decode
+else:
+    def _to_json_bytes(obj: Any) -> bytes:
+        return _json_encode(obj).encode("utf-8")
+
+    _json_loads = json.loads  # accepts UTF-8 bytes directly
+
 
+def _ser_key_default(key: Any) -> bytes:
+    """Default key serializer: str keys as UTF-8, anything else as JSON."""
+    if type(key) is str:
+        return key.encode("utf-8")
+    return _to_json_bytes(key)
 
-def _to_json_bytes(obj: Any) -> bytes:
-    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+def _ser_val_default(value: Any) -> bytes:
+    """Default value serializer: JSON."""
+    return _to_json_bytes(value)
+
+
+def _deser_key_default(b: Optional[bytes]) -> Any:
+    return b.decode("utf-8") if b is not None else None
+
+
+def _deser_val_default(b: Optional[bytes]) -> Any:
+    return _json_loads(b) if b is not None else None
+
+
+# Message headers as accepted by both confluent_kafka and aiokafka
+KafkaHeaders = List[Tuple[str, bytes]]
+
+
+def _encode_header_items(items: Iterable[Tuple[str, Any]]) -> KafkaHeaders:
+    return [(hk, hv if isinstance(hv, bytes) else str(hv).encode("utf-8")) for hk, hv in items]
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_headers(typed: Tuple[Tuple[str, type, Any], ...]) -> KafkaHeaders:
+    # keyed with each value's type so equal-comparing values (1, 1.0, True)
+    # that encode differently get separate entries; order is the caller's
+    return _encode_header_items((hk, hv) for hk, _, hv in typed)
+
+
+def prepare_headers(headers: Union[Mapping[str, Any], KafkaHeaders, None]) -> Optional[KafkaHeaders]:
+    """
+    Normalize headers to a list of (str, bytes) tuples. A list is assumed to be
+    prepared already and passed through. Dict header sets are cached, so
+    callers reusing the same headers (service name, trace schema, ...) encode
+    them once; the returned list is shared and must not be mutated. Producers
+    call this themselves, but hot loops can prepare headers once up front.
+    """
+    if not headers:
+        return None
+    if isinstance(headers, list):
+        return headers
+    try:
+        return _encode_headers(tuple([(hk, type(hv), hv) for hk, hv in headers.items()]))
+    except TypeError:  # unhashable header values: encode without caching
+        return _encode_header_items(headers.items())
+
+
+def _murmur2(data: bytes) -> int:
+    """Kafka's murmur2 key hash (Java client / librdkafka `murmur2` partitioner)."""
+    length = len(data)
+    m = 0x5BD1E995
+    h = (0x9747B28C ^ length) & 0xFFFFFFFF
+    end = length & ~3
+    for i in range(0, end, 4):
+        k = int.from_bytes(data[i:i + 4], "little")
+        k = (k * m) & 0xFFFFFFFF
+        k ^= k >> 24
+        k = (k * m) & 0xFFFFFFFF
+        h = ((h * m) & 0xFFFFFFFF) ^ k
+    rest = length & 3
+    if rest == 3:
+        h ^= data[end + 2] << 16
+    if rest >= 2:
+        h ^= data[end + 1] << 8
+    if rest >= 1:
+        h ^= data[end]
+        h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 15
+    return h
+
+
+def _key_partition(partitioner: str, key: bytes, num_partitions: int) -> int:
+    """Partition librdkafka's keyed partitioners would pick for `key`."""
+    if partitioner.startswith("murmur2"):
+        return (_murmur2(key) & 0x7FFFFFFF) % num_partitions
+    # consistent / consistent_random (librdkafka default): CRC32 of the key
+    return zlib.crc32(key) % num_partitions
 
 
 def _default_metrics_hook(event: str, payload: Dict[str, Any]) -> None:  # pragma: no cover - trivial
@@ -184,40 +426,39 @@ class SyncKafkaProducer:
         cfg: KafkaConfig,
         key_serializer: Optional[Callable[[Any], bytes]] = None,
         value_serializer: Optional[Callable[[Any], bytes]] = None,
+        poll_every: int = 1024,
     ):
-        if ConfluentProducer is None:
+        if not _HAVE_CONFLUENT:
             raise KafkaError("confluent_kafka is required for SyncKafkaProducer. Install confluent-kafka-python.")
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
-        self._key_serializer = key_serializer or (lambda k: k.encode("utf-8") if isinstance(k, str) else _to_json_bytes(k) if k is not None else None)
-        self._value_serializer = value_serializer or (lambda v: _to_json_bytes(v) if v is not None else None)
+        self._key_serializer = key_serializer or _ser_key_default
+        self._value_serializer = value_serializer or _ser_val_default
         # Build confluent config
-        conf = {
-            "bootstrap.servers": cfg.bootstrap_servers if isinstance(cfg.bootstrap_servers, str) else ",".join(cfg.bootstrap_servers),
-            "client.id": cfg.client_id or "omniflow-sync-producer",
-            "enable.idempotence": True,  # safer delivery semantics if broker supports it
-            "acks": str(cfg.acks),
-            "message.send.max.retries": cfg.retries,
-            "retry.backoff.ms": int(cfg.retry_backoff * 1000),
-            "request.timeout.ms": int(cfg.request_timeout * 1000),
-        }
-        if cfg.max_request_size:
-            conf["message.max.bytes"] = cfg.max_request_size
-        # Security settings passthrough
-        if cfg.security_protocol:
-            conf["security.protocol"] = cfg.security_protocol
-        if cfg.sasl_mechanism:
-            conf["sasl.mechanisms"] = cfg.sasl_mechanism
-        if cfg.sasl_plain_username:
-            conf["sasl.username"] = cfg.sasl_plain_username
-        if cfg.sasl_plain_password:
-            conf["sasl.password"] = cfg.sasl_plain_password
-        conf.update(cfg.extra or {})
+        # Built once per config in KafkaConfig.__post_init__
+        conf = dict(cfg._producer_base_conf)
         self._producer = ConfluentProducer(conf)
-        # Delivery callback bookkeeping
-        self._pending = 0
+        # produce_batch routes keys itself, mirroring the configured partitioner
+        self._partitioner = str(conf.get("partitioner", "consistent_random"))
+        self._partition_counts: Dict[str, int] = {}
+        # Serve delivery callbacks once per `poll_every` produces rather than after
+        # each one; flush() drains whatever is left.
+        self._poll_every = max(1, poll_every)
+        self._until_poll = self._poll_every
+
+    def _encode_value(self, value: Any) -> Any:
+        """
+        Serialize a non-bytes value. Buffer-protocol payloads are passed through
+        as-is when librdkafka can take them without a copy (read-only buffers);
+        mutable ones are copied once because confluent_kafka requires read-only input.
+        """
+        if type(value) is memoryview:
+            return value if value.readonly else value.tobytes()
+        if type(value) is bytearray:
+            return bytes(value)
+        return self._value_serializer(value)
 
-    def _on_delivery(self, err, msg):
+    def _on_delivery(self, err: Any, msg: Any) -> None:
         topic = msg.topic() if msg else None
         partition = msg.partition() if msg else None
         offset = msg.offset() if msg else None
@@ -226,48 +467,107 @@ class SyncKafkaProducer:
             self.metrics("produce_failed", {"topic": topic, "partition": partition, "error": str(err)})
         else:
             self.metrics("produce_success", {"topic": topic, "partition": partition, "offset": offset})
-        # decrement pending counter
-        try:
-            self._pending -= 1
-        except Exception:
-            self._pending = max(0, self._pending - 1)
 
-    def produce(self, topic: str, key: Any = None, value: Any = None, partition: Optional[int] = None, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> None:
+    def produce(self, topic: str, key: Any = None, value: Any = None, partition: Optional[int] = None, headers: Union[Dict[str, str], KafkaHeaders, None] = None, timeout: Optional[float] = None) -> None:
         """
         Produce a single message (fire-and-forget with delivery callback).
-        For blocking/guaranteed delivery call `flush()` after produces.
+        Delivery callbacks are served every `poll_every` produces, so call
+        `flush()` after produces for blocking/guaranteed delivery.
         """
-        k = None if key is None else self._key_serializer(key)
-        v = None if value is None else self._value_serializer(value)
-        # Confluent expects headers list of tuples or dict
-        hdrs = None
-        if headers:
-            hdrs = [(k, str(v)) for k, v in headers.items()]
+        # None and pre-encoded bytes bypass the serializer call entirely
+        k = key if key is None or type(key) is bytes else self._key_serializer(key)
+        v = value if value is None or type(value) is bytes else self._encode_value(value)
+        hdrs = prepare_headers(headers)
+        part = partition if partition is not None else -1
         attempts = 0
-        last_exc = None
-        while attempts <= self.cfg.retries:
+        while True:
             try:
-                # increment pending
-                self._pending += 1
-                self._producer.produce(topic=topic, value=v, key=k, partition=partition if partition is not None else -1, headers=hdrs, callback=self._on_delivery)
-                # Poll to trigger delivery callbacks
-                self._producer.poll(0)
-                self.metrics("produce_attempt", {"topic": topic})
-                return
+                self._enqueue(topic, k, v, part, hdrs)
+                break
+            except BufferError as exc:
+                self.metrics("produce_queue_full", {"topic": topic})
+                raise KafkaError(f"produce failed: local queue full: {exc!s}") from exc
             except ConfluentKafkaException as exc:
-                last_exc = exc
-                wait = _compute_backoff(attempts, self.cfg.retry_backoff)
+                # Broker-side transient errors are retried by librdkafka itself
+                # (message.send.max.retries); only retry here if it says so.
+                err = exc.args[0] if exc.args else None
+                retriable = bool(getattr(err, "retriable", lambda: False)())
+                if not retriable or attempts >= self.cfg.retries:
+                    raise KafkaError(f"produce failed after {attempts} retries: {exc!s}") from exc
+                wait = _compute_backoff(attempts, self.cfg.retry_backoff, self.cfg.retry_backoff_max)
                 logger.warning("Produce attempt %d failed: %s — retrying after %.2fs", attempts + 1, exc, wait)
                 self.metrics("produce_retry", {"attempt": attempts + 1, "error": str(exc)})
                 attempts += 1
                 time.sleep(wait)
-                continue
-        raise KafkaError(f"produce failed after {self.cfg.retries} retries: {last_exc!s}")
+        self._until_poll -= 1
+        if not self._until_poll:
+            self._until_poll = self._poll_every
+            self._producer.poll(0)
+        self.metrics("produce_attempt", {"topic": topic})
+
+    def _enqueue(self, topic: str, k: Optional[bytes], v: Any, part: int, hdrs: Optional[KafkaHeaders]) -> None:
+        try:
+            self._producer.produce(topic=topic, value=v, key=k, partition=part, headers=hdrs, callback=self._on_delivery)
+        except BufferError:
+            # Local queue is full: serve delivery reports to free space, then try once more.
+            self._producer.poll(0.1)
+            self._producer.produce(topic=topic, value=v, key=k, partition=part, headers=hdrs, callback=self._on_delivery)
+
+    def _partition_count(self, topic: str) -> int:
+        """Cached partition count for `topic`; 0 if metadata is unavailable."""
+        count = self._partition_counts.get(topic)
+        if count is None:
+            try:
+                md = self._producer.list_topics(topic, timeout=self.cfg.request_timeout)
+                tmd = md.topics.get(topic)
+                count = len(tmd.partitions) if tmd is not None and tmd.error is None else 0
+            except ConfluentKafkaException as exc:
+                logger.warning("Could not fetch partition metadata for %s: %s", topic, exc)
+                count = 0
+            if count:
+                self._partition_counts[topic] = count
+        return count
+
+    def produce_batch(self, topic: str, items: Iterable[Tuple[Any, Any, Union[Dict[str, str], KafkaHeaders, None]]]) -> int:
+        """
+        Produce many (key, value, headers) items in one call. Everything is
+        serialized in a single pass, keyed items are assigned to partitions the
+        way the configured partitioner would, and each partition's messages are
+        enqueued back-to-back so librdkafka can coalesce them into full batches.
+        Items without a key, or topics whose metadata can't be fetched, are left
+        to librdkafka's own partitioning. Returns the number of messages enqueued.
+        """
+        num_partitions = self._partition_count(topic)
+        groups: Dict[int, List[Tuple[Optional[bytes], Any, Optional[KafkaHeaders]]]] = {}
+        for key, value, headers in items:
+            k = key if key is None or type(key) is bytes else self._key_serializer(key)
+            v = value if value is None or type(value) is bytes else self._encode_value(value)
+            part = _key_partition(self._partitioner, k, num_partitions) if k is not None and num_partitions else -1
+            groups.setdefault(part, []).append((k, v, prepare_headers(headers)))
+        count = 0
+        try:
+            for part, msgs in groups.items():
+                for k, v, hdrs in msgs:
+                    self._enqueue(topic, k, v, part, hdrs)
+                    count += 1
+        except (BufferError, ConfluentKafkaException) as exc:
+            self.metrics("produce_batch_failed", {"topic": topic, "enqueued": count, "error": str(exc)})
+            raise KafkaError(f"batch produce failed after {count} messages: {exc!s}") from exc
+        self._producer.poll(0)
+        self.metrics("produce_batch", {"topic": topic, "count": count, "partitions": len(groups)})
+        return count
+
+    @property
+    def pending(self) -> int:
+        """Messages still queued or in flight, as tracked by librdkafka."""
+        return len(self._producer)
 
     def flush(self, timeout: Optional[float] = None) -> None:
         """Block until all pending messages have been delivered or timeout."""
         t = timeout if timeout is not None else self.cfg.request_timeout
-        self._producer.flush(int(t * 1000))
+        remaining = self._producer.flush(t)
+        if remaining:
+            logger.warning("flush timed out with %d message(s) still pending", remaining)
 
     def close(self) -> None:
         """Close producer (flushes pending messages)."""
@@ -295,7 +595,7 @@ class SyncKafkaConsumer:
         cfg = KafkaConfig.from_env()
         c = SyncKafkaConsumer(cfg, group_id="omniflow-group", topics=["my-topic"])
         for msg in c:
-            process(msg)  # msg is confluent_kafka.Message
+            process(msg.value)  # msg is a Record; msg.raw is the confluent_kafka.Message
         c.close()
     """
 
@@ -308,64 +608,63 @@ class SyncKafkaConsumer:
         enable_auto_commit: bool = False,
         key_deserializer: Optional[Callable[[bytes], Any]] = None,
         value_deserializer: Optional[Callable[[bytes], Any]] = None,
+        batch_size: int = 500,
+        poll_timeout: float = 0.1,
     ):
-        if ConfluentConsumer is None:
+        if not _HAVE_CONFLUENT:
             raise KafkaError("confluent_kafka is required for SyncKafkaConsumer. Install confluent-kafka-python.")
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
-        self._key_deserializer = key_deserializer or (lambda b: b.decode("utf-8") if b is not None else None)
-        self._value_deserializer = value_deserializer or (lambda b: json.loads(b.decode("utf-8")) if b is not None else None)
+        self._key_deserializer = key_deserializer or _deser_key_default
+        self._value_deserializer = value_deserializer or _deser_val_default
         conf = {
-            "bootstrap.servers": cfg.bootstrap_servers if isinstance(cfg.bootstrap_servers, str) else ",".join(cfg.bootstrap_servers),
+            **cfg._librdkafka_common,
             "group.id": group_id,
             "client.id": cfg.client_id or f"omniflow-sync-consumer-{group_id}",
             "auto.offset.reset": auto_offset_reset,
             "enable.auto.commit": enable_auto_commit,
             "session.timeout.ms": int(cfg.request_timeout * 1000),
         }
-        if cfg.security_protocol:
-            conf["security.protocol"] = cfg.security_protocol
-        if cfg.sasl_mechanism:
-            conf["sasl.mechanisms"] = cfg.sasl_mechanism
-        if cfg.sasl_plain_username:
-            conf["sasl.username"] = cfg.sasl_plain_username
-        if cfg.sasl_plain_password:
-            conf["sasl.password"] = cfg.sasl_plain_password
         conf.update(cfg.extra or {})
         self._consumer = ConfluentConsumer(conf)
         if topics:
             self._consumer.subscribe(topics)
         self._running = True
+        # Iteration pulls up to `batch_size` messages per consume() call; the short
+        # timeout keeps idle loops responsive to close().
+        self._batch_size = batch_size
+        self._poll_timeout = poll_timeout
 
-    def __iter__(self) -> Generator[Any, None, None]:
-        """Iterator yielding deserialized messages as dicts: {key, value, topic, partition, offset, timestamp, raw}"""
+    def _decode(self, msg: Any) -> Record:
+        try:
+            key = self._key_deserializer(msg.key())
+            value = self._value_deserializer(msg.value())
+        except Exception as exc:
+            logger.exception("Failed to deserialize message: %s", exc)
+            self.metrics("consumer_deserialize_error", {"error": str(exc)})
+            # Skip or yield raw message depending on design choice; yield raw for inspection
+            key = value = None
+        return Record(key, value, msg.topic(), msg.partition(), msg.offset(), msg.timestamp(), msg)
+
+    def __iter__(self) -> Generator[Record, None, None]:
+        """Iterator yielding deserialized messages as `Record(key, value, topic, partition, offset, timestamp, raw)`."""
         while self._running:
-            msg = self._consumer.poll(timeout=1.0)
-            if msg is None:
-                continue
+            yield from self.poll_batch(self._batch_size, self._poll_timeout)
+
+    def poll_batch(self, num: int = 500, timeout: float = 1.0) -> List[Record]:
+        """
+        Fetch up to `num` messages with a single `consume()` call and return them
+        deserialized as `Record`s, like the iterator yields. Returns an empty
+        list if nothing arrived within `timeout` seconds.
+        """
+        out: List[Record] = []
+        for msg in self._consumer.consume(num_messages=num, timeout=timeout):
             if msg.error():
-                # handle error
                 logger.error("Consumer error: %s", msg.error())
                 self.metrics("consumer_error", {"error": str(msg.error())})
                 continue
-            try:
-                key = self._key_deserializer(msg.key())
-                value = self._value_deserializer(msg.value())
-            except Exception as exc:
-                logger.exception("Failed to deserialize message: %s", exc)
-                self.metrics("consumer_deserialize_error", {"error": str(exc)})
-                # Skip or yield raw message depending on design choice; yield raw for inspection
-                yield {"key": None, "value": None, "topic": msg.topic(), "partition": msg.partition(), "offset": msg.offset(), "timestamp": msg.timestamp(), "raw": msg}
-                continue
-            yield {
-                "key": key,
-                "value": value,
-                "topic": msg.topic(),
-                "partition": msg.partition(),
-                "offset": msg.offset(),
-                "timestamp": msg.timestamp(),
-                "raw": msg,
-            }
+            out.append(self._decode(msg))
+        return out
 
     def commit(self, msg=None, asynchronous: bool = False):
         """Commit offsets; if msg is provided commit that message's offset."""
@@ -400,36 +699,36 @@ class AsyncKafkaProducer:
         cfg = KafkaConfig.from_env()
         p = AsyncKafkaProducer(cfg)
         await p.start()
-        await p.send("topic", key="k", value={"hello":"world"})
+        fut = await p.send("topic", key="k", value={"hello":"world"})  # enqueued, not yet acked
+        await p.send("topic", value={"n": 2}, wait=True)             # waits for the broker ack
+        await p.send_many("topic", [("k1", {"n": 3}), ("k2", {"n": 4})])
         await p.stop()
     """
 
     def __init__(
         self,
         cfg: KafkaConfig,
-        loop: Optional[asyncio.AbstractEventLoop] = None,
         key_serializer: Optional[Callable[[Any], bytes]] = None,
         value_serializer: Optional[Callable[[Any], bytes]] = None,
     ):
-        if AIOKafkaProducer is None:
+        if not _HAVE_AIOKAFKA:
             raise KafkaError("aiokafka is required for AsyncKafkaProducer. Install aiokafka.")
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
-        self.loop = loop or asyncio.get_event_loop()
-        self._key_serializer = key_serializer or (lambda k: k.encode("utf-8") if isinstance(k, str) else _to_json_bytes(k) if k is not None else None)
-        self._value_serializer = value_serializer or (lambda v: _to_json_bytes(v) if v is not None else None)
-        bootstrap = cfg.bootstrap_servers if isinstance(cfg.bootstrap_servers, (str, list)) else str(cfg.bootstrap_servers)
-        # aiokafka expects string or list
+        self._key_serializer = key_serializer or _ser_key_default
+        self._value_serializer = value_serializer or _ser_val_default
         kms = None
         if cfg.sasl_mechanism:
             kms = cfg.sasl_mechanism
         # Build aiokafka producer config
         prod_kwargs = {
-            "loop": self.loop,
-            "bootstrap_servers": bootstrap,
+            "bootstrap_servers": cfg.bootstrap_servers,
             "client_id": cfg.client_id or "omniflow-async-producer",
             "request_timeout_ms": int(cfg.request_timeout * 1000),
             "max_block_ms": int(cfg.request_timeout * 1000),
+            "linger_ms": cfg.linger_ms,
+            "max_batch_size": cfg.batch_size,
+            "compression_type": _aiokafka_compression(cfg.compression_type),
             **(cfg.extra or {}),
         }
         # SASL / security options
@@ -441,13 +740,25 @@ class AsyncKafkaProducer:
             prod_kwargs["sasl_plain_username"] = cfg.sasl_plain_username
         if cfg.sasl_plain_password:
             prod_kwargs["sasl_plain_password"] = cfg.sasl_plain_password
-        self._producer = AIOKafkaProducer(**prod_kwargs)
+        # aiokafka binds to the running loop when the client is created, so the
+        # client itself is built in start(); this object can be constructed
+        # before any event loop exists.
+        self._client_kwargs = prod_kwargs
+        # send_many routes keys itself; None means aiokafka's default (murmur2)
+        self._partitioner: Optional[Callable[..., int]] = prod_kwargs.get("partitioner")
+        self._producer: Any = None
         self._started = False
+        self._start_lock = asyncio.Lock()
 
     async def start(self):
-        if not self._started:
-            await self._producer.start()
-            self._started = True
+        if self._started:
+            return
+        # Shared producers may be started lazily by concurrent first sends.
+        async with self._start_lock:
+            if not self._started:
+                self._producer = AIOKafkaProducer(**self._client_kwargs)
+                await self._producer.start()
+                self._started = True
 
     async def stop(self):
         if self._started:
@@ -456,30 +767,107 @@ class AsyncKafkaProducer:
             finally:
                 self._started = False
 
-    async def send(self, topic: str, key: Any = None, value: Any = None, partition: Optional[int] = None, headers: Optional[Dict[str, str]] = None) -> None:
-        k = None if key is None else self._key_serializer(key)
-        v = None if value is None else self._value_serializer(value)
-        hdrs = None
-        if headers:
-            # aiokafka expects list of tuples or bytes
-            hdrs = [(hk, str(hv).encode("utf-8")) for hk, hv in headers.items()]
+    def _encode_value(self, value: Any) -> Any:
+        """Serialize a non-bytes value; bytearray/memoryview payloads pass through uncopied."""
+        if type(value) is memoryview or type(value) is bytearray:
+            return value
+        return self._value_serializer(value)
+
+    def _on_delivery(self, fut: "asyncio.Future[Any]") -> None:
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        if exc is not None:
+            logger.error("Async delivery failed: %s", exc)
+            self.metrics("async_produce_failed", {"error": str(exc)})
+        else:
+            meta = fut.result()
+            self.metrics("async_produce_success", {"topic": meta.topic, "partition": meta.partition, "offset": meta.offset})
+
+    async def send(self, topic: str, key: Any = None, value: Any = None, partition: Optional[int] = None, headers: Union[Dict[str, str], KafkaHeaders, None] = None, wait: bool = False) -> "asyncio.Future[Any]":
+        """
+        Enqueue a message and return its delivery future without waiting for the
+        broker ack, so consecutive sends are batched by aiokafka's accumulator
+        (see `linger_ms` / `batch_size`). Pass wait=True to await delivery.
+        Starts the producer on first use if `start()` was not called.
+        """
+        if not self._started:
+            await self.start()
+        # None and pre-encoded bytes bypass the serializer call entirely
+        k = key if key is None or type(key) is bytes else self._key_serializer(key)
+        v = value if value is None or type(value) is bytes else self._encode_value(value)
+        hdrs = prepare_headers(headers)
         attempts = 0
         last_exc = None
         while attempts <= self.cfg.retries:
             try:
-                await self._producer.send_and_wait(topic, value=v, key=k, partition=partition, headers=hdrs)
-                self.metrics("async_produce_success", {"topic": topic})
-                return
+                fut = await self._producer.send(topic, value=v, key=k, partition=partition, headers=hdrs)
+                fut.add_done_callback(self._on_delivery)
+                if wait:
+                    await fut
+                return fut
             except AiokafkaError as exc:
                 last_exc = exc
-                wait = _compute_backoff(attempts, self.cfg.retry_backoff)
-                logger.warning("Async produce attempt %d failed: %s — retrying after %.2fs", attempts + 1, exc, wait)
+                wait_s = _compute_backoff(attempts, self.cfg.retry_backoff, self.cfg.retry_backoff_max)
+                logger.warning("Async produce attempt %d failed: %s — retrying after %.2fs", attempts + 1, exc, wait_s)
                 self.metrics("async_produce_retry", {"attempt": attempts + 1, "error": str(exc)})
                 attempts += 1
-                await asyncio.sleep(wait)
+                await asyncio.sleep(wait_s)
                 continue
         raise KafkaError(f"async produce failed after {self.cfg.retries} retries: {last_exc!s}")
 
+    async def send_many(self, topic: str, records: Iterable[Tuple[Any, Any]], partition: Optional[int] = None) -> int:
+        """
+        Send (key, value) pairs through aiokafka's explicit batch API. When
+        `partition` is None, keyed records go to the partition the producer's
+        partitioner picks for their key (so per-key ordering holds) and keyless
+        records share one randomly chosen partition for the call. Each
+        partition's records are appended to its own batch, every full batch
+        goes out with a single `send_batch` call, and all deliveries are
+        awaited together at the end. Returns the number of records sent.
+        """
+        if not self._started:
+            await self.start()
+        parts: List[int] = []
+        if partition is None:
+            parts = sorted(await self._producer.partitions_for(topic))
+            if not parts:
+                raise KafkaError(f"no partition metadata for topic {topic!r}")
+            keyless = random.choice(parts)
+        futures = []
+        count = 0
+        batches: Dict[int, Any] = {}
+        for key, value in records:
+            k = key if key is None or type(key) is bytes else self._key_serializer(key)
+            v = value if value is None or type(value) is bytes else self._encode_value(value)
+            if partition is not None:
+                part = partition
+            elif k is None:
+                part = keyless
+            elif self._partitioner is not None:
+                part = self._partitioner(k, parts, parts)
+            else:
+                part = parts[_key_partition("murmur2", k, len(parts))]
+            batch = batches.get(part)
+            if batch is None:
+                batch = batches[part] = self._producer.create_batch()
+            while batch.append(key=k, value=v, timestamp=None) is None:
+                if batch.record_count() == 0:
+                    raise KafkaError("record does not fit into an empty batch; raise batch_size")
+                futures.append(await self._producer.send_batch(batch, topic, partition=part))
+                batch = batches[part] = self._producer.create_batch()
+            count += 1
+        for part, batch in batches.items():
+            if batch.record_count():
+                futures.append(await self._producer.send_batch(batch, topic, partition=part))
+        try:
+            await asyncio.gather(*futures)
+        except AiokafkaError as exc:
+            self.metrics("async_produce_failed", {"topic": topic, "error": str(exc)})
+            raise KafkaError(f"async batch produce failed: {exc!s}") from exc
+        self.metrics("async_produce_batch", {"topic": topic, "partitions": len(batches), "count": count, "batches": len(futures)})
+        return count
+
     # Context manager helpers (async)
     async def __aenter__(self):
         await self.start()
@@ -513,19 +901,16 @@ class AsyncKafkaConsumer:
         enable_auto_commit: bool = False,
         key_deserializer: Optional[Callable[[bytes], Any]] = None,
         value_deserializer: Optional[Callable[[bytes], Any]] = None,
-        loop: Optional[asyncio.AbstractEventLoop] = None,
+        batch_size: int = 500,
     ):
-        if AIOKafkaConsumer is None:
+        if not _HAVE_AIOKAFKA:
             raise KafkaError("aiokafka is required for AsyncKafkaConsumer. Install aiokafka.")
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
-        self.loop = loop or asyncio.get_event_loop()
-        self._key_deserializer = key_deserializer or (lambda b: b.decode("utf-8") if b is not None else None)
-        self._value_deserializer = value_deserializer or (lambda b: json.loads(b.decode("utf-8")) if b is not None else None)
-        bootstrap = cfg.bootstrap_servers
+        self._key_deserializer = key_deserializer or _deser_key_default
+        self._value_deserializer = value_deserializer or _deser_val_default
         cons_kwargs = {
-            "loop": self.loop,
-            "bootstrap_servers": bootstrap,
+            "bootstrap_servers": cfg.bootstrap_servers,
             "group_id": group_id,
             "client_id": cfg.client_id or f"omniflow-async-consumer-{group_id}",
             "auto_offset_reset": auto_offset_reset,
@@ -541,16 +926,22 @@ class AsyncKafkaConsumer:
             cons_kwargs["sasl_plain_username"] = cfg.sasl_plain_username
         if cfg.sasl_plain_password:
             cons_kwargs["sasl_plain_password"] = cfg.sasl_plain_password
-        self._consumer = AIOKafkaConsumer(**cons_kwargs)
+        # Built in start() so construction doesn't need a running loop.
+        self._client_kwargs = cons_kwargs
+        self._consumer: Any = None
         self._topics = topics or []
         self._started = False
         self._running = False
+        # Iteration fetches `batch_size` records per getmany() and serves them from here
+        self._batch_size = batch_size
+        self._buffer: Deque[Record] = collections.deque()
 
     async def start(self):
         if not self._started:
+            self._consumer = AIOKafkaConsumer(**self._client_kwargs)
             await self._consumer.start()
             if self._topics:
-                await self._consumer.subscribe(self._topics)
+                self._consumer.subscribe(topics=self._topics)
             self._started = True
             self._running = True
 
@@ -567,22 +958,34 @@ class AsyncKafkaConsumer:
             raise KafkaError("consumer not started; call await consumer.start() before iterating")
         return self
 
-    async def __anext__(self):
-        if not self._running:
-            raise StopAsyncIteration
-        try:
-            msg = await self._consumer.getone()
-        except Exception as exc:
-            logger.exception("Error fetching message: %s", exc)
-            raise
+    def _decode(self, msg: Any) -> Record:
         try:
             key = self._key_deserializer(msg.key)
             value = self._value_deserializer(msg.value)
         except Exception as exc:
             logger.exception("Failed to deserialize message: %s", exc)
             self.metrics("async_consumer_deserialize_error", {"error": str(exc)})
-            return {"key": None, "value": None, "topic": msg.topic, "partition": msg.partition, "offset": msg.offset, "timestamp": msg.timestamp, "raw": msg}
-        return {"key": key, "value": value, "topic": msg.topic, "partition": msg.partition, "offset": msg.offset, "timestamp": msg.timestamp, "raw": msg}
+            key = value = None
+        return Record(key, value, msg.topic, msg.partition, msg.offset, msg.timestamp, msg)
+
+    async def getmany(self, max_records: int = 500, timeout_ms: int = 1000) -> List[Record]:
+        """
+        Fetch up to `max_records` messages across all assigned partitions in one
+        call and return them deserialized. Returns an empty list on timeout.
+        """
+        batches = await self._consumer.getmany(timeout_ms=timeout_ms, max_records=max_records)
+        return [self._decode(msg) for msgs in batches.values() for msg in msgs]
+
+    async def __anext__(self) -> Record:
+        while not self._buffer:
+            if not self._running:
+                raise StopAsyncIteration
+            try:
+                self._buffer.extend(await self.getmany(max_records=self._batch_size))
+            except Exception as exc:
+                logger.exception("Error fetching message: %s", exc)
+                raise
+        return self._buffer.popleft()
 
     async def commit(self):
         try:
@@ -600,22 +1003,60 @@ class AsyncKafkaConsumer:
 
 
 # ---- Convenience factories / helpers ----
+def _maybe_use_uvloop() -> None:
+    if os.getenv("OMNIFLOW_KAFKA_UVLOOP", "").lower() in ("1", "true", "yes"):
+        use_uvloop()
+
+
+# Process-wide async producers keyed by env prefix and connection identity.
+# A producer owns its broker connections, metadata and sender task, and is
+# safe to share between tasks, so building one per call only repeats the
+# bootstrap.
+_producer_cache: Dict[Tuple[Any, ...], "AsyncKafkaProducer"] = {}
+
+
 def build_producer_from_env(prefix: str = "KAFKA", async_client: bool = False, **kwargs):
     """
     Convenience: build a Sync or Async producer from environment configuration.
+
+    Async producers built without custom kwargs are shared per
+    (prefix, bootstrap_servers, client_id, security_protocol) and start
+    lazily on first send; release them with `await close_all_producers()` at shutdown
+    rather than stopping them individually.
     """
     cfg = default_kafka_config_from_env(prefix)
     if async_client:
-        return AsyncKafkaProducer(cfg, **kwargs)
+        _maybe_use_uvloop()
+        if kwargs:
+            return AsyncKafkaProducer(cfg, **kwargs)
+        # the prefix selects credentials, acks and compression, so two prefixes
+        # on one cluster must not share a producer
+        key = (prefix, cfg.bootstrap_servers, cfg.client_id, cfg.security_protocol)
+        producer = _producer_cache.get(key)
+        if producer is None:
+            producer = _producer_cache[key] = AsyncKafkaProducer(cfg)
+        return producer
     return SyncKafkaProducer(cfg, **kwargs)
 
 
+async def close_all_producers() -> None:
+    """Stop and forget every shared async producer created by `build_producer_from_env`."""
+    producers = list(_producer_cache.values())
+    _producer_cache.clear()
+    for producer in producers:
+        try:
+            await producer.stop()
+        except Exception:
+            logger.exception("Error stopping shared producer")
+
+
 def build_consumer_from_env(prefix: str = "KAFKA", async_client: bool = False, **kwargs):
     """
     Convenience: build a Sync or Async consumer from environment configuration.
     """
     cfg = default_kafka_config_from_env(prefix)
     if async_client:
+        _maybe_use_uvloop()
         return AsyncKafkaConsumer(cfg, **kwargs)
     return SyncKafkaConsumer(cfg, **kwargs)
 
@@ -626,7 +1067,7 @@ if __name__ == "__main__":  # pragma: no cover - example only
     # Example sync producer
     try:
         cfg = KafkaConfig.from_env()
-        if ConfluentProducer is not None:
+        if _HAVE_CONFLUENT:
             p = SyncKafkaProducer(cfg)
             p.produce("omniflow-test", key="hello", value={"msg": "hello world"})
             p.flush()
@@ -638,7 +1079,7 @@ if __name__ == "__main__":  # pragma: no cover - example only
 
     # Example async producer
     async def async_demo():
-        if AIOKafkaProducer is None:
+        if not _HAVE_AIOKAFKA:
             logger.info("aiokafka not installed; skipping async examples")
             return
         cfg = KafkaConfig.from_env()
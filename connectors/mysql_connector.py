@@ -9,26 +9,135 @@ Features:
 - Safe connection pooling
 - Query execution (sync + async dispatch)
 - Insert / Update / Delete helpers
+- Bulk DML via executemany (single transaction, batched round-trips)
+- Server-side prepared statements for the insert/update/delete helpers
+- Row streaming for large SELECTs (``iter_query``)
+- Explicit transactions (``with connector.transaction() as tx: ...``)
+- Optional asyncio client (AsyncMySQLConnector) on aiomysql
+- Connection-pool metrics (requested / acquired / unacquired, acquire wait)
+- CPU-derived default pool size with bounded overflow under pressure
 - Automatic reconnection
 - Structured logging
 - Declarative error handling compatible with OmniFlow runtime
 
 Dependencies:
     pip install mysql-connector-python
+    pip install aiomysql  # optional, for AsyncMySQLConnector
 """
 
+import asyncio
+import contextlib
+import os
+import threading
+import time
+from collections import OrderedDict
 import mysql.connector
 from mysql.connector import Error, pooling
-from typing import Any, Dict, Optional, List
+from mysql.connector.errors import PoolError
+from itertools import islice
+from typing import (
+    Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, List, Sequence, Tuple,
+)
 from omnitools.logger import OmniLogger
 
+try:
+    import aiomysql  # type: ignore
+except ImportError:
+    aiomysql = None
+
+# query() materializes the whole result set; above this many rows it logs a
+# hint to switch to iter_query().
+_LARGE_RESULT_WARN_ROWS = 50_000
+
+# Prepared cursors kept per pooled connection by the structured helpers.
+_STMT_CACHE_SIZE = 256
+
+# Built SQL strings for the insert/update/delete helpers; cleared when full.
+_SQL_TEMPLATE_CACHE_SIZE = 1024
+
+# Bounds for the derived default pool size; mysql-connector caps a single
+# pool at 32 connections (pooling.CNX_POOL_MAXSIZE).
+_MIN_POOL_SIZE = 5
+_MAX_POOL_SIZE = pooling.CNX_POOL_MAXSIZE
+_ACQUIRE_POLL_INTERVAL = 0.005
+
+# How long an exhausted pool is polled before overflowing, and the size of
+# the overflow pool. MySQLConnectionPool opens all of its connections up
+# front, so the overflow stays small: a momentary spike should wait briefly
+# rather than permanently add server connections.
+_DEFAULT_ACQUIRE_TIMEOUT_MS = 200
+_DEFAULT_MAX_OVERFLOW = 4
+
+
+def _default_pool_size(min_pool: int = _MIN_POOL_SIZE, max_pool: int = _MAX_POOL_SIZE) -> int:
+    """``2 * cpu_count`` bounded to ``[min_pool, max_pool]``."""
+    return max(min_pool, min(max_pool, 2 * (os.cpu_count() or 1)))
+
+
+def _run_query(conn, sql: str, params: Optional[tuple]) -> List[Dict[str, Any]]:
+    with conn.cursor(dictionary=True) as cursor:
+        cursor.execute(sql, params or ())
+        return cursor.fetchall()
+
+
+def _run_execute(conn, sql: str, params: Optional[tuple]) -> int:
+    with conn.cursor() as cursor:
+        cursor.execute(sql, params or ())
+        return cursor.rowcount
+
+
+def _insert_template(table: str, columns: Sequence[str]) -> str:
+    keys = ", ".join(columns)
+    placeholders = ", ".join(["%s"] * len(columns))
+    return f"INSERT INTO {table} ({keys}) VALUES ({placeholders})"
+
+
+def _split_rows(rows: Iterable[Dict[str, Any]]) -> Optional[Tuple[Tuple[str, ...], Iterator[tuple]]]:
+    """Return (columns, params iterator) for dict rows keyed like the first row."""
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        return None
+    columns = tuple(first)
+
+    def _params():
+        yield tuple(first[c] for c in columns)
+        for row in it:
+            yield tuple(row[c] for c in columns)
+
+    return columns, _params()
+
+
+class MySQLTransaction:
+    """
+    Handle yielded by :meth:`MySQLConnector.transaction`.
+
+    Statements run on the transaction's connection and are committed together
+    when the ``with`` block exits.
+    """
+
+    __slots__ = ("conn",)
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def query(self, sql: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        return _run_query(self.conn, sql, params)
+
+    def execute(self, sql: str, params: Optional[tuple] = None) -> int:
+        return _run_execute(self.conn, sql, params)
+
 
 class MySQLConnector:
     """
     MySQL Connector with pooled connections.
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        metrics_hook: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ):
         """
         Config example:
         {
@@ -38,116 +147,608 @@ class MySQLConnector:
             "password": "password",
             "database": "omniflow",
             "pool_name": "omniflow_pool",
-            "pool_size": 5
+            "pool_size": 8,
+            "acquire_timeout_ms": 200,
+            "grow_on_pressure": True,
+            "max_overflow": 4,
+            "expected_concurrency": 16,
+            "pool_reset_session": False,
+            "prepared_statements": True
         }
+
+        ``pool_reset_session`` defaults to False: returning a connection to
+        the pool then costs no COM_RESET_CONNECTION round-trip. Connections
+        run in autocommit mode, so no open transaction or read snapshot leaks
+        to the next borrower. Set it to True if callers change session
+        state (user variables, temporary tables, ``SET SESSION ...``).
+
+        ``prepared_statements`` makes insert/update/delete reuse server-side
+        prepared statements, cached per pooled connection (LRU, 256 per
+        connection). Because a session reset deallocates prepared statements,
+        the cache is off when ``pool_reset_session`` is True.
+
+        ``pool_size`` defaults to ``2 * os.cpu_count()`` bounded to
+        [5, 32]. mysql-connector fails fast when the pool is exhausted;
+        ``acquire_timeout_ms`` (default 200) instead keeps polling for a free
+        connection that long. If none frees up and ``grow_on_pressure`` is set
+        (the default), a secondary overflow pool of ``max_overflow``
+        connections (default 4) is opened once and used for the excess. A
+        warning is logged when the overflow first kicks in, or at startup if
+        ``expected_concurrency`` exceeds the pool size.
+
+        ``metrics_hook(event, payload)`` (or ``config["metrics_hook"]``)
+        receives pool events: ``connections_requested``, then exactly one of
+        ``connections_acquired`` (with ``wait_seconds``) or
+        ``connections_unacquired_error`` (with ``error``). Running totals are
+        available from :meth:`pool_metrics`.
         """
         self.logger = OmniLogger("MySQLConnector")
 
         self.config = config
         self.pool = None
+        self.pool_size = int(config.get("pool_size") or _default_pool_size())
+        self._overflow_pool = None
+        self._overflow_lock = threading.Lock()
+
+        self.metrics = metrics_hook or config.get("metrics_hook")
+        self._pool_stats: Dict[str, float] = {
+            "connections_requested": 0,
+            "connections_acquired": 0,
+            "connections_unacquired_error": 0,
+            "acquire_wait_seconds_total": 0.0,
+            "acquire_wait_seconds_max": 0.0,
+        }
+        self._stats_lock = threading.Lock()
+
+        self._prepare = bool(config.get("prepared_statements", True)) and not config.get(
+            "pool_reset_session", False
+        )
+        # connection_id -> OrderedDict[sql, (sql, prepared cursor)], least
+        # recently used connection first. A pooled connection is used by one
+        # thread at a time, so only the outer dicts need the lock.
+        # connection_id changes on reconnect, which invalidates that
+        # connection's statements. Caches evicted while their connection may
+        # still be live wait in _stmt_evicted until it is next checked out,
+        # since only the thread holding it may close its cursors.
+        self._stmt_cache: "OrderedDict[int, OrderedDict[str, Tuple[str, Any]]]" = OrderedDict()
+        self._stmt_evicted: "OrderedDict[int, OrderedDict[str, Tuple[str, Any]]]" = OrderedDict()
+        self._stmt_lock = threading.Lock()
+        # (kind, table, columns, where) -> SQL. Returning the same str object
+        # for a template also lets the prepared cursor skip re-preparing it.
+        self._sql_cache: Dict[Tuple[Any, ...], str] = {}
 
         self._initialize_pool()
 
+        expected = self.config.get("expected_concurrency")
+        if expected and int(expected) > self.pool_size:
+            self.logger.warning(
+                f"MySQL pool_size={self.pool_size} is below expected_concurrency={expected}; "
+                "workers may wait for connections."
+            )
+
+    def _new_pool(self, name: str, size: int):
+        return pooling.MySQLConnectionPool(
+            pool_name=name,
+            pool_size=size,
+            pool_reset_session=self.config.get("pool_reset_session", False),
+            autocommit=True,
+            host=self.config["host"],
+            port=self.config.get("port", 3306),
+            user=self.config["user"],
+            password=self.config["password"],
+            database=self.config["database"],
+        )
+
     def _initialize_pool(self):
         try:
-            self.pool = pooling.MySQLConnectionPool(
-                pool_name=self.config.get("pool_name", "omniflow_pool"),
-                pool_size=self.config.get("pool_size", 5),
-                pool_reset_session=True,
-                host=self.config["host"],
-                port=self.config.get("port", 3306),
-                user=self.config["user"],
-                password=self.config["password"],
-                database=self.config["database"],
-            )
-            self.logger.info("MySQL connection pool initialized successfully.")
+            self.pool = self._new_pool(self.config.get("pool_name", "omniflow_pool"), self.pool_size)
+            self.logger.info(f"MySQL connection pool initialized successfully (size={self.pool_size}).")
         except Error as err:
             self.logger.error(f"Failed to initialize MySQL pool: {err}")
             raise
 
-    def _get_connection(self):
+    def _overflow(self):
+        """Return the overflow pool, opening it on first use (None if disabled)."""
+        if self._overflow_pool is not None:
+            return self._overflow_pool
+        if not self.config.get("grow_on_pressure", True):
+            return None
+        size = min(int(self.config.get("max_overflow", _DEFAULT_MAX_OVERFLOW)), _MAX_POOL_SIZE)
+        if size <= 0:
+            return None
+        with self._overflow_lock:
+            if self._overflow_pool is None:
+                name = f"{self.config.get('pool_name', 'omniflow_pool')}_overflow"
+                self._overflow_pool = self._new_pool(name, size)
+                self.logger.warning(
+                    f"MySQL pool of {self.pool_size} exhausted; opened overflow pool of {size}. "
+                    "Consider raising pool_size for this workload."
+                )
+        return self._overflow_pool
+
+    def _acquire(self):
+        """Take a connection from the main pool, waiting/overflowing on exhaustion."""
         try:
             return self.pool.get_connection()
+        except PoolError:
+            pass
+        deadline = time.monotonic() + self.config.get("acquire_timeout_ms", _DEFAULT_ACQUIRE_TIMEOUT_MS) / 1000.0
+        while time.monotonic() < deadline:
+            time.sleep(_ACQUIRE_POLL_INTERVAL)
+            try:
+                return self.pool.get_connection()
+            except PoolError:
+                continue
+        overflow = self._overflow()
+        if overflow is None:
+            raise PoolError(f"MySQL pool exhausted (size={self.pool_size})")
+        return overflow.get_connection()
+
+    def _record_pool_event(self, event: str, payload: Dict[str, Any]) -> None:
+        with self._stats_lock:
+            stats = self._pool_stats
+            stats[event] += 1
+            wait = payload.get("wait_seconds")
+            if wait is not None:
+                stats["acquire_wait_seconds_total"] += wait
+                if wait > stats["acquire_wait_seconds_max"]:
+                    stats["acquire_wait_seconds_max"] = wait
+        if self.metrics is not None:
+            try:
+                self.metrics(event, {"pool_name": self.config.get("pool_name", "omniflow_pool"), **payload})
+            except Exception as err:
+                self.logger.debug(f"MySQL metrics hook raised: {err}")
+
+    def pool_metrics(self) -> Dict[str, float]:
+        """Snapshot of the connection-pool counters."""
+        with self._stats_lock:
+            return dict(self._pool_stats)
+
+    def _get_connection(self):
+        self._record_pool_event("connections_requested", {})
+        start = time.monotonic()
+        try:
+            conn = self._acquire()
+        except BaseException as err:
+            # Exactly one terminal event per request, whatever was raised.
+            self._record_pool_event("connections_unacquired_error", {"error": str(err)})
+            if isinstance(err, Error):
+                self.logger.error(f"Failed to get MySQL connection from pool: {err}")
+            raise
+        self._record_pool_event("connections_acquired", {"wait_seconds": time.monotonic() - start})
+        return conn
+
+    def _statements_for(self, conn) -> "OrderedDict[str, Tuple[str, Any]]":
+        conn_id = conn.connection_id
+        with self._stmt_lock:
+            cache = self._stmt_cache.get(conn_id)
+            if cache is not None:
+                self._stmt_cache.move_to_end(conn_id)
+                return cache
+            evicted = self._stmt_evicted.pop(conn_id, None)
+            # Ids of reconnected connections are never used again, so they
+            # are the least recently used and go first.
+            limit = 2 * (self.pool_size + int(self.config.get("max_overflow", _DEFAULT_MAX_OVERFLOW)))
+            while len(self._stmt_cache) >= limit:
+                old_id, old = self._stmt_cache.popitem(last=False)
+                self._stmt_evicted[old_id] = old
+            while len(self._stmt_evicted) > limit:
+                # long unused: almost surely a closed session, whose server
+                # side statements went with it
+                self._stmt_evicted.popitem(last=False)
+            cache = self._stmt_cache[conn_id] = OrderedDict()
+        if evicted:
+            # this connection is live and held by us: release its statements
+            for _, cursor in evicted.values():
+                with contextlib.suppress(Error):
+                    cursor.close()
+        return cache
+
+    def _template(self, key: Tuple[Any, ...], build: Callable[[], str]) -> str:
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            if len(self._sql_cache) >= _SQL_TEMPLATE_CACHE_SIZE:
+                self._sql_cache.clear()
+            sql = self._sql_cache.setdefault(key, build())
+        return sql
+
+    def _execute_prepared(self, sql: str, params: tuple) -> int:
+        """
+        Execute DML through a cached server-side prepared statement so only
+        the parameters cross the wire after the first call on a connection.
+        """
+        if not self._prepare:
+            return self.execute(sql, params)
+
+        try:
+            with self._get_connection() as conn:
+                cache = self._statements_for(conn)
+                entry = cache.get(sql)
+                if entry is None:
+                    # Keep the key object: some driver versions only skip the
+                    # re-prepare when the exact same str object is executed.
+                    entry = cache[sql] = (sql, conn.cursor(prepared=True))
+                    if len(cache) > _STMT_CACHE_SIZE:
+                        _, (_, evicted) = cache.popitem(last=False)
+                        evicted.close()
+                else:
+                    cache.move_to_end(sql)
+
+                stmt, cursor = entry
+                try:
+                    cursor.execute(stmt, params)
+                except Error:
+                    cache.pop(sql, None)
+                    with contextlib.suppress(Error):
+                        cursor.close()
+                    raise
+                rowcount = cursor.rowcount
+
+            self.logger.debug(f"MySQL prepared DML executed: {sql}")
+            return rowcount
+
         except Error as err:
-            self.logger.error(f"Failed to get MySQL connection from pool: {err}")
+            self.logger.error(f"MySQL modify operation failed: {err}")
             raise
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["MySQLTransaction"]:
+        """
+        Run several statements on one pooled connection in one transaction.
+
+        Statements issued through the yielded handle are not committed
+        individually; the transaction is committed once on exit and rolled
+        back if the block raises.
+
+            with connector.transaction() as tx:
+                for row in rows:
+                    tx.execute("INSERT INTO t (a) VALUES (%s)", (row,))
+        """
+        with self._get_connection() as conn:
+            conn.start_transaction()
+            try:
+                yield MySQLTransaction(conn)
+                conn.commit()
+            except BaseException:
+                try:
+                    conn.rollback()
+                except Error as err:
+                    self.logger.error(f"MySQL rollback failed: {err}")
+                raise
+
     def query(self, sql: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
         """
         Execute SELECT query and return results as list of dicts.
         """
-        conn = None
-        cursor = None
-
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(sql, params or ())
-            results = cursor.fetchall()
+            with self._get_connection() as conn:
+                results = _run_query(conn, sql, params)
 
             self.logger.debug(f"MySQL SELECT executed: {sql}")
+            if len(results) > _LARGE_RESULT_WARN_ROWS:
+                self.logger.warning(
+                    f"MySQL SELECT returned {len(results)} rows; use iter_query() to stream large results: {sql}"
+                )
             return results
 
         except Error as err:
             self.logger.error(f"MySQL query failed: {err}")
             raise
 
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
+    def iter_query(
+        self,
+        sql: str,
+        params: Optional[tuple] = None,
+        arraysize: int = 5000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream SELECT rows as dicts without materializing the result set.
+
+        Uses an unbuffered cursor and reads ``arraysize`` rows per
+        ``fetchmany`` call, so memory stays bounded by one chunk. The pooled
+        connection is held until the generator is exhausted or closed; any
+        unread rows are drained before it goes back to the pool.
+        """
+        if arraysize <= 0:
+            raise ValueError("arraysize must be positive")
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor(dictionary=True, buffered=False)
+                try:
+                    cursor.arraysize = arraysize
+                    cursor.execute(sql, params or ())
+                    while True:
+                        chunk = cursor.fetchmany(arraysize)
+                        if not chunk:
+                            break
+                        yield from chunk
+                finally:
+                    if conn.unread_result:
+                        conn.consume_results()
+                    cursor.close()
+
+            self.logger.debug(f"MySQL streaming SELECT executed: {sql}")
+
+        except Error as err:
+            self.logger.error(f"MySQL streaming query failed: {err}")
+            raise
 
     def execute(self, sql: str, params: Optional[tuple] = None) -> int:
         """
         Execute INSERT/UPDATE/DELETE and return affected row count.
-        """
-        conn = None
-        cursor = None
 
+        One-shot convenience: pooled connections run in autocommit mode, so
+        the statement is committed by the server without a separate COMMIT
+        round-trip. Use :meth:`transaction` to group several statements.
+        """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(sql, params or ())
-            conn.commit()
+            with self._get_connection() as conn:
+                rowcount = _run_execute(conn, sql, params)
 
             self.logger.debug(f"MySQL DML executed: {sql}")
-            return cursor.rowcount
+            return rowcount
 
         except Error as err:
             self.logger.error(f"MySQL modify operation failed: {err}")
             raise
 
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
+    def execute_many(
+        self,
+        sql: str,
+        params_iter: Iterable[Sequence[Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Execute the same INSERT/UPDATE/DELETE for many parameter tuples.
+
+        All batches run inside a single :meth:`transaction` and are committed
+        once at the end (rolled back on error). mysql-connector rewrites
+        simple ``INSERT ... VALUES`` statements into a single multi-row INSERT
+        per ``executemany`` call, so each batch costs roughly one round-trip.
+        Returns the total affected row count.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        total = 0
+        try:
+            with self.transaction() as tx, tx.conn.cursor() as cursor:
+                it = iter(params_iter)
+                while True:
+                    chunk = list(islice(it, batch_size))
+                    if not chunk:
+                        break
+                    cursor.executemany(sql, chunk)
+                    total += max(cursor.rowcount, 0)
+
+            self.logger.debug(f"MySQL bulk DML executed ({total} rows): {sql}")
+            return total
+
+        except Error as err:
+            self.logger.error(f"MySQL bulk modify operation failed: {err}")
+            raise
 
     def insert(self, table: str, data: Dict[str, Any]) -> int:
         """
         Helper for structured inserts.
         """
-        keys = ", ".join(data.keys())
-        placeholders = ", ".join(["%s"] * len(data))
-        sql = f"INSERT INTO {table} ({keys}) VALUES ({placeholders})"
-        return self.execute(sql, tuple(data.values()))
+        columns = tuple(data)
+        sql = self._template(("insert", table, columns), lambda: _insert_template(table, columns))
+        return self._execute_prepared(sql, tuple(data.values()))
+
+    def insert_many(
+        self,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Helper for bulk inserts. Columns are taken from the first row; every
+        row must provide the same keys.
+        """
+        split = _split_rows(rows)
+        if split is None:
+            return 0
+        columns, params = split
+        sql = self._template(("insert", table, columns), lambda: _insert_template(table, columns))
+        return self.execute_many(sql, params, batch_size=batch_size)
 
     def update(self, table: str, data: Dict[str, Any], where: str, where_params: tuple):
         """
         Helper for structured updates.
         """
-        set_clause = ", ".join([f"{k}=%s" for k in data])
-        sql = f"UPDATE {table} SET {set_clause} WHERE {where}"
+        columns = tuple(data)
+        sql = self._template(
+            ("update", table, columns, where),
+            lambda: f"UPDATE {table} SET {', '.join(f'{k}=%s' for k in columns)} WHERE {where}",
+        )
         params = tuple(data.values()) + where_params
-        return self.execute(sql, params)
+        return self._execute_prepared(sql, params)
 
     def delete(self, table: str, where: str, where_params: tuple):
         """
         Helper for structured deletes.
         """
-        sql = f"DELETE FROM {table} WHERE {where}"
-        return self.execute(sql, where_params)
+        sql = self._template(("delete", table, where), lambda: f"DELETE FROM {table} WHERE {where}")
+        return self._execute_prepared(sql, where_params)
+
+
+class AsyncMySQLConnector:
+    """
+    Asyncio MySQL connector on an aiomysql connection pool.
+
+    Accepts the same config dict as :class:`MySQLConnector` (plus an optional
+    ``pool_minsize``). Every call acquires its own pooled connection, so
+    coroutines may run concurrently; a single aiomysql connection must never
+    be shared between concurrent cursors.
+
+        db = AsyncMySQLConnector(config)
+        await db.start()
+        rows = await db.query("SELECT * FROM jobs WHERE id=%s", (1,))
+        await db.close()
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        if aiomysql is None:
+            raise RuntimeError("aiomysql not installed; install aiomysql to use AsyncMySQLConnector")
+        self.logger = OmniLogger("AsyncMySQLConnector")
+
+        self.config = config
+        self.pool = None
+        self._start_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Create the aiomysql pool (idempotent)."""
+        if self.pool is not None:
+            return
+        async with self._start_lock:
+            if self.pool is not None:
+                return
+            try:
+                self.pool = await aiomysql.create_pool(
+                    host=self.config["host"],
+                    port=self.config.get("port", 3306),
+                    user=self.config["user"],
+                    password=self.config["password"],
+                    db=self.config["database"],
+                    minsize=self.config.get("pool_minsize", 1),
+                    maxsize=self.config.get("pool_size", 5),
+                    autocommit=True,
+                )
+                self.logger.info("aiomysql connection pool initialized successfully.")
+            except aiomysql.Error as err:
+                self.logger.error(f"Failed to initialize aiomysql pool: {err}")
+                raise
+
+    async def close(self) -> None:
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+
+    async def __aenter__(self) -> "AsyncMySQLConnector":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Any]:
+        """
+        Yield a pooled aiomysql connection inside a transaction; committed on
+        exit, rolled back if the block raises.
+        """
+        await self.start()
+        async with self.pool.acquire() as conn:
+            await conn.begin()
+            try:
+                yield conn
+                await conn.commit()
+            except BaseException:
+                try:
+                    await conn.rollback()
+                except aiomysql.Error as err:
+                    self.logger.error(f"MySQL rollback failed: {err}")
+                raise
+
+    async def query(self, sql: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """
+        Execute SELECT query and return results as list of dicts.
+        """
+        await self.start()
+        try:
+            async with self.pool.acquire() as conn, conn.cursor(aiomysql.DictCursor) as cur:
+                await cur.execute(sql, params or ())
+                results = await cur.fetchall()
+
+            self.logger.debug(f"MySQL SELECT executed: {sql}")
+            return list(results)
+
+        except aiomysql.Error as err:
+            self.logger.error(f"MySQL query failed: {err}")
+            raise
+
+    async def execute(self, sql: str, params: Optional[tuple] = None) -> int:
+        """
+        Execute INSERT/UPDATE/DELETE (autocommit) and return affected row count.
+        """
+        await self.start()
+        try:
+            async with self.pool.acquire() as conn, conn.cursor() as cur:
+                await cur.execute(sql, params or ())
+                rowcount = cur.rowcount
+
+            self.logger.debug(f"MySQL DML executed: {sql}")
+            return rowcount
+
+        except aiomysql.Error as err:
+            self.logger.error(f"MySQL modify operation failed: {err}")
+            raise
+
+    async def execute_many(
+        self,
+        sql: str,
+        params_iter: Iterable[Sequence[Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Execute the same statement for many parameter tuples in one
+        transaction, ``batch_size`` tuples per ``executemany`` call.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        total = 0
+        try:
+            async with self.transaction() as conn, conn.cursor() as cur:
+                it = iter(params_iter)
+                while True:
+                    chunk = list(islice(it, batch_size))
+                    if not chunk:
+                        break
+                    await cur.executemany(sql, chunk)
+                    total += max(cur.rowcount, 0)
+
+            self.logger.debug(f"MySQL bulk DML executed ({total} rows): {sql}")
+            return total
+
+        except aiomysql.Error as err:
+            self.logger.error(f"MySQL bulk modify operation failed: {err}")
+            raise
+
+    async def insert_many(
+        self,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Helper for bulk inserts. Columns are taken from the first row.
+        """
+        split = _split_rows(rows)
+        if split is None:
+            return 0
+        columns, params = split
+        return await self.execute_many(_insert_template(table, columns), params, batch_size=batch_size)
+
+    async def gather_queries(
+        self,
+        statements: Iterable[Tuple[str, Optional[tuple]]],
+    ) -> List[Any]:
+        """
+        Run several SELECTs concurrently, one pooled connection per query.
+
+        Results are returned in input order; a failed query yields its
+        exception in place of its rows. Concurrency is bounded by the pool's
+        ``maxsize``.
+        """
+        await self.start()
+        return await asyncio.gather(
+            *(self.query(sql, params) for sql, params in statements),
+            return_exceptions=True,
+        )
 
 
 if __name__ == "__main__":
@@ -8,12 +8,17 @@ Production-ready, dependency-light Python connector for OpenAI-style HTTP APIs
 
 Features
 - Sync and async clients (auto-uses `requests` and `aiohttp` when available).
-- Optional integration with the official OpenAI Python SDK if installed.
+- Optional `httpx` transport for the sync client (HTTP/2 multiplexing when `h2` is installed).
+- Optional integration with the official OpenAI Python SDK if installed: each client
+  exposes a lazily created, per-instance SDK client via `.sdk` (the global `openai`
+  module is never reconfigured).
 - Environment-variable-driven configuration (OPENAI_API_KEY, OPENAI_BASE_URL, OPENAI_MODEL).
 - Sensible defaults for timeouts, retries, and exponential backoff with jitter.
 - Clear exceptions and small, well-documented surface for callers.
 - Support for streaming responses (async & sync) where the API offers chunked SSE or chunked JSON.
+- Concurrent fan-out of completions and batched/coalesced embedding requests (async).
 - Structured logging and optional metrics hook.
+- Fast JSON via `orjson` when installed (falls back to the stdlib `json`).
 - Minimal dependencies by default; good defaults for production.
 
 Notes
@@ -25,13 +30,17 @@ Notes
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
 import math
 import os
 import random
+import re
 import time
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from typing import Any, AsyncIterator, Callable, Dict, Generator, Iterator, List, Optional, Tuple
 
 # Optional third-party libraries — `requests` and `aiohttp` are used when available.
@@ -49,6 +58,22 @@ except Exception:  # pragma: no cover - optional import
     aiohttp = None
     AiohttpResponse = None  # type: ignore
 
+try:
+    import httpx  # type: ignore
+except ImportError:  # pragma: no cover - optional import
+    httpx = None
+
+try:
+    import h2  # type: ignore  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional import
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional import
+    orjson = None
+
 # Optionally support official openai package if installed
 try:
     import openai  # type: ignore
@@ -57,9 +82,36 @@ except Exception:
     openai = None  # type: ignore
     _HAS_OPENAI_SDK = False
 
+# uvloop helper shared with the other async connectors. The plain import
+# covers loading this file outside the package (e.g. from its directory).
+try:
+    from connectors._eventloop import use_uvloop  # type: ignore
+except ImportError:  # pragma: no cover - non-package import
+    from _eventloop import use_uvloop  # type: ignore
+
 logger = logging.getLogger("omniflow.connectors.openai")
 logger.addHandler(logging.NullHandler())
 
+# aiohttp connection pool sizing for AsyncOpenAIClient's shared session.
+_AIOHTTP_LIMIT = 100
+_AIOHTTP_LIMIT_PER_HOST = 32
+_AIOHTTP_KEEPALIVE_TIMEOUT = 75.0
+_AIOHTTP_DNS_CACHE_TTL = 300
+
+# Non-2xx bodies are only read this far (for error messages / logs); gateway
+# error pages can be large and are discarded on retry anyway.
+_ERROR_BODY_LIMIT = 4096
+
+# httpx pool sizing for OpenAIClient with transport="httpx".
+_HTTPX_MAX_CONNECTIONS = 128
+_HTTPX_MAX_KEEPALIVE = 64
+
+# Transport-level failures that warrant a retry, whichever sync transport is active.
+_TRANSPORT_ERRORS: Tuple[type, ...] = (
+    ((requests.RequestException,) if requests is not None else ())
+    + ((httpx.HTTPError,) if httpx is not None else ())
+)
+
 __all__ = [
     "OpenAIError",
     "OpenAIAuthError",
@@ -68,6 +120,7 @@ __all__ = [
     "OpenAIConnectorConfig",
     "OpenAIClient",
     "AsyncOpenAIClient",
+    "use_uvloop",
 ]
 
 
@@ -104,6 +157,11 @@ class OpenAIConnectorConfig:
       - OPENAI_MAX_RETRIES (default: 3)
       - OPENAI_BACKOFF_FACTOR (default: 0.6)
       - OPENAI_JITTER (default: 0.2)
+      - OPENAI_TRANSPORT (sync client backend: "requests" (default) or "httpx";
+        httpx multiplexes requests over HTTP/2 when `h2` is installed)
+      - OPENAI_EMBEDDING_MODEL (default: text-embedding-3-small)
+      - OPENAI_EMBED_BATCH_SIZE (inputs per /embeddings request; default: 96)
+      - OPENAI_EMBED_BUFFER_MS (AsyncOpenAIClient.embed coalescing window; default: 20)
     """
 
     api_key: Optional[str]
@@ -115,6 +173,10 @@ class OpenAIConnectorConfig:
     jitter: float = 0.2
     metrics_hook: Optional[Callable[[str, Dict[str, Any]], None]] = None
     default_headers: Optional[Dict[str, str]] = None
+    transport: str = "requests"
+    embedding_model: str = "text-embedding-3-small"
+    embed_batch_size: int = 96
+    embed_buffer_ms: float = 20.0
 
     @staticmethod
     def from_env(prefix: str = "OPENAI") -> "OpenAIConnectorConfig":
@@ -125,6 +187,12 @@ class OpenAIConnectorConfig:
         max_retries = int(os.getenv(f"{prefix}_MAX_RETRIES", os.getenv("OPENAI_MAX_RETRIES", "3")))
         backoff_factor = float(os.getenv(f"{prefix}_BACKOFF_FACTOR", os.getenv("OPENAI_BACKOFF_FACTOR", "0.6")))
         jitter = float(os.getenv(f"{prefix}_JITTER", os.getenv("OPENAI_JITTER", "0.2")))
+        transport = (os.getenv(f"{prefix}_TRANSPORT") or os.getenv("OPENAI_TRANSPORT") or "requests").lower()
+        embedding_model = (
+            os.getenv(f"{prefix}_EMBEDDING_MODEL") or os.getenv("OPENAI_EMBEDDING_MODEL") or "text-embedding-3-small"
+        )
+        embed_batch_size = int(os.getenv(f"{prefix}_EMBED_BATCH_SIZE", os.getenv("OPENAI_EMBED_BATCH_SIZE", "96")))
+        embed_buffer_ms = float(os.getenv(f"{prefix}_EMBED_BUFFER_MS", os.getenv("OPENAI_EMBED_BUFFER_MS", "20")))
         return OpenAIConnectorConfig(
             api_key=api_key,
             base_url=base_url.rstrip("/"),
@@ -133,17 +201,153 @@ class OpenAIConnectorConfig:
             max_retries=max_retries,
             backoff_factor=backoff_factor,
             jitter=jitter,
+            transport=transport,
+            embedding_model=embedding_model,
+            embed_batch_size=embed_batch_size,
+            embed_buffer_ms=embed_buffer_ms,
         )
 
 
+# ---- JSON codec ----
+if orjson is not None:
+    # Rust-backed; parses str or bytes and emits compact UTF-8 bytes directly.
+    # OPT_NON_STR_KEYS keeps json.dumps' int keys working (e.g. logit_bias).
+    _json_loads: Callable[[Any], Any] = orjson.loads
+
+    def _json_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _json_dumps(obj: Any) -> str:
+        return _json_bytes(obj).decode("utf-8")
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def _json_bytes(obj: Any) -> bytes:
+        return _json_dumps(obj).encode("utf-8")
+
+
 # ---- Helpers: backoff, metrics, headers ----
 def _compute_backoff(attempt: int, factor: float = 0.6, jitter: float = 0.2) -> float:
     """
     Exponential backoff with jitter. attempt is 0-based.
     """
-    base = factor * (2 ** attempt)
-    jitter_amt = base * jitter * (random.random() * 2 - 1)
-    return max(0.0, base + jitter_amt)
+    return _jittered(factor * (1 << attempt), jitter)
+
+
+@functools.lru_cache(maxsize=32)
+def _backoff_table(factor: float, max_retries: int) -> Tuple[float, ...]:
+    """Un-jittered backoff bases ``factor * 2**attempt`` for attempts 0..max_retries."""
+    return tuple(factor * (1 << i) for i in range(max_retries + 1))
+
+
+def _jittered(base: float, jitter: float) -> float:
+    """Apply symmetric +/-jitter (as a fraction of base) with a single RNG call."""
+    return max(0.0, base + base * random.uniform(-jitter, jitter))
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset_duration(value: str) -> Optional[float]:
+    """Parse OpenAI reset durations such as "20ms", "1.5s" or "1m30s"."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(num) * _DURATION_UNITS[unit] for num, unit in parts)
+
+
+def _retry_after_seconds(headers: Any) -> Optional[float]:
+    """
+    Seconds to wait before retrying a 429, derived from response headers.
+
+    ``retry-after-ms`` / ``Retry-After`` (delta-seconds or HTTP-date) are
+    authoritative. Otherwise ``x-ratelimit-reset-requests`` /
+    ``x-ratelimit-reset-tokens`` are used: the reset of whichever limit is
+    exhausted (``x-ratelimit-remaining-* == 0``), else the soonest reset.
+    Returns None when no usable hint is present.
+    """
+    if headers is None:
+        return None
+    retry_ms = headers.get("retry-after-ms")
+    if retry_ms:
+        try:
+            return max(0.0, float(retry_ms) / 1000.0)
+        except ValueError:
+            pass
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+                return max(0.0, when.timestamp() - time.time())
+            except (TypeError, ValueError, IndexError):
+                pass
+
+    exhausted: List[float] = []
+    resets: List[float] = []
+    for kind in ("requests", "tokens"):
+        raw = headers.get(f"x-ratelimit-reset-{kind}")
+        if not raw:
+            continue
+        seconds = _parse_reset_duration(raw)
+        if seconds is None or seconds <= 0:
+            continue
+        resets.append(seconds)
+        if (headers.get(f"x-ratelimit-remaining-{kind}") or "").strip() == "0":
+            exhausted.append(seconds)
+    if exhausted:
+        return max(exhausted)
+    return min(resets) if resets else None
+
+
+def _retry_delay(
+    cfg: OpenAIConnectorConfig,
+    bases: Tuple[float, ...],
+    attempt: int,
+    status: Optional[int] = None,
+    headers: Any = None,
+) -> Optional[float]:
+    """
+    Shared retry policy for both clients. ``status=None`` means a transport
+    exception. Returns None to stop, else the seconds to sleep before the
+    next attempt.
+
+    Transport errors and 5xx back off exponentially; 429 waits for the
+    larger of the server's rate-limit hint and the backoff (a single sleep,
+    never both in sequence). Any other status is not retried.
+    """
+    if attempt >= cfg.max_retries:
+        return None
+    if status is not None and status != 429 and not 500 <= status < 600:
+        return None
+    wait = _jittered(bases[attempt], cfg.jitter)
+    if status == 429:
+        hint = _retry_after_seconds(headers)
+        if hint is not None and hint > wait:
+            wait = hint
+    return wait
+
+
+def _status_error(status: int, text: str) -> OpenAIError:
+    """Exception for a non-2xx response that will not be retried."""
+    if status in (401, 403):
+        return OpenAIAuthError(f"authentication failed: {status} - {text}")
+    if status == 429:
+        return OpenAIRateLimitError(f"rate limited: {status}")
+    if 500 <= status < 600:
+        return OpenAIAPIError(f"server error: {status} - {text}")
+    return OpenAIAPIError(f"api error: {status} - {text}")
 
 
 def _default_metrics_hook(event: str, payload: Dict[str, Any]) -> None:  # pragma: no cover - trivial
@@ -159,11 +363,47 @@ def _build_auth_headers(cfg: OpenAIConnectorConfig) -> Dict[str, str]:
     return hdrs
 
 
+def _encode_body(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload once; the bytes are reused across retries."""
+    return _json_bytes(payload)
+
+
 # ---- Response normalization helpers ----
+_LEGACY_KEYS = ("text", "completion", "message", "content")
+
+
+def _extract_delta_content(obj: Any) -> Optional[str]:
+    """
+    Streaming fast path: ``choices[0].delta.content`` per the OpenAI chunk
+    contract, or None if the chunk has another shape.
+    """
+    try:
+        content = obj["choices"][0]["delta"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return content if type(content) is str else None
+
+
 def _extract_text_from_response(body: Any) -> str:
     """
     Try to extract readable text from common OpenAI-like response shapes.
     """
+    # Fast path for the common chat shape: choices[0].message/delta.content.
+    if type(body) is dict:
+        choices = body.get("choices")
+        if type(choices) is list and choices:
+            first = choices[0]
+            if type(first) is dict:
+                msg = first.get("message") or first.get("delta")
+                if type(msg) is dict:
+                    content = msg.get("content")
+                    if type(content) is str and content:
+                        return content
+    return _extract_text_generic(body)
+
+
+def _extract_text_generic(body: Any) -> str:
+    """Shape-agnostic fallback for :func:`_extract_text_from_response`."""
     if body is None:
         return ""
     if isinstance(body, str):
@@ -181,35 +421,109 @@ def _extract_text_from_response(body: Any) -> str:
                     if isinstance(content, str):
                         return content
                 # legacy text
-                for key in ("text", "completion", "message", "content"):
+                for key in _LEGACY_KEYS:
                     if key in first and isinstance(first[key], str):
                         return first[key]
             # fallback to stringifying first choice
             try:
-                return json.dumps(first)
+                return _json_dumps(first)
             except Exception:
                 return str(first)
         # direct fields
-        for k in ("text", "completion", "message", "content"):
+        for k in _LEGACY_KEYS:
             v = body.get(k)
             if isinstance(v, str):
                 return v
         # last resort: pretty JSON
         try:
-            return json.dumps(body)
+            return _json_dumps(body)
         except Exception:
             return str(body)
     # fallback
     try:
-        return json.dumps(body)
+        return _json_dumps(body)
     except Exception:
         return str(body)
 
 
-# ---- Sync client (requests) ----
+def _new_sdk_client(cfg: OpenAIConnectorConfig, factory_name: str) -> Any:
+    """Instantiate an SDK client object (``openai.OpenAI`` / ``openai.AsyncOpenAI``) for ``cfg``."""
+    factory = getattr(openai, factory_name, None) if _HAS_OPENAI_SDK else None
+    if factory is None:
+        raise OpenAIError(f"openai SDK >= 1.0 (openai.{factory_name}) is required for .sdk")
+    return factory(
+        api_key=cfg.api_key,
+        base_url=cfg.base_url,
+        timeout=cfg.timeout,
+        max_retries=cfg.max_retries,
+        default_headers=cfg.default_headers,
+    )
+
+
+# ---- Streaming (SSE / NDJSON) framing ----
+_SSE_DONE = object()
+
+
+def _sse_payload(line: bytes) -> Any:
+    """
+    Frame one raw stream line: None for blank lines, ``_SSE_DONE`` for the
+    ``[DONE]`` sentinel, otherwise the payload bytes with any ``data:``
+    prefix removed. Nothing is decoded.
+    """
+    line = line.strip()
+    if line.startswith(b"data:"):
+        line = line[5:].lstrip()
+    if not line:
+        return None
+    if line == b"[DONE]":
+        return _SSE_DONE
+    return line
+
+
+def _chunk_text(data: bytes) -> str:
+    """Text of one stream payload (the raw payload if it is not JSON)."""
+    try:
+        obj = _json_loads(data)
+    except Exception:
+        return data.decode("utf-8", errors="replace")
+    text = _extract_delta_content(obj)
+    return text if text is not None else _extract_text_from_response(obj)
+
+
+def _sse_text(line: bytes) -> Any:
+    """:func:`_sse_payload` followed by :func:`_chunk_text` for data lines."""
+    data = _sse_payload(line)
+    if data is None or data is _SSE_DONE:
+        return data
+    return _chunk_text(data)
+
+
+def _parse_body(raw: bytes) -> Any:
+    """Decode a 2xx response body: JSON when possible, else ``{"raw": text}``."""
+    if not raw.strip():
+        return None
+    try:
+        return _json_loads(raw)
+    except Exception:
+        return {"raw": raw.decode("utf-8", errors="replace")}
+
+
+def _iter_byte_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Re-frame a byte-chunk stream into lines without decoding."""
+    buf = b""
+    for chunk in chunks:
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        yield from lines
+    if buf:
+        yield buf
+
+
+# ---- Sync client (requests / httpx) ----
 class OpenAIClient:
     """
-    Synchronous OpenAI connector using `requests`.
+    Synchronous OpenAI connector using a `requests` Session, or an
+    `httpx.Client` (HTTP/2 when available) when `cfg.transport == "httpx"`.
 
     Example:
         cfg = OpenAIConnectorConfig.from_env()
@@ -221,78 +535,117 @@ class OpenAIClient:
     def __init__(self, cfg: OpenAIConnectorConfig):
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
-        if requests is None:
+        self._headers = _build_auth_headers(cfg)
+        self._backoff_bases = _backoff_table(cfg.backoff_factor, cfg.max_retries)
+        self._session = None
+        self._httpx = cfg.transport == "httpx"
+        if self._httpx:
+            if httpx is None:
+                raise OpenAIError("`httpx` package is required for transport='httpx' but not installed.")
+            self._session = httpx.Client(
+                http2=_HTTP2_AVAILABLE,
+                headers=self._headers,
+                limits=httpx.Limits(
+                    max_connections=_HTTPX_MAX_CONNECTIONS,
+                    max_keepalive_connections=_HTTPX_MAX_KEEPALIVE,
+                ),
+                timeout=cfg.timeout,
+            )
+        elif requests is None:
             logger.warning("`requests` not installed — OpenAIClient will not function without it.")
-        # If openai SDK present and api_key set, configure it optionally so users can call directly.
-        if _HAS_OPENAI_SDK and cfg.api_key:
-            try:
-                # Configure the SDK to use provided key & base_url if needed
-                openai.api_key = cfg.api_key
-                # Some SDK versions expose api_base
-                if hasattr(openai, "api_base"):
-                    openai.api_base = cfg.base_url
-            except Exception:
-                logger.debug("Failed to configure openai SDK from connector", exc_info=True)
+        else:
+            # One keep-alive session per client: auth headers are built once and
+            # connections are reused instead of a TCP+TLS handshake per call.
+            self._session = requests.Session()
+            self._session.headers.update(self._headers)
+        self._sdk: Any = None
+
+    @property
+    def sdk(self) -> Any:
+        """Per-client ``openai.OpenAI`` instance, created on first access."""
+        if self._sdk is None:
+            self._sdk = _new_sdk_client(self.cfg, "OpenAI")
+        return self._sdk
+
+    def _send(self, url: str, body: bytes, stream: bool) -> Any:
+        """
+        Dispatch one POST on the configured transport.
 
-    def _request(self, path: str, payload: Dict[str, Any], stream: bool = False) -> RequestsResponse:
-        if requests is None:
+        The response is always opened in streaming mode so the status can be
+        checked before the body is read: 2xx bodies are then read in full
+        (unless the caller streams), non-2xx bodies only up to
+        ``_ERROR_BODY_LIMIT`` bytes via :meth:`_error_text`.
+        """
+        if self._httpx:
+            resp = self._session.send(self._session.build_request("POST", url, content=body), stream=True)
+        else:
+            resp = self._session.post(url, data=body, timeout=self.cfg.timeout, stream=True)
+        if not stream and 200 <= resp.status_code < 300:
+            if self._httpx:
+                resp.read()
+            else:
+                resp.content  # noqa: B018 - load the body while retries still apply
+        return resp
+
+    def _error_text(self, resp: Any) -> str:
+        """Read at most ``_ERROR_BODY_LIMIT`` bytes of an error body, then close it."""
+        try:
+            chunks = resp.iter_bytes(_ERROR_BODY_LIMIT) if self._httpx else resp.iter_content(_ERROR_BODY_LIMIT)
+            head = next(iter(chunks), b"")
+        except Exception:
+            head = b""
+        finally:
+            resp.close()
+        return head[:_ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+
+    def _request(self, path: str, payload: Dict[str, Any], stream: bool = False) -> Any:
+        if self._session is None:
             raise OpenAIError("`requests` is required for OpenAIClient but is not installed.")
         url = f"{self.cfg.base_url.rstrip('/')}/{path.lstrip('/')}"
-        headers = _build_auth_headers(self.cfg)
-        attempt = 0
+        body = _encode_body(payload)
         last_exc: Optional[Exception] = None
 
-        while attempt <= self.cfg.max_retries:
+        for attempt in range(self.cfg.max_retries + 1):
             start = time.time()
             try:
-                resp = requests.post(url, headers=headers, json=payload, timeout=self.cfg.timeout, stream=stream)
-            except requests.RequestException as exc:
+                resp = self._send(url, body, stream)
+            except _TRANSPORT_ERRORS as exc:
                 last_exc = exc
-                wait = _compute_backoff(attempt, self.cfg.backoff_factor, self.cfg.jitter)
-                logger.warning("OpenAIClient request exception (attempt %d): %s — retrying after %.2fs", attempt + 1, exc, wait)
                 self.metrics("request_exception", {"attempt": attempt + 1, "error": str(exc)})
-                if attempt >= self.cfg.max_retries:
+                wait = _retry_delay(self.cfg, self._backoff_bases, attempt)
+                if wait is None:
                     break
+                logger.warning("OpenAIClient request exception (attempt %d): %s — retrying after %.2fs", attempt + 1, exc, wait)
                 time.sleep(wait)
-                attempt += 1
                 continue
 
+            status = resp.status_code
             latency = time.time() - start
-            self.metrics("request_completed", {"path": path, "status": resp.status_code, "latency": latency, "attempt": attempt + 1})
+            self.metrics("request_completed", {"path": path, "status": status, "latency": latency, "attempt": attempt + 1})
 
-            if 200 <= resp.status_code < 300:
+            if 200 <= status < 300:
                 return resp
-            if resp.status_code in (401, 403):
-                raise OpenAIAuthError(f"authentication failed: {resp.status_code} - {resp.text}")
-            if resp.status_code == 429:
-                # Rate limited
-                retry_after = resp.headers.get("Retry-After")
+            text = self._error_text(resp)
+            if status == 429:
                 self.metrics("rate_limited", {"attempt": attempt + 1, "status": 429})
-                if retry_after:
-                    try:
-                        time.sleep(float(retry_after))
-                    except Exception:
-                        pass
-                if attempt >= self.cfg.max_retries:
-                    raise OpenAIRateLimitError(f"rate limited: {resp.status_code}",)
-                wait = _compute_backoff(attempt, self.cfg.backoff_factor, self.cfg.jitter)
-                time.sleep(wait)
-                attempt += 1
-                continue
-            if 500 <= resp.status_code < 600:
-                # Server error — retry
-                if attempt >= self.cfg.max_retries:
-                    raise OpenAIAPIError(f"server error: {resp.status_code} - {resp.text}")
-                wait = _compute_backoff(attempt, self.cfg.backoff_factor, self.cfg.jitter)
-                logger.warning("Server error %d — retrying after %.2fs", resp.status_code, wait)
-                time.sleep(wait)
-                attempt += 1
-                continue
-            # Other 4xx errors considered permanent
-            raise OpenAIAPIError(f"api error: {resp.status_code} - {resp.text}")
+            wait = _retry_delay(self.cfg, self._backoff_bases, attempt, status, resp.headers)
+            if wait is None:
+                raise _status_error(status, text)
+            logger.warning("OpenAI HTTP %d — retrying after %.2fs", status, wait)
+            time.sleep(wait)
 
         raise OpenAIError(f"request failed after {self.cfg.max_retries} retries: {last_exc!s}")
 
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def create_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a completion/chat call synchronously.
@@ -304,10 +657,7 @@ class OpenAIClient:
         # Choose path: chat completions if messages present, else completions
         path = "chat/completions" if "messages" in payload else "completions"
         resp = self._request(path, payload, stream=False)
-        try:
-            body = resp.json()
-        except Exception:
-            body = {"raw": resp.text}
+        body = _parse_body(resp.content)
         text = _extract_text_from_response(body)
         return {"status_code": resp.status_code, "body": body, "text": text}
 
@@ -331,23 +681,14 @@ class OpenAIClient:
         # There are different streaming formats: SSE or newline-delimited JSON.
         # We'll read iter_lines and attempt to parse JSON chunks where possible.
         try:
-            for raw in resp.iter_lines(decode_unicode=True):
-                if not raw:
+            lines = _iter_byte_lines(resp.iter_bytes()) if self._httpx else resp.iter_lines()
+            for raw in lines:
+                text = _sse_text(raw)
+                if text is None:
                     continue
-                line = raw.strip()
-                # Remove SSE prefix if present: "data: "
-                if line.startswith("data:"):
-                    line = line[len("data:"):].strip()
-                if line == "[DONE]":
+                if text is _SSE_DONE:
                     break
-                # Try parse JSON
-                try:
-                    obj = json.loads(line)
-                    text = _extract_text_from_response(obj)
-                    yield text
-                except Exception:
-                    # Not JSON — yield raw line
-                    yield line
+                yield text
         finally:
             try:
                 resp.close()
@@ -355,11 +696,74 @@ class OpenAIClient:
                 pass
 
 
+def _embeddings_from_body(body: Any) -> List[List[float]]:
+    """Return the vectors of an /embeddings response in input order."""
+    data = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(data, list):
+        raise OpenAIAPIError(f"unexpected embeddings response: {body!r}")
+    return [item["embedding"] for item in sorted(data, key=lambda item: item.get("index", 0))]
+
+
+class _EmbeddingBatcher:
+    """
+    Dataloader-style coalescing for AsyncOpenAIClient.embed().
+
+    Inputs submitted within ``buffer_ms`` of the first pending one (or until
+    ``max_batch`` are queued) are sent as a single /embeddings request and
+    each caller's future resolves to its own vector.
+    """
+
+    def __init__(self, client: "AsyncOpenAIClient", model: str, buffer_ms: float, max_batch: int):
+        self._client = client
+        self._model = model
+        self._delay = max(0.0, buffer_ms) / 1000.0
+        self._max_batch = max(1, max_batch)
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, text: str) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((text, fut))
+        if len(self._pending) >= self._max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._delay, self.flush)
+        return fut
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self._client._spawn(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            vectors = await self._client.create_embeddings([text for text, _ in batch], model=self._model)
+            if len(vectors) != len(batch):
+                raise OpenAIAPIError(f"embeddings response has {len(vectors)} vectors for {len(batch)} inputs")
+        except Exception as exc:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), vector in zip(batch, vectors):
+            if not fut.done():
+                fut.set_result(vector)
+
+
 # ---- Async client (aiohttp) ----
 class AsyncOpenAIClient:
     """
     Asynchronous OpenAI connector using `aiohttp`.
 
+    aiohttp runs noticeably faster (especially TLS) on uvloop. The client does
+    not touch the loop policy itself; `default_async_openai_client_from_env()`
+    installs uvloop when available, or call `use_uvloop()` before starting
+    the loop.
+
     Example:
         cfg = OpenAIConnectorConfig.from_env()
         client = AsyncOpenAIClient(cfg)
@@ -370,25 +774,50 @@ class AsyncOpenAIClient:
     def __init__(self, cfg: OpenAIConnectorConfig):
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
+        self._backoff_bases = _backoff_table(cfg.backoff_factor, cfg.max_retries)
         if aiohttp is None:
             logger.warning("`aiohttp` not installed — AsyncOpenAIClient will not function without it.")
-        # configure SDK if present
-        if _HAS_OPENAI_SDK and cfg.api_key:
-            try:
-                openai.api_key = cfg.api_key
-                if hasattr(openai, "api_base"):
-                    openai.api_base = cfg.base_url
-            except Exception:
-                logger.debug("Failed to configure openai SDK from async connector", exc_info=True)
+        self._sdk: Any = None
         self._session: Optional[aiohttp.ClientSession] = None
+        self._embed_batchers: Dict[str, _EmbeddingBatcher] = {}
+        self._tasks: set = set()
+
+    @property
+    def sdk(self) -> Any:
+        """Per-client ``openai.AsyncOpenAI`` instance, created on first access."""
+        if self._sdk is None:
+            self._sdk = _new_sdk_client(self.cfg, "AsyncOpenAI")
+        return self._sdk
+
+    def _spawn(self, coro) -> None:
+        # Keep a strong reference so background flushes are not GC'd mid-flight.
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     async def _session_or_new(self) -> aiohttp.ClientSession:
-        if self._session is None:
-            headers = _build_auth_headers(self.cfg)
-            self._session = aiohttp.ClientSession(headers=headers)
+        if self._session is None or self._session.closed:
+            # One session with a keep-alive connector per client, so TLS
+            # connections are reused across requests and retries.
+            connector = aiohttp.TCPConnector(
+                limit=_AIOHTTP_LIMIT,
+                limit_per_host=_AIOHTTP_LIMIT_PER_HOST,
+                keepalive_timeout=_AIOHTTP_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=_AIOHTTP_DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=_build_auth_headers(self.cfg),
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.cfg.timeout),
+                json_serialize=_json_dumps,
+            )
         return self._session
 
     async def close(self) -> None:
+        for batcher in self._embed_batchers.values():
+            batcher.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
         if self._session:
             await self._session.close()
             self._session = None
@@ -398,64 +827,45 @@ class AsyncOpenAIClient:
             raise OpenAIError("`aiohttp` is required for AsyncOpenAIClient but is not installed.")
         url = f"{self.cfg.base_url.rstrip('/')}/{path.lstrip('/')}"
         session = await self._session_or_new()
-        attempt = 0
+        body = _encode_body(payload)
         last_exc: Optional[Exception] = None
 
-        while attempt <= self.cfg.max_retries:
+        for attempt in range(self.cfg.max_retries + 1):
             start = time.time()
             try:
-                resp = await session.post(url, json=payload, timeout=self.cfg.timeout, ssl=True)
-                # If streaming requested, we will return response object for caller to stream manually
-                if stream:
-                    return resp.status, None, resp
-                text = await resp.text()
+                resp = await session.post(url, data=body)
+                if 200 <= resp.status < 300:
+                    # If streaming requested, return the response for the caller to stream
+                    if stream:
+                        return resp.status, None, resp
+                    raw = await resp.read()
+                else:
+                    # Bounded read for the error message; the rest is dropped.
+                    raw = await resp.content.read(_ERROR_BODY_LIMIT)
+                    resp.release()
             except Exception as exc:
                 last_exc = exc
-                wait = _compute_backoff(attempt, self.cfg.backoff_factor, self.cfg.jitter)
-                logger.warning("AsyncOpenAIClient request exception (attempt %d): %s — retrying after %.2fs", attempt + 1, exc, wait)
                 self.metrics("request_exception", {"attempt": attempt + 1, "error": str(exc)})
-                if attempt >= self.cfg.max_retries:
+                wait = _retry_delay(self.cfg, self._backoff_bases, attempt)
+                if wait is None:
                     break
+                logger.warning("AsyncOpenAIClient request exception (attempt %d): %s — retrying after %.2fs", attempt + 1, exc, wait)
                 await asyncio.sleep(wait)
-                attempt += 1
                 continue
 
+            status = resp.status
             latency = time.time() - start
-            self.metrics("request_completed", {"path": path, "status": resp.status, "latency": latency, "attempt": attempt + 1})
+            self.metrics("request_completed", {"path": path, "status": status, "latency": latency, "attempt": attempt + 1})
 
-            if 200 <= resp.status < 300:
-                try:
-                    body = json.loads(text) if text else None
-                except Exception:
-                    body = {"raw": text}
-                return resp.status, body, None
-            if resp.status in (401, 403):
-                raise OpenAIAuthError(f"authentication failed: {resp.status} - {text}")
-            if resp.status == 429:
-                retry_after = resp.headers.get("Retry-After")
+            if 200 <= status < 300:
+                return status, _parse_body(raw), None
+            if status == 429:
                 self.metrics("rate_limited", {"attempt": attempt + 1, "status": 429})
-                if retry_after:
-                    try:
-                        await asyncio.sleep(float(retry_after))
-                    except Exception:
-                        pass
-                if attempt >= self.cfg.max_retries:
-                    raise OpenAIRateLimitError(f"rate limited: {resp.status}")
-                wait = _compute_backoff(attempt, self.cfg.backoff_factor, self.cfg.jitter)
-                await asyncio.sleep(wait)
-                attempt += 1
-                continue
-            if 500 <= resp.status < 600:
-                if attempt >= self.cfg.max_retries:
-                    # try to return body text for debugging
-                    raise OpenAIAPIError(f"server error: {resp.status} - {text}")
-                wait = _compute_backoff(attempt, self.cfg.backoff_factor, self.cfg.jitter)
-                logger.warning("Server error %d — retrying after %.2fs", resp.status, wait)
-                await asyncio.sleep(wait)
-                attempt += 1
-                continue
-            # Other 4xx
-            raise OpenAIAPIError(f"api error: {resp.status} - {text}")
+            wait = _retry_delay(self.cfg, self._backoff_bases, attempt, status, resp.headers)
+            if wait is None:
+                raise _status_error(status, raw.decode("utf-8", errors="replace"))
+            logger.warning("OpenAI HTTP %d — retrying after %.2fs", status, wait)
+            await asyncio.sleep(wait)
 
         raise OpenAIError(f"async request failed after {self.cfg.max_retries} retries: {last_exc!s}")
 
@@ -465,51 +875,86 @@ class AsyncOpenAIClient:
         text = _extract_text_from_response(body)
         return {"status_code": status, "body": body, "text": text}
 
-    async def create_completion_stream(self, payload: Dict[str, Any], on_chunk: Optional[Callable[[str], None]] = None) -> AsyncIterator[str]:
+    async def create_completions(
+        self,
+        payloads: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+    ) -> List[Any]:
         """
-        Asynchronous streaming generator. Yields chunks of text as strings.
+        Run several completions concurrently over the shared session.
 
-        The connector attempts to read chunked responses from the server (SSE or chunked JSON).
-        `on_chunk` can be provided to receive each chunk as it arrives.
+        Results are returned in input order; a failed call yields its
+        exception in place of the result dict. ``concurrency`` optionally
+        caps the number of in-flight requests.
+        """
+        if concurrency is None:
+            calls = [self.create_completion(p) for p in payloads]
+        else:
+            sem = asyncio.Semaphore(max(1, concurrency))
+
+            async def _bounded(p: Dict[str, Any]) -> Dict[str, Any]:
+                async with sem:
+                    return await self.create_completion(p)
+
+            calls = [_bounded(p) for p in payloads]
+        return await asyncio.gather(*calls, return_exceptions=True)
+
+    async def create_embeddings(self, inputs: List[str], model: Optional[str] = None) -> List[List[float]]:
+        """Embed ``inputs`` with a single /embeddings request; vectors in input order."""
+        payload = {"model": model or self.cfg.embedding_model, "input": list(inputs)}
+        _, body, _ = await self._request_async("embeddings", payload, stream=False)
+        return _embeddings_from_body(body)
+
+    async def create_embeddings_batched(
+        self,
+        inputs: List[str],
+        batch_size: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> List[List[float]]:
+        """
+        Embed many inputs with one request per ``batch_size`` slice (default
+        ``cfg.embed_batch_size``), issuing the slices concurrently.
+        """
+        size = max(1, batch_size or self.cfg.embed_batch_size)
+        batches = [inputs[i:i + size] for i in range(0, len(inputs), size)]
+        results = await asyncio.gather(*(self.create_embeddings(b, model=model) for b in batches))
+        return [vector for batch in results for vector in batch]
+
+    async def embed(self, text: str, model: Optional[str] = None) -> List[float]:
+        """
+        Embed a single input, coalescing with concurrent ``embed`` calls.
+
+        Calls made within ``cfg.embed_buffer_ms`` of each other (up to
+        ``cfg.embed_batch_size``) share one /embeddings request.
+        """
+        model = model or self.cfg.embedding_model
+        batcher = self._embed_batchers.get(model)
+        if batcher is None:
+            batcher = self._embed_batchers[model] = _EmbeddingBatcher(
+                self, model, self.cfg.embed_buffer_ms, self.cfg.embed_batch_size
+            )
+        return await batcher.submit(text)
+
+    async def iter_raw_sse(self, payload: Dict[str, Any]) -> AsyncIterator[bytes]:
+        """
+        Stream a completion as raw event payloads (the bytes after ``data:``),
+        undecoded, stopping at ``[DONE]``. Suited to proxies that forward SSE.
         """
         path = "chat/completions" if "messages" in payload else "completions"
         status, _, resp = await self._request_async(path, payload, stream=True)
         if resp is None:
             return
-            yield  # maintain generator type
 
-        # Aiohttp streaming approach: iterate over content chunks and attempt to parse JSON per line.
+        # aiohttp's StreamReader iterates line by line (readline), so SSE
+        # frames split across TCP chunks arrive whole.
         try:
             async for raw in resp.content:
-                if not raw:
+                data = _sse_payload(raw)
+                if data is None:
                     continue
-                try:
-                    s = raw.decode("utf-8")
-                except Exception:
-                    s = raw.decode("utf-8", errors="ignore")
-                # break into lines if server sends newline-delimited chunks
-                for line in s.splitlines():
-                    if not line:
-                        continue
-                    # strip SSE prefix "data: "
-                    part = line.strip()
-                    if part.startswith("data:"):
-                        part = part[len("data:"):].strip()
-                    if part == "[DONE]":
-                        return
-                    # try parse JSON
-                    try:
-                        obj = json.loads(part)
-                        text = _extract_text_from_response(obj)
-                    except Exception:
-                        # not JSON, yield raw text
-                        text = part
-                    if on_chunk:
-                        try:
-                            on_chunk(text)
-                        except Exception:
-                            logger.exception("on_chunk handler raised")
-                    yield text
+                if data is _SSE_DONE:
+                    return
+                yield data
         finally:
             try:
                 await resp.release()
@@ -519,6 +964,31 @@ class AsyncOpenAIClient:
                 except Exception:
                     pass
 
+    async def iter_deltas(self, payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream a completion as text deltas (``choices[0].delta.content``;
+        other chunk shapes fall back to the generic text extraction).
+        """
+        async with contextlib.aclosing(self.iter_raw_sse(payload)) as frames:
+            async for data in frames:
+                yield _chunk_text(data)
+
+    async def create_completion_stream(self, payload: Dict[str, Any], on_chunk: Optional[Callable[[str], None]] = None) -> AsyncIterator[str]:
+        """
+        Asynchronous streaming generator. Yields chunks of text as strings.
+
+        The connector attempts to read chunked responses from the server (SSE or chunked JSON).
+        `on_chunk` can be provided to receive each chunk as it arrives.
+        """
+        async with contextlib.aclosing(self.iter_deltas(payload)) as deltas:
+            async for text in deltas:
+                if on_chunk:
+                    try:
+                        on_chunk(text)
+                    except Exception:
+                        logger.exception("on_chunk handler raised")
+                yield text
+
     async def __aenter__(self):
         await self._session_or_new()
         return self
@@ -536,6 +1006,12 @@ def default_openai_client_from_env() -> OpenAIClient:
 
 
 def default_async_openai_client_from_env() -> AsyncOpenAIClient:
+    """
+    Build an AsyncOpenAIClient from the environment, installing uvloop first
+    when it is available (set OMNIFLOW_OPENAI_UVLOOP=0 to opt out).
+    """
+    if os.getenv("OMNIFLOW_OPENAI_UVLOOP", "1").lower() not in ("0", "false", "no"):
+        use_uvloop()
     cfg = OpenAIConnectorConfig.from_env()
     if cfg.api_key is None and not _HAS_OPENAI_SDK:
         logger.warning("No OPENAI_API_KEY set and OpenAI SDK not present — calls may fail without credentials.")
@@ -26,19 +26,26 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import itertools
 import json
 import logging
 import math
 import os
 import random
+import socket
+import threading
 import time
+import weakref
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Optional imports
 try:
     import psycopg2  # type: ignore
     import psycopg2.extras  # type: ignore
+    from psycopg2.pool import PoolError as PsycoPoolError  # type: ignore
     from psycopg2.pool import ThreadedConnectionPool as PsycoThreadedPool  # type: ignore
 except Exception:
     psycopg2 = None
@@ -49,6 +56,11 @@ try:
 except Exception:
     asyncpg = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional import
+    orjson = None
+
 logger = logging.getLogger("omniflow.connectors.postgresql")
 logger.addHandler(logging.NullHandler())
 
@@ -59,6 +71,7 @@ __all__ = [
     "PostgresConfig",
     "SyncPostgresClient",
     "AsyncPostgresClient",
+    "default_config_from_env",
     "default_sync_client_from_env",
     "default_async_client_from_env",
 ]
@@ -95,7 +108,23 @@ class PostgresConfig:
       - PG_MAX_POOL (default: 10)
       - PG_CONNECT_TIMEOUT (seconds, default: 10)
       - PG_MAX_RETRIES (retry transient errors, default: 3)
-      - PG_BACKOFF_FACTOR (exponential backoff base seconds, default: 0.2)
+      - PG_BACKOFF_FACTOR (backoff base seconds, default: 0.2)
+      - PG_BACKOFF_CAP (maximum backoff sleep in seconds, default: 30)
+      - PG_STATEMENT_CACHE_SIZE (asyncpg per-connection prepared statement
+        cache; default: 100, use 0 behind pgbouncer in transaction mode)
+      - PG_POOL_SHARDS (split the psycopg2 pool into N independently locked
+        sub-pools; default: 1)
+      - PG_HEALTH_TTL (seconds a successful healthcheck is reused; default: 1,
+        0 disables)
+      - PG_KEEPALIVES_IDLE / PG_KEEPALIVES_INTERVAL / PG_KEEPALIVES_COUNT
+        (TCP keepalive probing of pooled sockets; defaults: 30s / 10s / 3,
+        idle 0 disables)
+      - PG_TCP_USER_TIMEOUT (ms unacknowledged data may stay in flight before
+        the socket is dropped; default: 30000, 0 leaves the OS default)
+      - PG_IDLE_CHECK (seconds idle after which a pooled connection is pinged
+        before use; asyncpg closes it instead; default: 30, 0 disables)
+      - PG_CONN_MAX_AGE (seconds after which a sync pooled connection is
+        closed and replaced; default: 1800, 0 disables)
     """
 
     dsn: Optional[str] = None
@@ -109,8 +138,68 @@ class PostgresConfig:
     connect_timeout: float = 10.0
     max_retries: int = 3
     backoff_factor: float = 0.2
+    backoff_cap: float = 30.0
+    statement_cache_size: int = 100
+    pool_shards: int = 1
+    health_ttl: float = 1.0
+    keepalives_idle: int = 30
+    keepalives_interval: int = 10
+    keepalives_count: int = 3
+    tcp_user_timeout: int = 30000
+    idle_check: float = 30.0
+    max_age: float = 1800.0
     metrics_hook: Optional[Callable[[str, Dict[str, Any]], None]] = None
 
+    @cached_property
+    def libpq_dsn(self) -> str:
+        """Connection string for psycopg2: `dsn` if set, else key=value form."""
+        if self.dsn:
+            return self.dsn
+        parts = {
+            "host": self.host,
+            "port": self.port,
+            "dbname": self.database,
+            "user": self.user,
+            "password": self.password,
+            "connect_timeout": int(self.connect_timeout),
+        }
+        return " ".join(f"{k}={_libpq_quote(str(v))}" for k, v in parts.items() if v is not None and v != "")
+
+    @cached_property
+    def asyncpg_connect_kwargs(self) -> Dict[str, Any]:
+        """
+        Connection kwargs for ``asyncpg.create_pool``: the DSN when one was
+        given, otherwise the discrete fields (no URL round-trip to parse).
+        """
+        if self.dsn:
+            return {"dsn": self.dsn}
+        return {
+            "host": self.host,
+            "port": self.port,
+            "database": self.database,
+            "user": self.user,
+            "password": self.password,
+        }
+
+    @cached_property
+    def keepalive_params(self) -> Dict[str, int]:
+        """
+        libpq keepalive / tcp_user_timeout connection parameters, so a
+        half-open pooled socket is detected by the OS instead of failing the
+        next query (and costing a retry).
+        """
+        params: Dict[str, int] = {}
+        if self.keepalives_idle > 0:
+            params.update(
+                keepalives=1,
+                keepalives_idle=self.keepalives_idle,
+                keepalives_interval=self.keepalives_interval,
+                keepalives_count=self.keepalives_count,
+            )
+        if self.tcp_user_timeout > 0:
+            params["tcp_user_timeout"] = self.tcp_user_timeout
+        return params
+
     @staticmethod
     def from_env(prefix: str = "PG") -> "PostgresConfig":
         dsn = os.getenv("PG_DSN") or os.getenv("POSTGRES_DSN")
@@ -124,6 +213,16 @@ class PostgresConfig:
         connect_timeout = float(os.getenv("PG_CONNECT_TIMEOUT", "10.0"))
         max_retries = int(os.getenv("PG_MAX_RETRIES", "3"))
         backoff_factor = float(os.getenv("PG_BACKOFF_FACTOR", "0.2"))
+        backoff_cap = float(os.getenv("PG_BACKOFF_CAP", "30.0"))
+        statement_cache_size = int(os.getenv("PG_STATEMENT_CACHE_SIZE", "100"))
+        pool_shards = int(os.getenv("PG_POOL_SHARDS", "1"))
+        health_ttl = float(os.getenv("PG_HEALTH_TTL", "1.0"))
+        keepalives_idle = int(os.getenv("PG_KEEPALIVES_IDLE", "30"))
+        keepalives_interval = int(os.getenv("PG_KEEPALIVES_INTERVAL", "10"))
+        keepalives_count = int(os.getenv("PG_KEEPALIVES_COUNT", "3"))
+        tcp_user_timeout = int(os.getenv("PG_TCP_USER_TIMEOUT", "30000"))
+        idle_check = float(os.getenv("PG_IDLE_CHECK", "30.0"))
+        max_age = float(os.getenv("PG_CONN_MAX_AGE", "1800.0"))
         return PostgresConfig(
             dsn=dsn,
             host=host,
@@ -136,18 +235,195 @@ class PostgresConfig:
             connect_timeout=connect_timeout,
             max_retries=max_retries,
             backoff_factor=backoff_factor,
+            backoff_cap=backoff_cap,
+            statement_cache_size=statement_cache_size,
+            pool_shards=pool_shards,
+            health_ttl=health_ttl,
+            keepalives_idle=keepalives_idle,
+            keepalives_interval=keepalives_interval,
+            keepalives_count=keepalives_count,
+            tcp_user_timeout=tcp_user_timeout,
+            idle_check=idle_check,
+            max_age=max_age,
         )
 
 
+@functools.lru_cache(maxsize=8)
+def default_config_from_env(prefix: str = "PG") -> PostgresConfig:
+    """
+    Memoized `PostgresConfig.from_env`: the environment is parsed once per
+    prefix per process. The returned config is shared, so derive variants with
+    `dataclasses.replace` instead of mutating it; call
+    `default_config_from_env.cache_clear()` to pick up env changes.
+    """
+    return PostgresConfig.from_env(prefix=prefix)
+
+
 # ---- Utilities ----
-def _compute_backoff(attempt: int, factor: float = 0.2, jitter: float = 0.1) -> float:
+def _libpq_quote(value: str) -> str:
+    """Quote a libpq key=value connection-string value when needed."""
+    if value and not any(c in value for c in " '\\"):
+        return value
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+# Private generator for retry jitter (seeded from os.urandom): application
+# code calling random.seed() cannot make every replica's backoff identical,
+# and the bound method skips the module-level lookup on each call.
+_uniform = random.Random().uniform
+
+
+def _compute_backoff(prev: float, base: float = 0.2, cap: float = 30.0) -> float:
     """
-    Exponential backoff with jitter.
-    attempt: 0-based attempt index.
+    Decorrelated-jitter backoff: ``min(cap, uniform(base, prev * 3))``.
+    prev: the previous sleep (start with ``base``). The wide, history-dependent
+    window keeps retrying clients from re-synchronizing after an outage.
     """
-    base = factor * (2 ** attempt)
-    jitter_amount = base * jitter * (random.random() * 2 - 1)
-    return max(0.0, base + jitter_amount)
+    return min(cap, _uniform(base, max(base, prev * 3)))
+
+
+_HEALTHCHECK_SQL = "SELECT 1"
+
+# orjson parses the aggregated document in one C call when installed.
+_json_loads: Callable[[Any], Any] = orjson.loads if orjson is not None else json.loads
+
+# Whitelisted isolation levels for transaction(); the SQL is never built
+# from caller input directly.
+_ISOLATION_LEVELS = {
+    "READ UNCOMMITTED": "READ UNCOMMITTED",
+    "READ COMMITTED": "READ COMMITTED",
+    "REPEATABLE READ": "REPEATABLE READ",
+    "SERIALIZABLE": "SERIALIZABLE",
+}
+
+
+def _isolation_sql(level: str) -> str:
+    """
+    Map "SERIALIZABLE", "repeatable_read" or psycopg2-style
+    "ISOLATION_LEVEL_READ_COMMITTED" to its SQL keyword form.
+    """
+    key = level.upper().replace("_", " ").strip()
+    if key.startswith("ISOLATION LEVEL "):
+        key = key[len("ISOLATION LEVEL "):]
+    try:
+        return _ISOLATION_LEVELS[key]
+    except KeyError:
+        raise ValueError(f"unsupported isolation level: {level!r}") from None
+
+
+def _sql_literal(value: str) -> str:
+    """Single-quoted SQL string literal (standard_conforming_strings, the default since 9.1)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _migration_batch(sql: str, table_name: str, fname: str) -> str:
+    """
+    A migration's SQL followed by its bookkeeping INSERT, sent as one
+    message. The newline keeps a trailing ``--`` comment from swallowing
+    the INSERT; no bind parameters, so ``%`` in the file is left alone.
+    """
+    return f"{sql}\n;\nINSERT INTO {table_name} (filename) VALUES ({_sql_literal(fname)})"
+
+
+def _list_migrations(migrations_dir: str) -> List[str]:
+    """Sorted ``*.sql`` file names in ``migrations_dir`` (one scandir pass)."""
+    with os.scandir(migrations_dir) as it:
+        return sorted(e.name for e in it if e.name.endswith(".sql") and e.is_file())
+
+
+def _read_sql(path: str) -> str:
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def _set_keepalive(sock: socket.socket, params: Dict[str, int]) -> None:
+    """Apply `PostgresConfig.keepalive_params` to a raw socket (options the OS lacks are skipped)."""
+    if params.get("keepalives"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for opt, key in (("TCP_KEEPIDLE", "keepalives_idle"), ("TCP_KEEPINTVL", "keepalives_interval"), ("TCP_KEEPCNT", "keepalives_count")):
+            if hasattr(socket, opt):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, opt), params[key])
+    if "tcp_user_timeout" in params and hasattr(socket, "TCP_USER_TIMEOUT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, params["tcp_user_timeout"])
+
+
+if asyncpg is not None:
+    class _PinningConnection(asyncpg.Connection):
+        """
+        asyncpg connection that holds the statements registered with
+        ``AsyncPostgresClient.prepare`` (key -> (SQL, PreparedStatement)),
+        outside the LRU that ad-hoc queries share. Pool proxies forward
+        attribute access, so the dict is reachable from an acquired proxy.
+        """
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._omniflow_statements: Dict[str, Tuple[str, Any]] = {}
+
+    class _KeepaliveConnection(_PinningConnection):
+        """asyncpg connection that applies the pool's keepalive socket options on connect."""
+
+        _keepalive_params: Dict[str, int] = {}
+
+        def __init__(self, protocol, transport, *args, **kwargs):
+            super().__init__(protocol, transport, *args, **kwargs)
+            sock = transport.get_extra_info("socket")
+            if sock is not None and sock.family != socket.AF_UNIX:
+                try:
+                    _set_keepalive(sock, self._keepalive_params)
+                except OSError:
+                    logger.debug("Could not set keepalive socket options", exc_info=True)
+
+
+def _split(total: int, n: int, i: int) -> int:
+    """Share ``i`` of ``total`` spread over ``n`` shards (remainder to the first ones)."""
+    return total // n + (1 if i < total % n else 0)
+
+
+class _ShardedPool:
+    """
+    ``getconn``/``putconn``/``closeall`` over N psycopg2 ThreadedConnectionPools.
+
+    Each ThreadedConnectionPool serializes every getconn/putconn on one lock;
+    each thread is assigned a home shard round-robin on first use and starts
+    there, so N shards split that contention N ways. A thread whose shard is exhausted borrows
+    from the others before giving up, so total capacity stays ``max_pool``.
+    """
+
+    def __init__(self, shards: int, minconn: int, maxconn: int, dsn: str, **connect_kwargs: Any):
+        shards = max(1, min(shards, maxconn))
+        self._shards = [
+            PsycoThreadedPool(minconn=_split(minconn, shards, i), maxconn=_split(maxconn, shards, i), dsn=dsn, **connect_kwargs)
+            for i in range(shards)
+        ]
+        # id(conn) -> owning shard; dict get/set/pop are atomic under the GIL
+        self._owner: Dict[int, Any] = {}
+        # thread idents are aligned addresses, so ``get_ident() % n`` would
+        # send every thread to shard 0; hand out home shards in turn instead
+        self._next_home = itertools.count()
+        self._tls = threading.local()
+
+    def getconn(self) -> Any:
+        n = len(self._shards)
+        start = getattr(self._tls, "home", None)
+        if start is None:
+            start = self._tls.home = next(self._next_home) % n
+        for i in range(n):
+            shard = self._shards[(start + i) % n]
+            try:
+                conn = shard.getconn()
+            except PsycoPoolError:
+                continue
+            self._owner[id(conn)] = shard
+            return conn
+        raise PsycoPoolError("connection pool exhausted")
+
+    def putconn(self, conn: Any, close: bool = False) -> None:
+        self._owner.pop(id(conn)).putconn(conn, close=close)
+
+    def closeall(self) -> None:
+        for shard in self._shards:
+            shard.closeall()
 
 
 def _default_metrics_hook(event: str, payload: Dict[str, Any]) -> None:  # pragma: no cover - trivial
@@ -174,22 +450,31 @@ class SyncPostgresClient:
         self.metrics = cfg.metrics_hook or _default_metrics_hook
         if psycopg2 is None:
             raise PostgresConnectionError("psycopg2 not installed; install psycopg2-binary or psycopg2 to use SyncPostgresClient")
-        # Build dsn if not provided
-        if cfg.dsn:
-            self._dsn = cfg.dsn
-        else:
-            # safe: only include user/password if present
-            user = f"user={cfg.user}" if cfg.user else ""
-            password = f" password={cfg.password}" if cfg.password else ""
-            self._dsn = f"host={cfg.host} port={cfg.port} dbname={cfg.database} {user}{password} connect_timeout={int(cfg.connect_timeout)}"
+        self._dsn = cfg.libpq_dsn
+        # per-thread {(id(conn), dict_rows): cursor} reused by execute()
+        self._tls = threading.local()
+        self._last_ok_ts = 0.0
+        # conn -> [opened_at, last_released_at] (monotonic) for _usable()
+        self._conn_meta: "weakref.WeakKeyDictionary[Any, List[float]]" = weakref.WeakKeyDictionary()
+        # key -> (statement name, SQL) registered with prepare(); conn -> names PREPAREd on it
+        self._statements: Dict[str, Tuple[str, str]] = {}
+        self._prepared_on: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+        self._statement_ids = itertools.count()
+        # names of re-registered statements still PREPAREd on some connection;
+        # each connection DEALLOCATEs them on its next checkout
+        self._retired: set = set()
         try:
-            self._pool = PsycoThreadedPool(minconn=cfg.min_pool, maxconn=cfg.max_pool, dsn=self._dsn)
+            # psycopg2 merges these into the DSN (key=value or URL alike)
+            if cfg.pool_shards > 1:
+                self._pool = _ShardedPool(cfg.pool_shards, cfg.min_pool, cfg.max_pool, self._dsn, **cfg.keepalive_params)
+            else:
+                self._pool = PsycoThreadedPool(minconn=cfg.min_pool, maxconn=cfg.max_pool, dsn=self._dsn, **cfg.keepalive_params)
         except Exception as exc:
             logger.exception("Failed to create psycopg2 pool")
             raise PostgresConnectionError(f"failed to create pool: {exc}") from exc
 
     @contextlib.contextmanager
-    def conn(self):
+    def conn(self, autocommit: bool = False):
         """
         Context manager yielding a psycopg2 connection from the pool.
         Usage:
@@ -197,31 +482,169 @@ class SyncPostgresClient:
                 with conn.cursor() as cur:
                     ...
         The connection is returned to the pool on exit. Exceptions inside the block are not suppressed.
+        With ``autocommit=True`` every statement commits on its own and no
+        transaction is left open, so the return to the pool costs no rollback.
         """
         conn = None
         try:
-            conn = self._pool.getconn()
-            # psycopg2 by default uses autocommit = False; caller can manage transactions.
+            conn = self._getconn(autocommit)
+            # autocommit = False (default): caller manages the transaction.
             yield conn
         except Exception as exc:
             self.metrics("sync_conn_error", {"error": str(exc)})
             raise
         finally:
             if conn is not None:
-                try:
-                    # reset connection state before returning; psycopg2 has reset_session
-                    conn.rollback()
-                except Exception:
-                    # if rollback fails, attempt to close and replace
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
-                try:
-                    self._pool.putconn(conn)
-                except Exception:
-                    # pool may be closed or conn invalid
-                    logger.debug("putconn failed; closing conn", exc_info=True)
+                self._release(conn)
+
+    def _getconn(self, autocommit: bool) -> Any:
+        for _ in range(self.cfg.max_pool):
+            conn = self._pool.getconn()
+            if self._usable(conn):
+                break
+            self.metrics("sync_conn_recycled", {})
+            self._pool.putconn(conn, close=True)
+        else:
+            # every pooled connection was stale; this one is freshly opened
+            conn = self._pool.getconn()
+            self._usable(conn)
+        if self._retired:
+            self._deallocate_retired(conn)
+        # client-side flag only; pooled connections come back idle
+        if conn.autocommit != autocommit:
+            conn.autocommit = autocommit
+        return conn
+
+    def _deallocate_retired(self, conn: Any) -> None:
+        """Drop statements of re-registered keys from ``conn`` (autocommit, before any transaction)."""
+        names = self._prepared_on.get(conn)
+        if not names:
+            return
+        stale = names & self._retired
+        if not stale:
+            return
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute("".join(f"DEALLOCATE {name};" for name in stale))
+        names -= stale
+        for name in stale:
+            if not any(name in held for held in list(self._prepared_on.values())):
+                self._retired.discard(name)
+
+    def _usable(self, conn: Any) -> bool:
+        """
+        False if ``conn`` is past ``cfg.max_age`` or, after more than
+        ``cfg.idle_check`` seconds idle, fails a ``SELECT 1`` ping. Recently
+        used connections are trusted without a round trip.
+        """
+        now = time.monotonic()
+        meta = self._conn_meta.get(conn)
+        if meta is None:
+            self._conn_meta[conn] = [now, now]
+            return not conn.closed
+        if conn.closed or (self.cfg.max_age > 0 and now - meta[0] > self.cfg.max_age):
+            return False
+        if self.cfg.idle_check > 0 and now - meta[1] > self.cfg.idle_check:
+            try:
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    cur.execute(_HEALTHCHECK_SQL)
+            except psycopg2.Error:
+                return False
+        return True
+
+    def _release(self, conn: Any, discard: bool = False) -> None:
+        """
+        Return a connection to the pool, rolled back if a transaction is
+        still open (checked client-side, so idle/autocommit connections cost
+        no round trip). If ``discard`` is set (or the rollback fails) the
+        connection is closed and the pool opens a fresh one on a later getconn().
+        """
+        if not discard and conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                # reset connection state before returning
+                conn.rollback()
+            except Exception:
+                discard = True
+        meta = self._conn_meta.get(conn)
+        if meta is not None:
+            meta[1] = time.monotonic()
+        try:
+            self._pool.putconn(conn, close=discard)
+        except Exception:
+            # pool may be closed or conn invalid
+            logger.debug("putconn failed; closing conn", exc_info=True)
+
+    def _execute_on(self, conn: Any, query: str, params: Optional[Tuple[Any, ...]], fetch: str, timeout: Optional[int]) -> Any:
+        # Optionally set statement_timeout for this call if provided. Sent in
+        # the same simple-query message as the statement: Postgres runs a
+        # multi-statement message as one implicit transaction, so SET LOCAL
+        # covers the query and expires with it, in a single round trip. The
+        # cursor's results are those of the last statement.
+        if timeout is not None:
+            query = f"SET LOCAL statement_timeout = {int(timeout * 1000)}; {query}"
+        return self._run(conn, query, params, fetch)
+
+    def _cursor(self, conn: Any, dict_rows: bool) -> Any:
+        """
+        This thread's reusable cursor on ``conn``: execute() issues many tiny
+        queries, and a cursor can run any number of them, so one is created
+        per (thread, connection, row type) instead of one per call. A cursor
+        whose connection was closed (or that is bound to a recycled ``id``)
+        is replaced.
+        """
+        cursors = getattr(self._tls, "cursors", None)
+        if cursors is None:
+            cursors = self._tls.cursors = {}
+        key = (id(conn), dict_rows)
+        cur = cursors.get(key)
+        if cur is None or cur.closed or cur.connection is not conn:
+            # drop cursors of connections the pool has since closed
+            for stale in [k for k, c in cursors.items() if c.closed]:
+                del cursors[stale]
+            if dict_rows:
+                cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            else:
+                cur = conn.cursor()
+            cursors[key] = cur
+        return cur
+
+    def _run(self, conn: Any, query: str, params: Optional[Tuple[Any, ...]], fetch: str) -> Any:
+        if fetch == "value":
+            # Plain tuple cursor: the scalar is row[0], no per-row dict.
+            cur = self._cursor(conn, dict_rows=False)
+            cur.execute(query, params)
+            row = cur.fetchone()
+            return row[0] if row else None
+        if fetch == "all":
+            # A kept cursor would pin the whole result buffer until its next
+            # use; a full fetch amortizes the cursor anyway.
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(query, params)
+                return cur.fetchall()
+        cur = self._cursor(conn, dict_rows=True)
+        cur.execute(query, params)
+        if fetch == "one":
+            return cur.fetchone()
+        return None
+
+    def iter_rows(self, query: str, params: Optional[Tuple[Any, ...]] = None, itersize: int = 2000) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rows of a large SELECT as dicts via a server-side (named)
+        cursor, fetching ``itersize`` rows per round trip instead of
+        materializing the whole result like ``execute(fetch="all")``.
+        The pooled connection is held until the iterator is exhausted or closed.
+        """
+        try:
+            with self.conn() as conn:
+                with conn.cursor(name=f"omniflow_iter_{id(conn):x}", cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                    cur.itersize = itersize
+                    cur.execute(query, params)
+                    yield from cur
+        except psycopg2.Error as exc:
+            logger.exception("Postgres streaming query error: %s", exc)
+            self.metrics("sync_query_error", {"error": str(exc)})
+            raise PostgresQueryError(str(exc)) from exc
 
     def execute(
         self,
@@ -237,64 +660,125 @@ class SyncPostgresClient:
                "one" -> return cursor.fetchone()
                "all" -> return cursor.fetchall()
                "value" -> return single scalar (first column of first row)
+
+
+        One pooled connection is held across retries; it is only replaced
+        (closed and re-acquired) after an OperationalError. The connection
+        runs in autocommit mode: each call commits on its own and nothing is
+        left to roll back when it goes back to the pool. Use
+        :meth:`transaction` to group statements.
         """
+        return self._execute(query, params, fetch, timeout)
+
+    def prepare(self, key: str, query: str) -> None:
+        """
+        Register a hot statement under ``key`` for :meth:`execute_prepared`.
+
+        ``query`` uses Postgres ``$1, $2, ...`` placeholders. Each pooled
+        connection runs ``PREPARE`` for it on first use and afterwards only
+        ``EXECUTE``, so the server parses and plans it once per connection
+        instead of on every call. Re-registering ``key`` with different SQL
+        gives it a fresh statement name (names are never reused); the old
+        statement is deallocated on each connection's next checkout.
+        """
+        old = self._statements.get(key)
+        if old is not None:
+            if old[1] == query:
+                return
+            self._retired.add(old[0])
+        self._statements[key] = (f"omniflow_stmt_{next(self._statement_ids)}", query)
+
+    def execute_prepared(
+        self,
+        key: str,
+        params: Tuple[Any, ...] = (),
+        fetch: str = "none",
+        timeout: Optional[int] = None,
+    ) -> Any:
+        """:meth:`execute` for a statement registered with :meth:`prepare`."""
+
+        def run(conn: Any) -> Any:
+            # outside any transaction, so the PREPARE always sticks
+            return self._execute_on(conn, self._bind_prepared(conn, key, len(params)), params, fetch, timeout)
+
+        return self._with_retries(run)
+
+    def _bind_prepared(self, conn: Any, key: str, nparams: int) -> str:
+        """``EXECUTE`` SQL for ``key`` on ``conn``, running its ``PREPARE`` first if needed."""
+        name, query = self._statements[key]
+        names = self._prepared_on.get(conn)
+        if names is None:
+            names = self._prepared_on[conn] = set()
+        if name not in names:
+            with conn.cursor() as cur:
+                cur.execute(f"PREPARE {name} AS {query}")
+            names.add(name)
+        if not nparams:
+            return f"EXECUTE {name}"
+        return f"EXECUTE {name} ({', '.join(['%s'] * nparams)})"
+
+    def _execute(self, query: str, params: Optional[Tuple[Any, ...]], fetch: str, timeout: Optional[int]) -> Any:
+        return self._with_retries(lambda conn: self._execute_on(conn, query, params, fetch, timeout))
+
+    def _with_retries(self, run: Callable[[Any], Any]) -> Any:
+        """``run(conn)`` on an autocommit pooled connection, reconnecting on OperationalError."""
         attempt = 0
         last_exc: Optional[Exception] = None
-        while attempt <= self.cfg.max_retries:
-            try:
-                with self.conn() as conn:
-                    # Optionally set statement_timeout for this session if provided
-                    if timeout is not None:
-                        with conn.cursor() as cur:
-                            cur.execute("SET LOCAL statement_timeout = %s", (int(timeout * 1000),))
-                    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                        cur.execute(query, params)
-                        if fetch == "one":
-                            return cur.fetchone()
-                        if fetch == "all":
-                            return cur.fetchall()
-                        if fetch == "value":
-                            row = cur.fetchone()
-                            if not row:
-                                return None
-                            # row is dict-like; return first column
-                            return list(row.values())[0]
-                        return None
-            except psycopg2.OperationalError as exc:
-                last_exc = exc
-                # transient? reconnect/retry
-                attempt += 1
-                wait = _compute_backoff(attempt - 1, self.cfg.backoff_factor)
-                logger.warning("OperationalError executing query, attempt %d/%d: %s — retrying after %.2fs", attempt, self.cfg.max_retries, exc, wait)
-                self.metrics("sync_query_retry", {"attempt": attempt, "error": str(exc)})
-                time.sleep(wait)
-                continue
-            except psycopg2.Error as exc:
-                # Non-transient DB-level error (e.g., syntax, constraint)
-                logger.exception("Postgres query error: %s", exc)
-                self.metrics("sync_query_error", {"error": str(exc)})
-                raise PostgresQueryError(str(exc)) from exc
-            except Exception as exc:
-                last_exc = exc
-                logger.exception("Unexpected error executing query")
-                raise PostgresError(str(exc)) from exc
+        sleep = self.cfg.backoff_factor
+        conn = None
+        try:
+            while attempt <= self.cfg.max_retries:
+                try:
+                    if conn is None:
+                        conn = self._getconn(autocommit=True)
+                    return run(conn)
+                except psycopg2.OperationalError as exc:
+                    last_exc = exc
+                    # transient: drop the broken connection, back off, reconnect
+                    if conn is not None:
+                        self._release(conn, discard=True)
+                        conn = None
+                    attempt += 1
+                    sleep = wait = _compute_backoff(sleep, self.cfg.backoff_factor, self.cfg.backoff_cap)
+                    logger.warning("OperationalError executing query, attempt %d/%d: %s — retrying after %.2fs", attempt, self.cfg.max_retries, exc, wait)
+                    self.metrics("sync_query_retry", {"attempt": attempt, "error": str(exc)})
+                    time.sleep(wait)
+                    continue
+                except psycopg2.Error as exc:
+                    # Non-transient DB-level error (e.g., syntax, constraint)
+                    logger.exception("Postgres query error: %s", exc)
+                    self.metrics("sync_query_error", {"error": str(exc)})
+                    raise PostgresQueryError(str(exc)) from exc
+                except Exception as exc:
+                    last_exc = exc
+                    logger.exception("Unexpected error executing query")
+                    raise PostgresError(str(exc)) from exc
+        finally:
+            if conn is not None:
+                self._release(conn)
         raise PostgresConnectionError(f"query failed after retries: {last_exc!s}")
 
     @contextlib.contextmanager
     def transaction(self, isolation_level: Optional[str] = None):
         """
-        Transaction context manager.
+        Transaction context manager yielding the transaction's connection.
 
         Example:
-            with client.transaction():
-                client.execute("INSERT ...")
-                client.execute("UPDATE ...")
+            with client.transaction("SERIALIZABLE") as conn:
+                with conn.cursor() as cur:
+                    cur.execute("INSERT ...")
+                    cur.execute("UPDATE ...")
+
+        ``isolation_level`` applies to this transaction only (``SET
+        TRANSACTION ISOLATION LEVEL`` as its first statement), so the pooled
+        connection goes back with its session defaults untouched.
         """
-        with self.conn() as conn:
+        level_sql = _isolation_sql(isolation_level) if isolation_level is not None else None
+        with self.conn(autocommit=False) as conn:
             try:
-                if isolation_level is not None:
-                    # psycopg2 isolation level mapping: READ COMMITTED, REPEATABLE READ, SERIALIZABLE
-                    conn.set_isolation_level(getattr(psycopg2.extensions, isolation_level))
+                if level_sql is not None:
+                    with conn.cursor() as cur:
+                        cur.execute(f"SET TRANSACTION ISOLATION LEVEL {level_sql}")
                 yield conn
                 conn.commit()
             except Exception:
@@ -305,12 +789,19 @@ class SyncPostgresClient:
                 raise
 
     def healthcheck(self) -> bool:
-        """Simple healthcheck that executes a lightweight query."""
+        """
+        Simple healthcheck that executes a lightweight query. A success is
+        reused for ``cfg.health_ttl`` seconds, so frequent probes cost one
+        query per TTL; a failure is never cached.
+        """
+        if time.monotonic() - self._last_ok_ts < self.cfg.health_ttl:
+            return True
         try:
-            res = self.execute("SELECT 1 as ok", fetch="value")
-            return res == 1
+            ok = self.execute("SELECT 1 as ok", fetch="value") == 1
         except Exception:
-            return False
+            ok = False
+        self._last_ok_ts = time.monotonic() if ok else 0.0
+        return ok
 
     def close(self):
         """Close the connection pool and all pooled connections."""
@@ -338,23 +829,21 @@ class SyncPostgresClient:
             );
             """
         )
-        files = sorted([f for f in os.listdir(migrations_dir) if f.endswith(".sql")])
+        files = _list_migrations(migrations_dir)
+        # one round trip for the applied set instead of one lookup per file
+        done = {row["filename"] for row in self.execute(f"SELECT filename FROM {table_name}", fetch="all")}
         for fname in files:
             path = os.path.join(migrations_dir, fname)
             # skip if already applied
-            existing = self.execute(f"SELECT 1 FROM {table_name} WHERE filename = %s", (fname,), fetch="value")
-            if existing:
+            if fname in done:
                 logger.debug("Migration %s already applied; skipping", fname)
                 continue
-            sql = open(path, "r", encoding="utf-8").read()
+            sql = _read_sql(path)
             try:
-                # Execute file within transaction
-                with self.transaction():
-                    with self.conn() as conn:
-                        with conn.cursor() as cur:
-                            cur.execute(sql)
-                        with conn.cursor() as cur2:
-                            cur2.execute(f"INSERT INTO {table_name} (filename) VALUES (%s)", (fname,))
+                # Execute file and record it on the transaction's own connection
+                with self.transaction() as conn:
+                    with conn.cursor() as cur:
+                        cur.execute(_migration_batch(sql, table_name, fname))
                 applied.append(fname)
                 logger.info("Applied migration %s", fname)
             except Exception:
@@ -382,21 +871,29 @@ class AsyncPostgresClient:
         if asyncpg is None:
             raise PostgresConnectionError("asyncpg not installed; install asyncpg to use AsyncPostgresClient")
         self._pool: Optional[asyncpg.pool.Pool] = None
+        # key -> SQL registered with prepare(); each connection pins its own
+        # PreparedStatement for it (see _PinningConnection)
+        self._statements: Dict[str, str] = {}
+        self._last_ok_ts = 0.0
 
     async def start(self):
         """Start the asyncpg pool."""
         if self._pool is not None:
             return
-        dsn = self.cfg.dsn
-        if not dsn:
-            # build dsn
-            dsn = f"postgresql://{self.cfg.user or ''}:{self.cfg.password or ''}@{self.cfg.host}:{self.cfg.port}/{self.cfg.database}"
+        extra: Dict[str, Any] = {"connection_class": _PinningConnection}
+        if self.cfg.keepalive_params:
+            # per-config subclass so pools with different settings don't share them
+            extra["connection_class"] = type("_KeepaliveConnection", (_KeepaliveConnection,), {"_keepalive_params": self.cfg.keepalive_params})
         try:
             self._pool = await asyncpg.create_pool(
-                dsn,
+                **self.cfg.asyncpg_connect_kwargs,
+                **extra,
                 min_size=self.cfg.min_pool,
                 max_size=self.cfg.max_pool,
                 timeout=self.cfg.connect_timeout,
+                statement_cache_size=self.cfg.statement_cache_size,
+                # idle connections are closed rather than handed out stale
+                max_inactive_connection_lifetime=self.cfg.idle_check,
             )
         except Exception as exc:
             logger.exception("Failed to create asyncpg pool")
@@ -423,20 +920,24 @@ class AsyncPostgresClient:
     async def fetchval(self, query: str, *args, timeout: Optional[float] = None) -> Any:
         """
         Fetch a single value (first column of the first row).
+
+        Goes through ``Pool.fetchval``, which acquires and releases inside
+        asyncpg without an ``async with`` frame pair here. A connection that
+        died mid-query is closed, and asyncpg reopens it on its next acquire,
+        so a retry never reuses the broken socket.
         """
         attempt = 0
         last_exc: Optional[Exception] = None
+        sleep = self.cfg.backoff_factor
         while attempt <= self.cfg.max_retries:
             try:
                 if self._pool is None:
                     await self.start()
-                assert self._pool is not None
-                async with self._pool.acquire() as conn:
-                    return await conn.fetchval(query, *args, timeout=timeout)
+                return await self._pool.fetchval(query, *args, timeout=timeout)
             except (asyncpg.exceptions.PostgresConnectionError, ConnectionError) as exc:
                 last_exc = exc
                 attempt += 1
-                wait = _compute_backoff(attempt - 1, self.cfg.backoff_factor)
+                sleep = wait = _compute_backoff(sleep, self.cfg.backoff_factor, self.cfg.backoff_cap)
                 logger.warning("Async fetchval connection error attempt %d/%d: %s — retrying after %.2fs", attempt, self.cfg.max_retries, exc, wait)
                 self.metrics("async_query_retry", {"attempt": attempt, "error": str(exc)})
                 await asyncio.sleep(wait)
@@ -449,28 +950,112 @@ class AsyncPostgresClient:
                 raise PostgresError(str(exc)) from exc
         raise PostgresConnectionError(f"async fetchval failed after retries: {last_exc!s}")
 
-    async def fetch(self, query: str, *args, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
-        """Fetch all rows as list of dicts."""
+    def prepare(self, key: str, query: str) -> None:
+        """
+        Register a hot statement under ``key`` for the ``*_prepared`` helpers.
+
+        Each pooled connection prepares it on first use and keeps the
+        ``PreparedStatement`` for its lifetime, so later calls send only
+        bind+execute and ad-hoc queries cannot evict it from asyncpg's
+        statement LRU. Re-registering ``key`` with new SQL re-prepares it.
+        With ``statement_cache_size=0`` (pgbouncer in transaction mode) named
+        statements are unsafe, so the helpers run the SQL unprepared.
+        """
+        self._statements[key] = query
+
+    async def _run_prepared(self, key: str, method: str, args: Tuple[Any, ...], timeout: Optional[float]) -> Any:
+        query = self._statements[key]
+        if self._pool is None:
+            await self.start()
+        try:
+            async with self._pool.acquire() as conn:
+                pinned = conn._omniflow_statements
+                for attempt in range(2):
+                    hit = pinned.get(key)
+                    if hit is None or hit[0] != query:
+                        hit = pinned[key] = (query, await conn.prepare(query))
+                    stmt = hit[1]
+                    try:
+                        if method == "execute":
+                            await stmt.fetch(*args, timeout=timeout)
+                            return stmt.get_statusmsg()
+                        return await getattr(stmt, method)(*args, timeout=timeout)
+                    except asyncpg.exceptions.InvalidCachedStatementError:
+                        # schema changed under the statement: prepare it again once
+                        pinned.pop(key, None)
+                        if attempt:
+                            raise
+        except asyncpg.PostgresError as exc:
+            logger.exception("Async prepared statement error")
+            raise PostgresQueryError(str(exc)) from exc
+
+    async def fetchval_prepared(self, key: str, *args, timeout: Optional[float] = None) -> Any:
+        """`fetchval` for a statement registered with :meth:`prepare`."""
+        if not self.cfg.statement_cache_size:
+            return await self.fetchval(self._statements[key], *args, timeout=timeout)
+        return await self._run_prepared(key, "fetchval", args, timeout)
+
+    async def fetch_prepared(self, key: str, *args, timeout: Optional[float] = None, as_dicts: bool = False) -> List[Any]:
+        """`fetch` for a statement registered with :meth:`prepare`."""
+        if not self.cfg.statement_cache_size:
+            return await self.fetch(self._statements[key], *args, timeout=timeout, as_dicts=as_dicts)
+        records = await self._run_prepared(key, "fetch", args, timeout)
+        if as_dicts:
+            return [dict(r) for r in records]
+        return records
+
+    async def execute_prepared(self, key: str, *args, timeout: Optional[float] = None) -> str:
+        """`execute` for a statement registered with :meth:`prepare`. Returns status string."""
+        if not self.cfg.statement_cache_size:
+            return await self.execute(self._statements[key], *args, timeout=timeout)
+        return await self._run_prepared(key, "execute", args, timeout)
+
+    async def fetch(self, query: str, *args, timeout: Optional[float] = None, as_dicts: bool = False) -> List[Any]:
+        """
+        Fetch all rows as asyncpg ``Record`` objects.
+
+        Records support ``row["col"]``, ``row[0]``, ``.get()``, ``.keys()`` and
+        ``dict(row)`` without a per-row dict allocation; pass
+        ``as_dicts=True`` to get plain dicts instead.
+        """
         try:
             if self._pool is None:
                 await self.start()
-            assert self._pool is not None
-            async with self._pool.acquire() as conn:
-                records = await conn.fetch(query, *args, timeout=timeout)
-                # Convert Record objects to dicts
+            records = await self._pool.fetch(query, *args, timeout=timeout)
+            if as_dicts:
                 return [dict(r) for r in records]
+            return records
         except asyncpg.PostgresError as exc:
             logger.exception("Async fetch error")
             raise PostgresQueryError(str(exc)) from exc
 
+    async def fetch_json(self, query: str, *args, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch a small result as a list of dicts, built server-side.
+
+        The query is wrapped in ``json_agg`` so Postgres returns one JSON
+        text value, decoded in a single call, instead of N records each
+        turned into a dict in Python. ``json`` (not ``jsonb``) keeps column
+        order, and duplicate column names resolve like ``dict(record)``
+        (last wins). Values come back as JSON types (timestamps and UUIDs
+        as strings, numerics as numbers), so this suits small lookup/config
+        payloads rather than large or typed reads.
+        """
+        # a trailing ';' would end the statement inside the subquery
+        query = query.rstrip().rstrip(";").rstrip()
+        doc = await self.fetchval(
+            f"SELECT COALESCE(json_agg(q), '[]'::json)::text FROM ({query}) q",
+            *args,
+            timeout=timeout,
+        )
+        return _json_loads(doc)
+
     async def execute(self, query: str, *args, timeout: Optional[float] = None) -> str:
         """Execute a statement (INSERT/UPDATE/DELETE). Returns status string."""
         try:
             if self._pool is None:
                 await self.start()
-            assert self._pool is not None
-            async with self._pool.acquire() as conn:
-                return await conn.execute(query, *args, timeout=timeout)
+            return await self._pool.execute(query, *args, timeout=timeout)
         except asyncpg.PostgresError as exc:
             logger.exception("Async execute error")
             raise PostgresQueryError(str(exc)) from exc
@@ -498,12 +1083,15 @@ class AsyncPostgresClient:
                 raise
 
     async def healthcheck(self) -> bool:
-        """Lightweight health check."""
+        """Lightweight health check; successes are cached like the sync client's."""
+        if time.monotonic() - self._last_ok_ts < self.cfg.health_ttl:
+            return True
         try:
-            val = await self.fetchval("SELECT 1")
-            return val == 1
+            ok = await self.fetchval(_HEALTHCHECK_SQL) == 1
         except Exception:
-            return False
+            ok = False
+        self._last_ok_ts = time.monotonic() if ok else 0.0
+        return ok
 
     async def apply_migrations(self, migrations_dir: str, table_name: str = "omniflow_schema_migrations") -> List[str]:
         """
@@ -519,19 +1107,18 @@ class AsyncPostgresClient:
             );
             """
         )
-        files = sorted([f for f in os.listdir(migrations_dir) if f.endswith(".sql")])
+        # directory scan and file reads are blocking I/O: keep them off the loop
+        files = await asyncio.to_thread(_list_migrations, migrations_dir)
+        done = {row["filename"] for row in await self.fetch(f"SELECT filename FROM {table_name}")}
         for fname in files:
             path = os.path.join(migrations_dir, fname)
-            existing = await self.fetchval(f"SELECT 1 FROM {table_name} WHERE filename = $1", fname)
-            if existing:
+            if fname in done:
                 logger.debug("Async migration %s already applied; skipping", fname)
                 continue
-            sql = open(path, "r", encoding="utf-8").read()
+            sql = await asyncio.to_thread(_read_sql, path)
             try:
-                async with self.transaction():
-                    async with self.connection() as conn:
-                        await conn.execute(sql)
-                        await conn.execute(f"INSERT INTO {table_name} (filename) VALUES ($1)", fname)
+                async with self.transaction() as conn:
+                    await conn.execute(_migration_batch(sql, table_name, fname))
                 applied.append(fname)
                 logger.info("Applied async migration %s", fname)
             except Exception:
@@ -542,12 +1129,12 @@ class AsyncPostgresClient:
 
 # ---- Factories ----
 def default_sync_client_from_env(prefix: str = "PG") -> SyncPostgresClient:
-    cfg = PostgresConfig.from_env(prefix=prefix)
+    cfg = default_config_from_env(prefix)
     return SyncPostgresClient(cfg)
 
 
 def default_async_client_from_env(prefix: str = "PG") -> AsyncPostgresClient:
-    cfg = PostgresConfig.from_env(prefix=prefix)
+    cfg = default_config_from_env(prefix)
     return AsyncPostgresClient(cfg)
 
 
@@ -26,13 +26,20 @@ Notes:
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
 import json
 import logging
 import os
 import random
 import socket
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
+from queue import Empty, SimpleQueue
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 # Optional imports
@@ -53,6 +60,26 @@ except Exception:
     aio_pika = None
     AioExchangeType = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional import
+    orjson = None
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - optional import
+    msgpack = None
+
+try:
+    import cbor2  # type: ignore
+except ImportError:  # pragma: no cover - optional import
+    cbor2 = None
+
+try:
+    from connectors._eventloop import use_uvloop  # type: ignore
+except ImportError:  # pragma: no cover - loaded as a top-level module
+    from _eventloop import use_uvloop  # type: ignore
+
 logger = logging.getLogger("omniflow.connectors.rabbitmq")
 logger.addHandler(logging.NullHandler())
 
@@ -64,9 +91,11 @@ __all__ = [
     "RabbitMQConfig",
     "SyncRabbitMQProducer",
     "SyncRabbitMQConsumer",
+    "ThreadedSyncRabbitMQConsumer",
     "AsyncRabbitMQProducer",
     "AsyncRabbitMQConsumer",
     "default_rabbitmq_config_from_env",
+    "use_uvloop",
 ]
 
 
@@ -102,11 +131,26 @@ class RabbitMQConfig:
       - RABBITMQ_PASSWORD
       - RABBITMQ_HEARTBEAT (s)
       - RABBITMQ_CONNECTION_TIMEOUT (s)
-      - RABBITMQ_PREFETCH (consumer prefetch count)
+      - RABBITMQ_PREFETCH (consumer prefetch count, default 100)
+      - RABBITMQ_PREFETCH_BATCH (prefetch for consumers that settle deliveries
+        in batches, default 256; see `consumer_prefetch`)
+      - RABBITMQ_GLOBAL_QOS (true/false) -- apply the prefetch limit to the
+        whole channel instead of per consumer
+      - RABBITMQ_ACK_BATCH (sync consumer acks coalesced into one multiple=True
+        ack, default 32; 1 acks every message)
+      - RABBITMQ_ACK_MAX_LATENCY_MS (longest an ack may wait for its batch,
+        default 50)
+      - RABBITMQ_CHANNEL_POOL (channels the async producer opens on its one
+        connection, default 8)
+      - RABBITMQ_SERIALIZER (json | msgpack | cbor: wire format for dict/list
+        bodies, default json; msgpack/cbor need the msgpack/cbor2 package and
+        a consumer that decodes by content type)
       - RABBITMQ_MAX_RETRIES (reconnect/publish attempts)
       - RABBITMQ_BACKOFF_FACTOR (base seconds for backoff)
       - RABBITMQ_CLIENT_PROPERTIES (JSON string for connection properties)
       - RABBITMQ_SSL (true/false) -- TLS usage (pika/aio_pika must be configured externally if needed)
+      - RABBITMQ_USE_UVLOOP (true/false) -- install uvloop's event loop policy
+        when an async client is created before the event loop starts
     """
 
     url: Optional[str] = None
@@ -117,13 +161,34 @@ class RabbitMQConfig:
     password: Optional[str] = None
     heartbeat: int = 60
     connection_timeout: int = 10
-    prefetch_count: int = 50
+    prefetch_count: int = 100
+    prefetch_count_batch: int = 256
+    global_qos: bool = False
+    ack_batch_size: int = 32
+    ack_max_latency_ms: int = 50
+    channel_pool_size: int = 8
+    serializer: str = "json"
     max_retries: int = 3
     backoff_factor: float = 0.5
     client_properties: Optional[Dict[str, Any]] = None
     ssl: bool = False
+    use_uvloop: bool = False
     metrics_hook: Optional[Callable[[str, Dict[str, Any]], None]] = None
 
+    def consumer_prefetch(self, batch_size: int = 1) -> int:
+        """
+        Prefetch for a consumer that settles ``batch_size`` deliveries at a
+        time. Throughput climbs steeply from small prefetch values towards
+        ~100 and then flattens, while each unacked message held client-side
+        costs memory and redelivery on a crash. A batching consumer needs at
+        least one full batch in flight or it stalls waiting for deliveries
+        it cannot get until it acks, hence ``prefetch_count_batch`` (and
+        never less than ``batch_size``).
+        """
+        if batch_size <= 1:
+            return self.prefetch_count
+        return max(self.prefetch_count_batch, batch_size)
+
     @staticmethod
     def from_env(prefix: str = "RABBITMQ") -> "RabbitMQConfig":
         url = os.getenv(f"{prefix}_URL") or os.getenv("RABBITMQ_URL")
@@ -134,10 +199,17 @@ class RabbitMQConfig:
         password = os.getenv(f"{prefix}_PASSWORD") or os.getenv("RABBITMQ_PASSWORD")
         heartbeat = int(os.getenv(f"{prefix}_HEARTBEAT") or os.getenv("RABBITMQ_HEARTBEAT") or "60")
         conn_timeout = int(os.getenv(f"{prefix}_CONNECTION_TIMEOUT") or os.getenv("RABBITMQ_CONNECTION_TIMEOUT") or "10")
-        prefetch = int(os.getenv(f"{prefix}_PREFETCH") or os.getenv("RABBITMQ_PREFETCH") or "50")
+        prefetch = int(os.getenv(f"{prefix}_PREFETCH") or os.getenv("RABBITMQ_PREFETCH") or "100")
+        prefetch_batch = int(os.getenv(f"{prefix}_PREFETCH_BATCH") or os.getenv("RABBITMQ_PREFETCH_BATCH") or "256")
+        global_qos = str(os.getenv(f"{prefix}_GLOBAL_QOS") or os.getenv("RABBITMQ_GLOBAL_QOS") or "false").lower() in ("1", "true", "yes")
+        ack_batch = int(os.getenv(f"{prefix}_ACK_BATCH") or os.getenv("RABBITMQ_ACK_BATCH") or "32")
+        ack_latency = int(os.getenv(f"{prefix}_ACK_MAX_LATENCY_MS") or os.getenv("RABBITMQ_ACK_MAX_LATENCY_MS") or "50")
+        channel_pool = int(os.getenv(f"{prefix}_CHANNEL_POOL") or os.getenv("RABBITMQ_CHANNEL_POOL") or "8")
+        serializer = (os.getenv(f"{prefix}_SERIALIZER") or os.getenv("RABBITMQ_SERIALIZER") or "json").lower()
         max_retries = int(os.getenv(f"{prefix}_MAX_RETRIES") or os.getenv("RABBITMQ_MAX_RETRIES") or "3")
         backoff = float(os.getenv(f"{prefix}_BACKOFF_FACTOR") or os.getenv("RABBITMQ_BACKOFF_FACTOR") or "0.5")
         ssl_flag = str(os.getenv(f"{prefix}_SSL") or os.getenv("RABBITMQ_SSL") or "false").lower() in ("1", "true", "yes")
+        uvloop_flag = str(os.getenv(f"{prefix}_USE_UVLOOP") or os.getenv("RABBITMQ_USE_UVLOOP") or "false").lower() in ("1", "true", "yes")
         props_raw = os.getenv(f"{prefix}_CLIENT_PROPERTIES")
         props = None
         if props_raw:
@@ -155,10 +227,17 @@ class RabbitMQConfig:
             heartbeat=heartbeat,
             connection_timeout=conn_timeout,
             prefetch_count=prefetch,
+            prefetch_count_batch=prefetch_batch,
+            global_qos=global_qos,
+            ack_batch_size=ack_batch,
+            ack_max_latency_ms=ack_latency,
+            channel_pool_size=channel_pool,
+            serializer=serializer,
             max_retries=max_retries,
             backoff_factor=backoff,
             client_properties=props,
             ssl=ssl_flag,
+            use_uvloop=uvloop_flag,
         )
 
 
@@ -167,11 +246,173 @@ def default_rabbitmq_config_from_env(prefix: str = "RABBITMQ") -> RabbitMQConfig
 
 
 # ---- Utilities ----
+if orjson is not None:
+    # UTF-8 bytes straight out (no separate encode), non-str keys coerced like json.dumps.
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads  # accepts UTF-8 bytes directly
+
+
+_MAX_BACKOFF = 30.0
+
+
+@functools.lru_cache(maxsize=64)
+def _backoff_base(attempt: int, factor: float) -> float:
+    """``factor * 2**attempt`` capped at ``_MAX_BACKOFF``; shared by all reconnect/publish loops."""
+    return min(factor * (1 << attempt), _MAX_BACKOFF)
+
+
 def _compute_backoff(attempt: int, factor: float = 0.5, jitter: float = 0.2) -> float:
-    """Exponential backoff with jitter. attempt is 0-based."""
-    base = factor * (2 ** attempt)
-    jitter_amt = base * jitter * (random.random() * 2 - 1)
-    return max(0.0, base + jitter_amt)
+    """Capped exponential backoff with jitter. attempt is 0-based."""
+    base = _backoff_base(attempt, factor)
+    return max(0.0, base + base * jitter * (random.random() * 2 - 1))
+
+
+# name -> (dumps, loads, content_type) for dict/list bodies; binary codecs
+# only when their package is installed.
+_CODECS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any], str]] = {
+    "json": (_dumps, _loads, "application/json"),
+}
+if msgpack is not None:
+    _CODECS["msgpack"] = (msgpack.packb, msgpack.unpackb, "application/msgpack")
+if cbor2 is not None:
+    _CODECS["cbor"] = (cbor2.dumps, cbor2.loads, "application/cbor")
+_JSON_CODEC = _CODECS["json"]
+# content_type -> loads, for consumers
+_DECODERS: Dict[str, Callable[[bytes], Any]] = {ctype: loads for _, loads, ctype in _CODECS.values()}
+
+
+def _codec_for(name: str) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any], str]:
+    """Codec for ``RabbitMQConfig.serializer``, falling back to JSON if it is unavailable."""
+    codec = _CODECS.get(name)
+    if codec is None:
+        logger.warning("RabbitMQ serializer %r unavailable (package not installed?); using json", name)
+        return _JSON_CODEC
+    return codec
+
+
+def _encode_body(body: Any, dumps: Callable[[Any], bytes] = _dumps) -> bytes:
+    """Serialize a publish body: dict/list -> JSON, str -> UTF-8, bytes as-is."""
+    # exact-type checks first (bytes, the pre-serialized case, is most common);
+    # isinstance only for subclasses
+    t = type(body)
+    if t is bytes:
+        return body
+    if t is str:
+        return body.encode("utf-8")
+    if t is dict or t is list:
+        return dumps(body)
+    if t is bytearray:
+        return bytes(body)  # mutable: snapshot it
+    if isinstance(body, (dict, list)):
+        return dumps(body)
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, (bytes, bytearray)):
+        return bytes(body)
+    return str(body).encode("utf-8")
+
+
+def _build_params(cfg: RabbitMQConfig) -> "pika.ConnectionParameters":
+    """pika connection parameters for ``cfg`` (shared by the sync producer and consumer)."""
+    if cfg.url:
+        return pika.URLParameters(cfg.url)
+    creds = None
+    if cfg.username:
+        creds = pika.PlainCredentials(cfg.username, cfg.password or "")
+    params = pika.ConnectionParameters(
+        host=cfg.host,
+        port=cfg.port,
+        virtual_host=cfg.vhost,
+        credentials=creds,
+        heartbeat=cfg.heartbeat,
+        blocked_connection_timeout=cfg.connection_timeout,
+        client_properties=cfg.client_properties,
+        # ssl options not explicitly set here; advanced SSL should use pika.URLParameters with amqps://
+    )
+    return params
+
+
+def _encode_typed(body: Any, codec: Tuple[Callable[[Any], bytes], Callable[[bytes], Any], str] = _JSON_CODEC) -> Tuple[bytes, str]:
+    """Async-path body encoding: (payload, content_type) by body type."""
+    t = type(body)
+    if t is bytes:
+        return body, "application/octet-stream"
+    if t is dict or t is list or isinstance(body, (dict, list)):
+        return codec[0](body), codec[2]
+    if t is str or isinstance(body, str):
+        return body.encode("utf-8"), "text/plain"
+    return body, "application/octet-stream"
+
+
+class _AckBatcher:
+    """
+    Coalesces acks on a pika BlockingChannel into ``basic_ack(multiple=True)``:
+    one frame per ``batch_size`` deliveries or after ``max_latency`` seconds,
+    whichever comes first. Deliveries must be settled in tag order (as a
+    single consumer callback does), so "everything up to this tag" is exactly
+    what has been acked so far. Use only on the connection's own thread.
+    """
+
+    __slots__ = ("_channel", "_conn", "_batch_size", "_max_latency", "_tag", "_count", "_timer")
+
+    def __init__(self, channel: Any, conn: Any, batch_size: int, max_latency: float):
+        self._channel = channel
+        self._conn = conn
+        self._batch_size = max(1, batch_size)
+        self._max_latency = max_latency
+        self._tag = 0
+        self._count = 0
+        self._timer = None
+
+    def ack(self, delivery_tag: int) -> None:
+        self._tag = delivery_tag
+        self._count += 1
+        if self._count >= self._batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = self._conn.call_later(self._max_latency, self._on_timer)
+
+    def nack(self, delivery_tag: int, requeue: bool) -> None:
+        # settle earlier acks first so the nack stays exactly this delivery
+        self.flush()
+        self._channel.basic_nack(delivery_tag=delivery_tag, requeue=requeue)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self.flush()
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._conn.remove_timeout(self._timer)
+            self._timer = None
+        if self._count:
+            self._channel.basic_ack(delivery_tag=self._tag, multiple=True)
+            self._count = 0
+
+
+class _ChannelPool:
+    """
+    Fixed set of aio_pika channels on one connection, handed out round-robin.
+    Channels are shared, not checked out: aiormq only serializes the frame
+    write, so any number of publishers can await confirms on one channel and
+    the pool just spreads that traffic (and its frame lock) N ways.
+    """
+
+    def __init__(self, channels: List[Any]):
+        self.channels = channels
+        self._next = 0
+
+    def next(self) -> Any:
+        ch = self.channels[self._next % len(self.channels)]
+        self._next += 1
+        return ch
 
 
 def _default_metrics_hook(event: str, payload: Dict[str, Any]) -> None:  # pragma: no cover - trivial
@@ -195,27 +436,39 @@ class SyncRabbitMQProducer:
             raise RabbitMQConnectionError("pika is required for SyncRabbitMQProducer. Install pika.")
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
+        # per-message events are skipped (no payload dict) unless a hook is
+        # configured or DEBUG logging would show the default hook's output
+        self._metrics_enabled = cfg.metrics_hook is not None or logger.isEnabledFor(logging.DEBUG)
         self._conn: Optional[BlockingConnection] = None
         self._channel: Optional[pika.channel.Channel] = None
+        # tx-mode channel for publish_batch (a channel is either confirm or tx)
+        self._tx_channel: Optional[pika.channel.Channel] = None
+        # (content_type, durable) -> shared BasicProperties; see _props()
+        self._props_cache: Dict[Tuple[str, bool], Any] = {}
+        # (exchange, type, durable) declared on the current channel
+        self._declared_exchanges: set = set()
+        self._codec = _codec_for(cfg.serializer)
         self._ensure_connection()
 
-    def _build_params(self) -> pika.ConnectionParameters:
-        if self.cfg.url:
-            return pika.URLParameters(self.cfg.url)
-        creds = None
-        if self.cfg.username:
-            creds = pika.PlainCredentials(self.cfg.username, self.cfg.password or "")
-        params = pika.ConnectionParameters(
-            host=self.cfg.host,
-            port=self.cfg.port,
-            virtual_host=self.cfg.vhost,
-            credentials=creds,
-            heartbeat=self.cfg.heartbeat,
-            blocked_connection_timeout=self.cfg.connection_timeout,
-            client_properties=self.cfg.client_properties,
-            # ssl options not explicitly set here; advanced SSL should use pika.URLParameters with amqps://
-        )
-        return params
+    def _props(self, content_type: str, durable: bool, properties: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        BasicProperties for a publish. The plain (content_type, durable)
+        variants are built once and shared (pika only reads them when
+        encoding); per-message headers/message_id go on a copy.
+        """
+        key = (content_type, durable)
+        props = self._props_cache.get(key)
+        if props is None:
+            props = self._props_cache[key] = pika.BasicProperties(content_type=content_type, delivery_mode=2 if durable else 1)
+        if properties and ("headers" in properties or "message_id" in properties):
+            props = copy.copy(props)
+            # merge known fields
+            if "headers" in properties:
+                props.headers = properties["headers"]
+            if "message_id" in properties:
+                props.message_id = properties["message_id"]
+            # other properties can be set by callers modifying BasicProperties directly if needed
+        return props
 
     def _ensure_connection(self):
         last_exc = None
@@ -223,9 +476,10 @@ class SyncRabbitMQProducer:
             try:
                 if self._conn and self._conn.is_open:
                     return
-                params = self._build_params()
+                params = _build_params(self.cfg)
                 self._conn = pika.BlockingConnection(params)
                 self._channel = self._conn.channel()
+                self._declared_exchanges.clear()
                 # enable publisher confirms for stronger guarantees
                 try:
                     self._channel.confirm_delivery()
@@ -247,7 +501,7 @@ class SyncRabbitMQProducer:
         exchange: str,
         routing_key: str,
         body: Union[str, bytes, Dict[str, Any]],
-        content_type: str = "application/json",
+        content_type: Optional[str] = None,
         durable: bool = True,
         mandatory: bool = False,
         properties: Optional[Dict[str, Any]] = None,
@@ -258,37 +512,25 @@ class SyncRabbitMQProducer:
         """
         Publish a message.
 
-        - body may be bytes, str or dict (dict will be JSON-serialized).
+        - body may be bytes, str or dict (dict is serialized with cfg.serializer, JSON by default).
+        - content_type defaults to the serializer's type for dict/list bodies, else application/json.
         - properties is a dict of pika.BasicProperties-like fields (headers, message_id, etc).
         - declare_exchange: if True, declare the exchange before publishing.
         """
         if self._channel is None or self._conn is None or self._conn.is_closed:
             self._ensure_connection()
-        props = pika.BasicProperties(content_type=content_type, delivery_mode=2 if durable else 1)
-        if properties:
-            # merge known fields
-            if "headers" in properties:
-                props.headers = properties["headers"]
-            if "message_id" in properties:
-                props.message_id = properties["message_id"]
-            # other properties can be set by callers modifying BasicProperties directly if needed
-        payload: Union[bytes, str]
-        if isinstance(body, (dict, list)):
-            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
-            content_type = "application/json"
-        elif isinstance(body, str):
-            payload = body.encode("utf-8")
-        elif isinstance(body, (bytes, bytearray)):
-            payload = bytes(body)
-        else:
-            payload = str(body).encode("utf-8")
+        if content_type is None:
+            content_type = self._codec[2] if isinstance(body, (dict, list)) else "application/json"
+        props = self._props(content_type, durable, properties)
+        payload = _encode_body(body, self._codec[0])
 
         last_exc = None
         for attempt in range(self.cfg.max_retries + 1):
             try:
-                if declare_exchange:
-                    # declare durable exchange to avoid accidental loss
+                if declare_exchange and (exchange, exchange_type, durable) not in self._declared_exchanges:
+                    # declare durable exchange to avoid accidental loss; once per channel
                     self._channel.exchange_declare(exchange=exchange, exchange_type=exchange_type, durable=durable)
+                    self._declared_exchanges.add((exchange, exchange_type, durable))
                 # publish with mandatory flag to get returned messages if unroutable (if broker supports it)
                 ok = self._channel.basic_publish(
                     exchange=exchange,
@@ -298,11 +540,14 @@ class SyncRabbitMQProducer:
                     mandatory=mandatory
                 )
                 # basic_publish returns True/False depending on confirms if enabled
-                self.metrics("publish_success", {"exchange": exchange, "routing_key": routing_key})
-                logger.debug("Published message exchange=%s routing_key=%s len=%d", exchange, routing_key, len(payload))
+                if self._metrics_enabled:
+                    self.metrics("publish_success", {"exchange": exchange, "routing_key": routing_key})
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Published message exchange=%s routing_key=%s len=%d", exchange, routing_key, len(payload))
                 return
             except (PikaConnectionError, ChannelClosedByBroker, socket.error) as exc:
                 last_exc = exc
+                self._declared_exchanges.clear()
                 # reconnect and retry
                 logger.warning("Publish attempt %d failed: %s", attempt + 1, exc)
                 self.metrics("publish_retry", {"attempt": attempt + 1, "error": str(exc)})
@@ -322,8 +567,92 @@ class SyncRabbitMQProducer:
                 break
         raise RabbitMQPublishError(f"Failed to publish message after retries: {last_exc!s}")
 
+    def publish_batch(
+        self,
+        exchange: str,
+        messages: Iterable[Tuple[str, Union[str, bytes, Dict[str, Any]]]],
+        content_type: Optional[str] = None,
+        durable: bool = True,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Publish ``(routing_key, body)`` pairs to ``exchange`` with one broker
+        round trip per ``batch_size`` messages. Returns the number published.
+
+        ``publish`` waits for a publisher confirm per message. Here each
+        chunk is published back-to-back on a separate tx-mode channel and
+        settled by a single ``tx_commit``; a chunk interrupted by a
+        connection error is discarded by the broker and retried whole.
+        Bodies are encoded as in ``publish``, once per chunk (retries resend
+        the same bytes) and once per distinct body object, so fanning one
+        dict out to many routing keys serializes it once. Without
+        ``content_type`` each message is labelled by body type as in
+        ``publish``; messages with the same label share one BasicProperties.
+        """
+        dumps = self._codec[0]
+        it = iter(messages)
+        total = 0
+        while True:
+            # id(body) -> (body, payload, props); holding body keeps the id from being reused
+            encoded: Dict[int, Tuple[Any, bytes, Any]] = {}
+            chunk = []
+            for routing_key, body in islice(it, batch_size):
+                hit = encoded.get(id(body))
+                if hit is None:
+                    ctype = content_type
+                    if ctype is None:
+                        ctype = self._codec[2] if isinstance(body, (dict, list)) else "application/json"
+                    hit = encoded[id(body)] = (body, _encode_body(body, dumps), self._props(ctype, durable))
+                chunk.append((routing_key, hit[1], hit[2]))
+            if not chunk:
+                return total
+            self._publish_chunk(exchange, chunk)
+            total += len(chunk)
+
+    def _publish_chunk(self, exchange: str, chunk: List[Tuple[str, bytes, Any]]) -> None:
+        last_exc = None
+        for attempt in range(self.cfg.max_retries + 1):
+            try:
+                if self._conn is None or self._conn.is_closed:
+                    self._ensure_connection()
+                if self._tx_channel is None or not self._tx_channel.is_open:
+                    self._tx_channel = self._conn.channel()
+                    self._tx_channel.tx_select()
+                publish = self._tx_channel.basic_publish
+                for routing_key, payload, props in chunk:
+                    publish(exchange=exchange, routing_key=routing_key, body=payload, properties=props)
+                self._tx_channel.tx_commit()
+                if self._metrics_enabled:
+                    self.metrics("publish_batch_success", {"exchange": exchange, "count": len(chunk)})
+                return
+            except (PikaConnectionError, ChannelClosedByBroker, socket.error) as exc:
+                last_exc = exc
+                self._tx_channel = None
+                logger.warning("Batch publish attempt %d failed: %s", attempt + 1, exc)
+                self.metrics("publish_retry", {"attempt": attempt + 1, "error": str(exc)})
+                if attempt < self.cfg.max_retries:
+                    time.sleep(_compute_backoff(attempt, self.cfg.backoff_factor))
+                    continue
+                break
+            except Exception as exc:
+                last_exc = exc
+                logger.exception("Unexpected error during batch publish")
+                # don't let a later tx_commit pick up this chunk's partial publishes
+                try:
+                    self._tx_channel.tx_rollback()
+                except Exception:
+                    self._tx_channel = None
+                break
+        raise RabbitMQPublishError(f"Failed to publish batch of {len(chunk)} after retries: {last_exc!s}")
+
     def close(self):
         try:
+            if self._tx_channel:
+                try:
+                    if self._tx_channel.is_open:
+                        self._tx_channel.close()
+                except Exception:
+                    pass
             if self._channel:
                 try:
                     if self._channel.is_open:
@@ -366,6 +695,7 @@ class SyncRabbitMQConsumer:
             raise RabbitMQConnectionError("pika is required for SyncRabbitMQConsumer. Install pika.")
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
+        self._metrics_enabled = cfg.metrics_hook is not None or logger.isEnabledFor(logging.DEBUG)
         self._conn: Optional[BlockingConnection] = None
         self._channel: Optional[pika.channel.Channel] = None
         self._ensure_connection()
@@ -376,12 +706,12 @@ class SyncRabbitMQConsumer:
             try:
                 if self._conn and self._conn.is_open:
                     return
-                params = SyncRabbitMQProducer(self.cfg)._build_params()
+                params = _build_params(self.cfg)
                 self._conn = pika.BlockingConnection(params)
                 self._channel = self._conn.channel()
                 # set QoS
                 try:
-                    self._channel.basic_qos(prefetch_count=self.cfg.prefetch_count)
+                    self._channel.basic_qos(prefetch_count=self.cfg.prefetch_count, global_qos=self.cfg.global_qos)
                 except Exception:
                     logger.debug("Failed to set prefetch; continuing")
                 logger.info("Connected to RabbitMQ (sync consumer)")
@@ -402,12 +732,25 @@ class SyncRabbitMQConsumer:
         consumer_tag: Optional[str] = None,
         durable: bool = True,
         requeue_on_error: bool = True,
+        prefetch_count: Optional[int] = None,
     ) -> None:
         """
         Start consuming and block until interruption. on_message should return True to ack, False to nack.
+        prefetch_count overrides cfg.prefetch_count for this consumer.
+
+        Acks are coalesced into one ``multiple=True`` ack per
+        ``cfg.ack_batch_size`` messages (or ``cfg.ack_max_latency_ms``);
+        a nack first flushes the pending acks. With batching on, the
+        default prefetch is ``cfg.consumer_prefetch(ack_batch_size)``.
         """
         if self._channel is None:
             self._ensure_connection()
+        batch = 1 if auto_ack else self.cfg.ack_batch_size
+        if prefetch_count is None and batch > 1:
+            prefetch_count = self.cfg.consumer_prefetch(batch)
+        if prefetch_count is not None:
+            self._channel.basic_qos(prefetch_count=prefetch_count, global_qos=self.cfg.global_qos)
+        acker = _AckBatcher(self._channel, self._conn, batch, self.cfg.ack_max_latency_ms / 1000.0)
         # declare queue optionally durable
         try:
             self._channel.queue_declare(queue=queue, durable=durable)
@@ -416,20 +759,23 @@ class SyncRabbitMQConsumer:
 
         def _callback(ch, method, properties, body):
             try:
-                self.metrics("message_received", {"queue": queue, "delivery_tag": getattr(method, "delivery_tag", None)})
+                if self._metrics_enabled:
+                    self.metrics("message_received", {"queue": queue, "delivery_tag": getattr(method, "delivery_tag", None)})
                 ok = on_message(body, properties, method)
                 if not auto_ack:
                     if ok:
-                        ch.basic_ack(delivery_tag=method.delivery_tag)
-                        self.metrics("message_ack", {"queue": queue, "delivery_tag": method.delivery_tag})
+                        acker.ack(method.delivery_tag)
+                        if self._metrics_enabled:
+                            self.metrics("message_ack", {"queue": queue, "delivery_tag": method.delivery_tag})
                     else:
-                        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=requeue_on_error)
-                        self.metrics("message_nack", {"queue": queue, "delivery_tag": method.delivery_tag})
+                        acker.nack(method.delivery_tag, requeue_on_error)
+                        if self._metrics_enabled:
+                            self.metrics("message_nack", {"queue": queue, "delivery_tag": method.delivery_tag})
             except Exception as exc:
                 logger.exception("Exception in on_message handler")
                 self.metrics("consumer_handler_error", {"error": str(exc)})
                 if not auto_ack:
-                    ch.basic_nack(delivery_tag=method.delivery_tag, requeue=requeue_on_error)
+                    acker.nack(method.delivery_tag, requeue_on_error)
 
         try:
             self._channel.basic_consume(queue=queue, on_message_callback=_callback, auto_ack=auto_ack, consumer_tag=consumer_tag)
@@ -441,6 +787,13 @@ class SyncRabbitMQConsumer:
         except Exception as exc:
             logger.exception("Consumer loop error")
             raise RabbitMQConsumeError(str(exc))
+        finally:
+            # don't leave handled messages unacked (and redelivered) on stop
+            if self._channel is not None and self._channel.is_open:
+                try:
+                    acker.flush()
+                except Exception:
+                    logger.debug("Final ack flush failed", exc_info=True)
 
     def stop(self):
         try:
@@ -470,6 +823,132 @@ class SyncRabbitMQConsumer:
             logger.exception("Error closing consumer connection")
 
 
+class ThreadedSyncRabbitMQConsumer(SyncRabbitMQConsumer):
+    """
+    SyncRabbitMQConsumer that runs ``on_message`` on ``workers`` threads.
+
+    The calling thread owns the connection (pika is not thread-safe): its
+    consumer callback hands each delivery to a thread pool, and between
+    ``process_data_events`` calls it settles finished ones. Completions arrive out of order, so
+    acks go out in delivery order up to the oldest unfinished message,
+    coalesced into ``multiple=True`` acks like the plain consumer; a slow
+    message delays later acks but not their processing. Use for CPU- or
+    I/O-heavy handlers where one callback thread caps throughput.
+
+    Usage:
+        c = ThreadedSyncRabbitMQConsumer(cfg, workers=8)
+        c.consume(queue="my-queue", on_message=handler)   # blocks; c.stop() from another thread
+    """
+
+    def __init__(self, cfg: RabbitMQConfig, workers: int = 4):
+        self.workers = max(1, workers)
+        self._stopping = threading.Event()
+        super().__init__(cfg)
+
+    def consume(
+        self,
+        queue: str,
+        on_message: Callable[[bytes, pika.spec.BasicProperties, pika.spec.Basic.Deliver], bool],
+        auto_ack: bool = False,
+        consumer_tag: Optional[str] = None,
+        durable: bool = True,
+        requeue_on_error: bool = True,
+        prefetch_count: Optional[int] = None,
+        inactivity_timeout: float = 0.1,
+    ) -> None:
+        """
+        Consume until ``stop()`` (or KeyboardInterrupt). on_message returns
+        True to ack, False (or raises) to nack. The default prefetch keeps
+        every worker busy with a full ack batch in flight; ``inactivity_timeout``
+        is how often the loop wakes to settle finished messages and check
+        ``stop()``. On stop the consumer is cancelled and in-flight handlers
+        are drained while the connection keeps servicing heartbeats.
+        """
+        if auto_ack:
+            # prefetch only bounds unacked deliveries, so auto-ack would queue
+            # the whole backlog into the executor
+            raise ValueError("ThreadedSyncRabbitMQConsumer requires auto_ack=False; use SyncRabbitMQConsumer for auto-ack")
+        if self._channel is None:
+            self._ensure_connection()
+        self._stopping.clear()
+        if prefetch_count is None:
+            prefetch_count = self.cfg.consumer_prefetch(max(self.cfg.ack_batch_size, self.workers))
+        self._channel.basic_qos(prefetch_count=prefetch_count, global_qos=self.cfg.global_qos)
+        try:
+            self._channel.queue_declare(queue=queue, durable=durable)
+        except Exception:
+            logger.debug("Queue declare failed or not necessary")
+
+        acker = _AckBatcher(self._channel, self._conn, self.cfg.ack_batch_size, self.cfg.ack_max_latency_ms / 1000.0)
+        completed: SimpleQueue = SimpleQueue()  # (delivery_tag, ok) from worker threads
+        in_flight: deque = deque()  # delivery tags, oldest first
+        results: Dict[int, bool] = {}
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="omniflow-rabbitmq")
+
+        def _run(body, properties, method) -> bool:
+            try:
+                return bool(on_message(body, properties, method))
+            except Exception as exc:
+                logger.exception("Exception in on_message handler")
+                self.metrics("consumer_handler_error", {"error": str(exc)})
+                return False
+
+        def _callback(ch, method, properties, body):
+            tag = method.delivery_tag
+            if self._metrics_enabled:
+                self.metrics("message_received", {"queue": queue, "delivery_tag": tag})
+            in_flight.append(tag)
+            fut = executor.submit(_run, body, properties, method)
+            fut.add_done_callback(lambda f, tag=tag: completed.put((tag, f.result())))
+
+        def _settle() -> None:
+            while True:
+                try:
+                    tag, ok = completed.get_nowait()
+                except Empty:
+                    break
+                results[tag] = ok
+            while in_flight and in_flight[0] in results:
+                tag = in_flight.popleft()
+                if results.pop(tag):
+                    acker.ack(tag)
+                else:
+                    acker.nack(tag, requeue_on_error)
+
+        ctag = None
+        try:
+            ctag = self._channel.basic_consume(queue=queue, on_message_callback=_callback, consumer_tag=consumer_tag)
+            logger.info("Starting threaded consumer on queue=%s workers=%d", queue, self.workers)
+            while not self._stopping.is_set():
+                self._conn.process_data_events(time_limit=inactivity_timeout)
+                _settle()
+        except KeyboardInterrupt:
+            logger.info("Consumer interrupted by KeyboardInterrupt")
+        except Exception as exc:
+            logger.exception("Consumer loop error")
+            raise RabbitMQConsumeError(str(exc))
+        finally:
+            try:
+                if self._channel is not None and self._channel.is_open:
+                    # stop deliveries (undispatched ones are nacked back by
+                    # pika), then let running handlers finish and settle
+                    # them, pumping I/O meanwhile so heartbeats still go out
+                    if ctag is not None:
+                        self._channel.basic_cancel(ctag)
+                    while in_flight:
+                        self._conn.process_data_events(time_limit=inactivity_timeout)
+                        _settle()
+                    acker.flush()
+            except Exception:
+                logger.debug("Final settle/cancel failed", exc_info=True)
+            finally:
+                executor.shutdown(wait=True)
+
+    def stop(self):
+        """Ask ``consume()`` to return (after draining in-flight handlers); safe from any thread."""
+        self._stopping.set()
+
+
 # ---- Async Producer & Consumer using aio_pika ----
 class AsyncRabbitMQProducer:
     """
@@ -486,12 +965,19 @@ class AsyncRabbitMQProducer:
     def __init__(self, cfg: RabbitMQConfig):
         if aio_pika is None:
             raise RabbitMQConnectionError("aio_pika is required for AsyncRabbitMQProducer. Install aio-pika.")
+        if cfg.use_uvloop:
+            use_uvloop()
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
+        self._metrics_enabled = cfg.metrics_hook is not None or logger.isEnabledFor(logging.DEBUG)
         self._conn: Optional[aio_pika.RobustConnection] = None
         self._channel: Optional[aio_pika.RobustChannel] = None
+        self._pool: Optional[_ChannelPool] = None
         self._lock = asyncio.Lock()
         self._connected = False
+        # (id(channel), name, type, durable) -> declared aio_pika.Exchange
+        self._exchange_cache: Dict[Tuple[int, str, str, bool], Any] = {}
+        self._codec = _codec_for(cfg.serializer)
 
     async def connect(self):
         async with self._lock:
@@ -514,8 +1000,11 @@ class AsyncRabbitMQProducer:
                             virtualhost=self.cfg.vhost,
                             timeout=self.cfg.connection_timeout,
                         )
-                    self._channel = await self._conn.channel()
-                    await self._channel.set_qos(prefetch_count=self.cfg.prefetch_count)
+                    channels = await asyncio.gather(*(self._conn.channel() for _ in range(max(1, self.cfg.channel_pool_size))))
+                    await asyncio.gather(*(ch.set_qos(prefetch_count=self.cfg.prefetch_count) for ch in channels))
+                    self._pool = _ChannelPool(list(channels))
+                    self._channel = channels[0]
+                    self._exchange_cache = {}
                     self._connected = True
                     logger.info("Connected to RabbitMQ (async)")
                     return
@@ -532,7 +1021,7 @@ class AsyncRabbitMQProducer:
         exchange: str,
         routing_key: str,
         body: Union[str, bytes, Dict[str, Any]],
-        exchange_type: Union[str, aio_pika.ExchangeType] = aio_pika.ExchangeType.DIRECT,
+        exchange_type: Union[str, aio_pika.ExchangeType] = "direct",
         durable: bool = True,
         mandatory: bool = False,
         properties: Optional[Dict[str, Any]] = None,
@@ -542,15 +1031,7 @@ class AsyncRabbitMQProducer:
         if self._channel is None:
             raise RabbitMQConnectionError("Channel not available")
         # Serialize payload
-        if isinstance(body, (dict, list)):
-            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
-            content_type = "application/json"
-        elif isinstance(body, str):
-            payload = body.encode("utf-8")
-            content_type = "text/plain"
-        else:
-            payload = body
-            content_type = "application/octet-stream"
+        payload, content_type = _encode_typed(body, self._codec)
         # properties -> aio_pika.Message
         msg_props = {}
         if properties:
@@ -559,14 +1040,18 @@ class AsyncRabbitMQProducer:
         last_exc = None
         for attempt in range(self.cfg.max_retries + 1):
             try:
-                exch = await self._channel.declare_exchange(name=exchange, type=exchange_type, durable=durable)
+                exch = await self._exchange(exchange, exchange_type, durable, self._pool.next())
                 message = aio_pika.Message(body=payload, content_type=content_type, delivery_mode=aio_pika.DeliveryMode.PERSISTENT if durable else aio_pika.DeliveryMode.NOT_PERSISTENT, headers=msg_props.get("headers"))
                 await exch.publish(message, routing_key=routing_key, mandatory=mandatory)
-                self.metrics("publish_success", {"exchange": exchange, "routing_key": routing_key})
-                logger.debug("Async published exchange=%s routing_key=%s len=%d", exchange, routing_key, len(payload))
+                if self._metrics_enabled:
+                    self.metrics("publish_success", {"exchange": exchange, "routing_key": routing_key})
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Async published exchange=%s routing_key=%s len=%d", exchange, routing_key, len(payload))
                 return
             except Exception as exc:
                 last_exc = exc
+                # a failed channel may have lost its declarations; redeclare on retry
+                self._exchange_cache.clear()
                 self.metrics("publish_retry", {"attempt": attempt + 1, "error": str(exc)})
                 logger.warning("Async publish attempt %d failed: %s", attempt + 1, exc)
                 # attempt reconnect on connection errors
@@ -580,15 +1065,96 @@ class AsyncRabbitMQProducer:
                 break
         raise RabbitMQPublishError(f"Async publish failed after retries: {last_exc!s}")
 
+    async def _exchange(self, name: str, exchange_type: Any, durable: bool, channel: Any) -> Any:
+        """Declared exchange for (name, type, durable) on ``channel``; declared once per channel."""
+        key = (id(channel), name, getattr(exchange_type, "value", exchange_type), durable)
+        exch = self._exchange_cache.get(key)
+        if exch is None:
+            exch = self._exchange_cache[key] = await channel.declare_exchange(name=name, type=exchange_type, durable=durable)
+        return exch
+
+    async def publish_many(
+        self,
+        items: Iterable[Tuple[str, str, Union[str, bytes, Dict[str, Any]]]],
+        exchange_type: Any = "direct",
+        durable: bool = True,
+        mandatory: bool = False,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """
+        Publish ``(exchange, routing_key, body)`` items concurrently and wait
+        once for all broker confirms, instead of one confirm round trip per
+        message as with ``publish``. Items are spread round-robin over the
+        channel pool; each exchange is declared once per channel and each
+        distinct body object encoded once. Returns the number published;
+        raises RabbitMQPublishError if any publish failed (the others are
+        not rolled back) or ``timeout`` expired.
+        """
+        if not self._connected:
+            await self.connect()
+        if self._channel is None:
+            raise RabbitMQConnectionError("Channel not available")
+        delivery_mode = aio_pika.DeliveryMode.PERSISTENT if durable else aio_pika.DeliveryMode.NOT_PERSISTENT
+        # id(body) -> (body, Message); holding body keeps the id from being reused
+        messages: Dict[int, Tuple[Any, Any]] = {}
+        pending = []
+        try:
+            for exchange, routing_key, body in items:
+                hit = messages.get(id(body))
+                if hit is None:
+                    payload, content_type = _encode_typed(body, self._codec)
+                    hit = messages[id(body)] = (body, aio_pika.Message(body=payload, content_type=content_type, delivery_mode=delivery_mode))
+                exch = await self._exchange(exchange, exchange_type, durable, self._pool.next())
+                pending.append(exch.publish(hit[1], routing_key=routing_key, mandatory=mandatory))
+        except BaseException:
+            for coro in pending:
+                coro.close()
+            raise
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), timeout)
+        except asyncio.TimeoutError as exc:
+            raise RabbitMQPublishError(f"publish_many timed out after {timeout}s") from exc
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures:
+            self.metrics("publish_many_error", {"failed": len(failures), "total": len(results)})
+            raise RabbitMQPublishError(f"{len(failures)}/{len(results)} publishes failed: {failures[0]!s}")
+        if self._metrics_enabled:
+            self.metrics("publish_many_success", {"count": len(results)})
+        return len(results)
+
+    async def broadcast(
+        self,
+        exchange: str,
+        routing_keys: Iterable[str],
+        body: Union[str, bytes, Dict[str, Any]],
+        exchange_type: Any = "direct",
+        durable: bool = True,
+        mandatory: bool = False,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """
+        Publish one body to many routing keys of ``exchange``: the body is
+        encoded and wrapped in a single aio_pika.Message, and the publishes
+        run concurrently (see ``publish_many``). Returns the number published.
+        """
+        return await self.publish_many(
+            ((exchange, routing_key, body) for routing_key in routing_keys),
+            exchange_type=exchange_type,
+            durable=durable,
+            mandatory=mandatory,
+            timeout=timeout,
+        )
+
     async def close(self):
         try:
-            if self._channel:
-                await self._channel.close()
+            if self._pool:
+                await asyncio.gather(*(ch.close() for ch in self._pool.channels))
             if self._conn:
                 await self._conn.close()
         except Exception:
             logger.exception("Error closing async connection")
         finally:
+            self._pool = None
             self._connected = False
 
     # async context manager
@@ -617,8 +1183,11 @@ class AsyncRabbitMQConsumer:
     def __init__(self, cfg: RabbitMQConfig):
         if aio_pika is None:
             raise RabbitMQConnectionError("aio_pika is required for AsyncRabbitMQConsumer. Install aio-pika.")
+        if cfg.use_uvloop:
+            use_uvloop()
         self.cfg = cfg
         self.metrics = cfg.metrics_hook or _default_metrics_hook
+        self._metrics_enabled = cfg.metrics_hook is not None or logger.isEnabledFor(logging.DEBUG)
         self._conn: Optional[aio_pika.RobustConnection] = None
         self._channel: Optional[aio_pika.RobustChannel] = None
         self._connected = False
@@ -642,7 +1211,7 @@ class AsyncRabbitMQConsumer:
                         timeout=self.cfg.connection_timeout,
                     )
                 self._channel = await self._conn.channel()
-                await self._channel.set_qos(prefetch_count=self.cfg.prefetch_count)
+                await self._channel.set_qos(prefetch_count=self.cfg.prefetch_count, global_=self.cfg.global_qos)
                 self._connected = True
                 logger.info("Connected to RabbitMQ (async consumer)")
                 return
@@ -669,7 +1238,7 @@ class AsyncRabbitMQConsumer:
         await self.connect()
         assert self._channel is not None
         if prefetch_count is not None:
-            await self._channel.set_qos(prefetch_count=prefetch_count)
+            await self._channel.set_qos(prefetch_count=prefetch_count, global_=self.cfg.global_qos)
         queue_obj = await self._channel.declare_queue(name=queue, durable=durable)
 
         async def _handler(message: aio_pika.IncomingMessage):
@@ -677,16 +1246,18 @@ class AsyncRabbitMQConsumer:
                 try:
                     body = message.body
                     content_type = message.content_type or ""
-                    if content_type.startswith("application/json"):
+                    decoder = _DECODERS.get(content_type.split(";", 1)[0].strip())
+                    if decoder is not None:
                         try:
-                            decoded = json.loads(body.decode("utf-8"))
+                            decoded = decoder(body)
                         except Exception:
                             decoded = body.decode("utf-8", errors="ignore")
                     elif content_type.startswith("text/"):
                         decoded = body.decode("utf-8", errors="ignore")
                     else:
                         decoded = body
-                    self.metrics("message_received", {"queue": queue, "delivery_tag": message.delivery_tag})
+                    if self._metrics_enabled:
+                        self.metrics("message_received", {"queue": queue, "delivery_tag": message.delivery_tag})
                     # call user handler
                     res = await on_message(decoded, message)
                     # handler may choose to ack/nack; if it doesn't and auto_ack is False, message.process() context will ack automatically.